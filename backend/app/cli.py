@@ -0,0 +1,256 @@
+# backend/app/cli.py
+"""
+Maintenance commands.
+
+Run from backend/:
+    python -m app.cli bootstrap [--seed]
+    python -m app.cli rebuild-aggregates
+    python -m app.cli import-employees people.csv
+    python -m app.cli seed --employees 10000 --days 100
+    ATTENDANCE_HOT_DAYS=365 python -m app.cli archive-attendance [--before 2024-01-01]
+    python -m app.cli compact
+    python -m app.cli snapshot-attendance
+    python -m app.cli verify-history
+    python -m app.cli events-broker --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+
+from app.core.database import SessionLocal
+from app.core.aggregates import rebuild_daily_aggregates
+from app.core.bootstrap import bootstrap, create_schema
+from app.core.event_log import backfill_event_log, log_drift, prune_snapshots, take_snapshot
+from app.core.imports import import_employee_file
+from app.core.live import run_broker
+from app.core.maintenance import compact_database
+from app.core.partitions import archive_attendance, hot_cutoff
+from app.core.seed_data import (
+    seed_employees,
+    seed_attendance,
+    TOTAL_EMPLOYEES,
+    DEFAULT_SEED,
+    BATCH_SIZE,
+)
+
+
+# ----------------------------
+# Commands
+# ----------------------------
+def cmd_bootstrap(args):
+    bootstrap(seed=args.seed)
+    print("Schema is up to date" + (", demo data seeded" if args.seed else ""))
+
+
+def cmd_rebuild_aggregates(args):
+    create_schema()
+
+    db = SessionLocal()
+    try:
+        rows = rebuild_daily_aggregates(db)
+    finally:
+        db.close()
+
+    print(f"Rebuilt attendance_daily: {rows} rows")
+
+
+def cmd_import_employees(args):
+    create_schema()
+
+    db = SessionLocal()
+    try:
+        report = import_employee_file(db, args.path, args.format)
+    finally:
+        db.close()
+
+    print(json.dumps(report, indent=2))
+
+
+def cmd_seed(args):
+    create_schema()
+
+    db = SessionLocal()
+    try:
+        backfill_event_log(db)
+        started = time.perf_counter()
+        employees = seed_employees(db, total=args.employees, seed=args.seed, batch_size=args.batch_size)
+        records = seed_attendance(db, days=args.days, seed=args.seed, batch_size=args.batch_size)
+        aggregates = rebuild_daily_aggregates(db)
+        take_snapshot(db)
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    print(
+        f"Inserted {employees} employees and {records} attendance rows "
+        f"({aggregates} aggregate rows) in {elapsed:.2f}s"
+    )
+
+
+def cmd_archive_attendance(args):
+    create_schema()
+
+    # Reads only look in the archive for dates before the hot cutoff
+    cutoff = hot_cutoff()
+    if cutoff is None:
+        raise SystemExit("Set ATTENDANCE_HOT_DAYS to archive attendance")
+
+    before = args.before or cutoff
+    if before > cutoff:
+        raise SystemExit(f"--before cannot be later than the hot cutoff ({cutoff})")
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        moved = archive_attendance(db, before)
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    print(f"Archived {moved} attendance rows before {before} in {elapsed:.2f}s")
+
+
+def cmd_compact(args):
+    create_schema()
+
+    started = time.perf_counter()
+    report = compact_database()
+    elapsed = time.perf_counter() - started
+
+    for table, rows in report["rows_deleted"].items():
+        print(f"Deleted {rows} orphaned rows from {table}")
+    print(
+        f"Database {report['bytes_before']:,} → {report['bytes_after']:,} bytes, "
+        f"{report['bytes_freed']:,} bytes freed in {elapsed:.2f}s"
+    )
+
+
+def cmd_snapshot_attendance(args):
+    create_schema()
+
+    db = SessionLocal()
+    try:
+        backfill_event_log(db)
+        started = time.perf_counter()
+        snapshot = take_snapshot(db)
+        elapsed = time.perf_counter() - started
+        pruned = prune_snapshots(db)
+    finally:
+        db.close()
+
+    if snapshot is None:
+        print("No new attendance events since the last snapshot")
+    else:
+        print(
+            f"Snapshot {snapshot.id} folds {snapshot.events} events "
+            f"(log up to #{snapshot.upto_seq}) in {elapsed:.2f}s"
+        )
+    if pruned:
+        print(f"Pruned {pruned} snapshots outside SNAPSHOT_KEEP_*")
+
+
+def cmd_verify_history(args):
+    create_schema()
+
+    db = SessionLocal()
+    try:
+        drift = log_drift(db)
+    finally:
+        db.close()
+
+    if drift:
+        raise SystemExit(f"{drift} employee-years differ between the event log and attendance")
+    print("attendance matches the event log")
+
+
+def cmd_events_broker(args):
+    print(f"Relaying live dashboard events on tcp://{args.host}:{args.port}")
+    try:
+        asyncio.run(run_broker(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+# ----------------------------
+# Entry point
+# ----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="HRMS maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    setup = commands.add_parser(
+        "bootstrap",
+        help="Create or upgrade the schema (tables, search index, aggregates)",
+    )
+    setup.add_argument("--seed", action="store_true", help="also load demo data")
+    setup.set_defaults(func=cmd_bootstrap)
+
+    rebuild = commands.add_parser(
+        "rebuild-aggregates",
+        help="Recompute the daily attendance aggregates from the attendance table",
+    )
+    rebuild.set_defaults(func=cmd_rebuild_aggregates)
+
+    importer = commands.add_parser(
+        "import-employees",
+        help="Bulk import employees from a CSV or NDJSON file",
+    )
+    importer.add_argument("path")
+    importer.add_argument("--format", choices=["csv", "ndjson"], default=None)
+    importer.set_defaults(func=cmd_import_employees)
+
+    seed = commands.add_parser(
+        "seed",
+        help="Generate deterministic employees and attendance history",
+    )
+    seed.add_argument("--employees", type=int, default=TOTAL_EMPLOYEES)
+    seed.add_argument("--days", type=int, default=30, help="days of history before today")
+    seed.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    seed.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    seed.set_defaults(func=cmd_seed)
+
+    archive = commands.add_parser(
+        "archive-attendance",
+        help="Move attendance older than ATTENDANCE_HOT_DAYS into attendance_archive",
+    )
+    archive.add_argument(
+        "--before", type=date.fromisoformat, default=None,
+        help="archive less than the hot cutoff allows (default: the cutoff)",
+    )
+    archive.set_defaults(func=cmd_archive_attendance)
+
+    compact = commands.add_parser(
+        "compact",
+        help="Delete orphaned attendance rows and VACUUM, reporting what was freed",
+    )
+    compact.set_defaults(func=cmd_compact)
+
+    snapshot = commands.add_parser(
+        "snapshot-attendance",
+        help="Fold new attendance events into a snapshot and prune old ones (run periodically)",
+    )
+    snapshot.set_defaults(func=cmd_snapshot_attendance)
+
+    verify = commands.add_parser(
+        "verify-history",
+        help="Check that replaying the attendance event log reproduces attendance",
+    )
+    verify.set_defaults(func=cmd_verify_history)
+
+    broker = commands.add_parser(
+        "events-broker",
+        help="Relay live dashboard events between workers (EVENTS_URL=tcp://host:port)",
+    )
+    broker.add_argument("--host", default="127.0.0.1")
+    broker.add_argument("--port", type=int, default=8765)
+    broker.set_defaults(func=cmd_events_broker)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# backend/app/core/aggregates.py
+
+from collections import defaultdict
+from datetime import date
+from typing import Iterable
+
+from sqlalchemy import func, case, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.database import chunked, dialect_insert
+from app.core.partitions import attendance_source
+from app.models.attendance_daily import AttendanceDaily
+from app.models.employee import Employee
+
+
+def apply_attendance_deltas(
+    db: Session,
+    changes: Iterable[tuple[date, str, str, int]],
+):
+    """
+    Fold attendance changes into `attendance_daily`.
+
+    Each change is (date, department, status, delta): +1 for a row that
+    now exists with that status, -1 for one that no longer does. A status
+    update is therefore one -1 for the old status and one +1 for the new.
+
+    Runs inside the caller's transaction; the caller commits.
+    """
+    totals: dict[tuple[date, str], list[int]] = defaultdict(lambda: [0, 0, 0])
+
+    for day, department, status, delta in changes:
+        acc = totals[(day, department)]
+        acc[0] += delta
+        acc[1 if status == "Present" else 2] += delta
+
+    rows = [
+        {
+            "date": day,
+            "department": department,
+            "total": total,
+            "present": present,
+            "absent": absent,
+        }
+        for (day, department), (total, present, absent) in totals.items()
+        if total or present or absent
+    ]
+
+    for chunk in chunked(rows):
+        stmt = dialect_insert(db, AttendanceDaily).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["date", "department"],
+            set_={
+                "total": AttendanceDaily.total + stmt.excluded.total,
+                "present": AttendanceDaily.present + stmt.excluded.present,
+                "absent": AttendanceDaily.absent + stmt.excluded.absent,
+            },
+        )
+        db.execute(stmt)
+
+
+def rebuild_daily_aggregates(db: Session) -> int:
+    """
+    Recompute `attendance_daily` from scratch with one INSERT … SELECT.
+    Returns the number of aggregate rows written.
+    """
+    source = attendance_source()
+    grouped = (
+        select(
+            source.date,
+            Employee.department,
+            func.count(),
+            func.sum(case((source.status == "Present", 1), else_=0)),
+            func.sum(case((source.status == "Present", 0), else_=1)),
+        )
+        .join(Employee, Employee.employee_id == source.employee_id)
+        .group_by(source.date, Employee.department)
+    )
+
+    db.query(AttendanceDaily).delete()
+    db.execute(
+        insert(AttendanceDaily).from_select(
+            ["date", "department", "total", "present", "absent"],
+            grouped,
+        )
+    )
+    db.commit()
+
+    return db.query(AttendanceDaily).count()
@@ -0,0 +1,205 @@
+# backend/app/core/analytics.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.partitions import attendance_source
+from app.core.reports import date_range
+from app.models.employee import Employee
+
+# numpy is imported by the functions that use it, not when the app starts
+if TYPE_CHECKING:
+    import numpy as np
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+@dataclass
+class AttendanceMatrix:
+    """
+    Attendance for a date range as dense employee × day arrays.
+    marked[e, d]  → a record exists
+    present[e, d] → the record is Present
+    """
+    start_date: date
+    employee_ids: np.ndarray     # (E,) str
+    departments: np.ndarray      # (E,) str
+    marked: np.ndarray           # (E, D) bool
+    present: np.ndarray          # (E, D) bool
+
+    @property
+    def days(self) -> int:
+        return self.marked.shape[1]
+
+    @property
+    def absent(self) -> np.ndarray:
+        return self.marked & ~self.present
+
+    def dates(self) -> list[date]:
+        return [self.start_date + timedelta(days=i) for i in range(self.days)]
+
+
+def _rate(present, total):
+    """Percentages, 0 where there is nothing to divide by."""
+    import numpy as np
+
+    present = np.asarray(present, dtype=np.float64)
+    total = np.asarray(total, dtype=np.float64)
+    return np.round(
+        np.divide(present * 100, total, out=np.zeros_like(present), where=total > 0), 2
+    )
+
+
+def load_matrix(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    department: str | None = None,
+) -> AttendanceMatrix:
+    """Two queries: the employee axis, then one range scan of attendance."""
+    import numpy as np
+
+    employees = select(Employee.employee_id, Employee.department).order_by(Employee.employee_id)
+    if department:
+        employees = employees.where(Employee.department == department)
+
+    emp_rows = db.execute(employees).all()
+    employee_ids = np.array([r[0] for r in emp_rows], dtype=object)
+    departments = np.array([r[1] for r in emp_rows], dtype=object)
+    index = {emp_id: i for i, emp_id in enumerate(employee_ids)}
+
+    days = (end_date - start_date).days + 1
+    marked = np.zeros((len(employee_ids), days), dtype=bool)
+    present = np.zeros_like(marked)
+
+    source = attendance_source(start_date)
+    stmt = select(source.employee_id, source.date, source.status).where(
+        *date_range(start_date, end_date, source)
+    )
+    if department:
+        stmt = stmt.join(Employee, Employee.employee_id == source.employee_id).where(
+            Employee.department == department
+        )
+
+    rows = db.execute(stmt).all()
+    if rows:
+        emp_ids, dates, statuses = zip(*rows)
+        emp_idx = np.fromiter((index.get(e, -1) for e in emp_ids), dtype=np.int64, count=len(rows))
+        day_idx = (
+            np.array(dates, dtype="datetime64[D]") - np.datetime64(start_date, "D")
+        ).astype(np.int64)
+        is_present = np.array(statuses, dtype=object) == "Present"
+
+        # Rows of employees deleted without cleanup have no index
+        known = emp_idx >= 0
+        marked[emp_idx[known], day_idx[known]] = True
+        present[emp_idx[known], day_idx[known]] = is_present[known]
+
+    return AttendanceMatrix(start_date, employee_ids, departments, marked, present)
+
+
+def rolling_rates(matrix: AttendanceMatrix, window: int) -> list[dict]:
+    """Org-wide attendance rate per day and over the trailing `window` days."""
+    import numpy as np
+
+    present_per_day = matrix.present.sum(axis=0)
+    marked_per_day = matrix.marked.sum(axis=0)
+
+    # Trailing window sums via cumulative sums
+    cum_present = np.concatenate(([0], np.cumsum(present_per_day)))
+    cum_marked = np.concatenate(([0], np.cumsum(marked_per_day)))
+    lo = np.maximum(np.arange(1, matrix.days + 1) - window, 0)
+    hi = np.arange(1, matrix.days + 1)
+
+    daily = _rate(present_per_day, marked_per_day)
+    rolling = _rate(cum_present[hi] - cum_present[lo], cum_marked[hi] - cum_marked[lo])
+
+    return [
+        {
+            "date": day.isoformat(),
+            "present": int(present_per_day[i]),
+            "total": int(marked_per_day[i]),
+            "attendance_rate": float(daily[i]),
+            f"rolling_{window}d_rate": float(rolling[i]),
+        }
+        for i, day in enumerate(matrix.dates())
+    ]
+
+
+def department_rollup(matrix: AttendanceMatrix) -> list[dict]:
+    import numpy as np
+
+    names, dept_idx = np.unique(matrix.departments.astype(str), return_inverse=True)
+
+    headcount = np.bincount(dept_idx, minlength=len(names))
+    present = np.bincount(dept_idx, weights=matrix.present.sum(axis=1), minlength=len(names))
+    marked = np.bincount(dept_idx, weights=matrix.marked.sum(axis=1), minlength=len(names))
+    rates = _rate(present, marked)
+
+    return [
+        {
+            "department": str(name),
+            "employees": int(headcount[i]),
+            "present": int(present[i]),
+            "absent": int(marked[i] - present[i]),
+            "total": int(marked[i]),
+            "attendance_rate": float(rates[i]),
+        }
+        for i, name in enumerate(names)
+    ]
+
+
+def weekday_histogram(matrix: AttendanceMatrix) -> list[dict]:
+    import numpy as np
+
+    weekday = (np.arange(matrix.days) + matrix.start_date.weekday()) % 7
+
+    present = np.bincount(weekday, weights=matrix.present.sum(axis=0), minlength=7)
+    marked = np.bincount(weekday, weights=matrix.marked.sum(axis=0), minlength=7)
+    rates = _rate(present, marked)
+
+    return [
+        {
+            "weekday": WEEKDAYS[i],
+            "present": int(present[i]),
+            "absent": int(marked[i] - present[i]),
+            "total": int(marked[i]),
+            "attendance_rate": float(rates[i]),
+        }
+        for i in range(7)
+    ]
+
+
+def top_absentees(matrix: AttendanceMatrix, limit: int) -> list[dict]:
+    import numpy as np
+
+    absent = matrix.absent.sum(axis=1)
+    marked = matrix.marked.sum(axis=1)
+
+    limit = min(limit, len(absent))
+    if limit == 0:
+        return []
+
+    # Partial selection of everyone tied with the last place, then order
+    # just those (most absences first, ties by employee id)
+    cutoff = -np.partition(-absent, limit - 1)[limit - 1]
+    top = np.flatnonzero(absent >= cutoff)
+    top = top[np.lexsort((matrix.employee_ids[top].astype(str), -absent[top]))][:limit]
+    rates = _rate(marked[top] - absent[top], marked[top])
+
+    return [
+        {
+            "employee_id": str(matrix.employee_ids[i]),
+            "department": str(matrix.departments[i]),
+            "absent_days": int(absent[i]),
+            "total_days": int(marked[i]),
+            "attendance_rate": float(rate),
+        }
+        for i, rate in zip(top, rates)
+    ]
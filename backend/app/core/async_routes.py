@@ -0,0 +1,75 @@
+# backend/app/core/async_routes.py
+
+import inspect
+
+from fastapi import APIRouter, Depends
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+
+
+def _async_endpoint(endpoint):
+    """
+    `async def` twin of a sync handler taking `db: Session`.
+
+    The handler body runs through AsyncSession.run_sync: the same ORM code,
+    but driven by the async driver on the event loop instead of occupying
+    a threadpool worker for the whole request.
+    """
+    signature = inspect.signature(endpoint)
+
+    parameters = [
+        param.replace(default=Depends(get_async_db), annotation=AsyncSession)
+        if name == "db" else param
+        for name, param in signature.parameters.items()
+    ]
+
+    async def handler(**kwargs):
+        db: AsyncSession = kwargs.pop("db")
+        return await db.run_sync(lambda session: endpoint(**kwargs, db=session))
+
+    handler.__signature__ = signature.replace(parameters=parameters)
+    handler.__name__ = endpoint.__name__
+    handler.__qualname__ = endpoint.__qualname__
+    handler.__doc__ = endpoint.__doc__
+    return handler
+
+
+def make_async_router(router: APIRouter) -> APIRouter:
+    """
+    Copy of `router` whose sync DB handlers are served through AsyncSession.
+    Paths, response models and OpenAPI metadata are unchanged; handlers that
+    are already async or take no `db` are reused as they are.
+    """
+    async_router = APIRouter()
+
+    for route in router.routes:
+        if not isinstance(route, APIRoute):
+            async_router.routes.append(route)
+            continue
+
+        endpoint = route.endpoint
+        if (
+            "db" in inspect.signature(endpoint).parameters
+            and not inspect.iscoroutinefunction(endpoint)
+        ):
+            endpoint = _async_endpoint(endpoint)
+
+        async_router.add_api_route(
+            route.path,
+            endpoint,
+            methods=list(route.methods),
+            response_model=route.response_model,
+            status_code=route.status_code,
+            tags=route.tags,
+            summary=route.summary,
+            description=route.description,
+            response_description=route.response_description,
+            responses=route.responses,
+            name=route.name,
+            include_in_schema=route.include_in_schema,
+            response_class=route.response_class,
+        )
+
+    return async_router
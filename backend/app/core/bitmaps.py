@@ -0,0 +1,174 @@
+# backend/app/core/bitmaps.py
+
+import calendar
+import threading
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.event_log import apply_event, settled_position
+from app.core.partitions import attendance_source
+from app.models.attendance_event import AttendanceEvent
+from app.models.employee import Employee
+
+
+def _day_index(day: date) -> int:
+    return day.timetuple().tm_yday - 1
+
+
+def _range_mask(start: int, end: int) -> int:
+    """Bits start..end inclusive."""
+    return ((1 << (end + 1)) - 1) ^ ((1 << start) - 1)
+
+
+def _longest_run(bits: int) -> int:
+    """Longest run of consecutive 1 bits; O(run length) big-int ops."""
+    run = 0
+    while bits:
+        bits &= bits << 1
+        run += 1
+    return run
+
+
+class AttendanceBitmapStore:
+    """
+    Attendance as two bitsets per (employee, year), one bit per day of year:
+    `marked` (a record exists) and `present` (status is Present).
+    Absent days are `marked & ~present`.
+
+    A year of one employee is two ints of ≤ 366 bits, so counts are a
+    popcount and streaks are a few shifts. Built from the attendance table on
+    first use; each query then runs one statement that reads the head of the
+    attendance event log and folds in any events since, so writes from other
+    workers and CLI commands are seen too.
+
+    SQL always runs outside the lock: under DB_MODE=async it suspends the
+    event loop's thread, and a lock held across it would block every other
+    request on that thread for good.
+    """
+
+    def __init__(self):
+        self._years: dict[tuple[str, int], list[int]] = {}
+        # Event log position folded in; None until loaded
+        self._seq: int | None = None
+        self._lock = threading.Lock()
+
+    # ----------------------------
+    # Build / sync
+    # ----------------------------
+    def sync(self, db: Session, emp_id: str) -> bool:
+        """Bring the store up to the event log; True if the employee exists."""
+        head, exists = db.execute(
+            select(
+                select(func.max(AttendanceEvent.seq)).scalar_subquery(),
+                select(Employee.id).where(Employee.employee_id == emp_id).exists(),
+            )
+        ).one()
+
+        head = head or 0
+        seq = self._seq
+        if seq is None:
+            self._load(db, settled_position(db, head))
+        elif head != seq:
+            self._catch_up(db, seq, head, settled_position(db, head))
+
+        return exists
+
+    def _load(self, db: Session, upto: int):
+        years: dict[tuple[str, int], list[int]] = {}
+
+        source = attendance_source()
+        stmt = select(
+            source.employee_id, source.date, source.status
+        ).execution_options(yield_per=10_000)
+
+        for emp_id, day, status in db.execute(stmt):
+            apply_event(years, emp_id, day, status)
+
+        # Rows may already include events after `upto`; replaying those
+        # again later is harmless, each event sets a day outright
+        with self._lock:
+            if self._seq is None:
+                self._years, self._seq = years, upto
+
+    def _catch_up(self, db: Session, after: int, head: int, resume: int):
+        """
+        Fold in events (after, head]. The next catch-up starts at `resume`,
+        which trails `head` on PostgreSQL where commits land out of seq order.
+        """
+        events = db.execute(
+            select(AttendanceEvent.employee_id, AttendanceEvent.date, AttendanceEvent.status)
+            .where(AttendanceEvent.seq > after, AttendanceEvent.seq <= head)
+            .order_by(AttendanceEvent.seq)
+        ).all()
+
+        with self._lock:
+            # Another request got there first
+            if self._seq != after:
+                return
+            for emp_id, day, status in events:
+                apply_event(self._years, emp_id, day, status)
+            self._seq = resume
+
+    def reset(self):
+        """Forget everything; the next query rebuilds from the database."""
+        with self._lock:
+            self._years = {}
+            self._seq = None
+
+    # ----------------------------
+    # Queries
+    # ----------------------------
+    def _bits(self, emp_id: str, start: date, end: date) -> tuple[int, int]:
+        """(marked, present) for start..end, bit 0 = start."""
+        marked = present = 0
+        offset = 0
+
+        for year in range(start.year, end.year + 1):
+            first = start if year == start.year else date(year, 1, 1)
+            last = end if year == end.year else date(year, 12, 31)
+            lo, hi = _day_index(first), _day_index(last)
+
+            entry = self._years.get((emp_id, year))
+            if entry:
+                mask = _range_mask(lo, hi)
+                marked |= ((entry[0] & mask) >> lo) << offset
+                present |= ((entry[1] & mask) >> lo) << offset
+
+            offset += hi - lo + 1
+
+        return marked, present
+
+    def day_statuses(self, emp_id: str, start: date, end: date) -> str:
+        """One char per day: P(resent), A(bsent) or - (not marked)."""
+        marked, present = self._bits(emp_id, start, end)
+        days = (end - start).days + 1
+
+        return "".join(
+            ("P" if present >> i & 1 else "A") if marked >> i & 1 else "-"
+            for i in range(days)
+        )
+
+    def summary(self, emp_id: str, start: date, end: date) -> dict:
+        marked, present = self._bits(emp_id, start, end)
+        absent = marked & ~present
+
+        present_days = present.bit_count()
+        total_days = marked.bit_count()
+
+        return {
+            "total_days": total_days,
+            "present_days": present_days,
+            "absent_days": total_days - present_days,
+            "longest_present_streak": _longest_run(present),
+            "longest_absence_run": _longest_run(absent),
+        }
+
+
+bitmap_store = AttendanceBitmapStore()
+
+
+def month_bounds(year: int, month: int) -> tuple[date, date]:
+    # No first-of-next-month arithmetic, which overflows in December 9999
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
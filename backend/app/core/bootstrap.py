@@ -0,0 +1,251 @@
+# backend/app/core/bootstrap.py
+
+import logging
+import os
+from contextlib import contextmanager
+
+from sqlalchemy import Integer, func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.core.aggregates import rebuild_daily_aggregates
+from app.core.database import Base, engine, SessionLocal, SQLITE_PRAGMAS
+from app.core.event_log import backfill_event_log, ensure_append_only, log_started, log_table_rows
+from app.core.maintenance import clear_orphans_once
+from app.core.partitions import attendance_source, drop_history_view, ensure_history_view
+from app.core.search import ensure_search_index
+from app.core.seed_data import run_seed
+from app.models.attendance import Attendance, AttendanceArchive
+from app.models.attendance_daily import AttendanceDaily
+
+# Register every model on Base.metadata
+from app.models import employee, attendance, attendance_daily, attendance_event  # noqa: F401
+
+# What a worker does when it boots:
+# - "dev":  bootstrap the schema, seed demo data and clear today (local default)
+# - "migrate": bootstrap the schema only, never touch data
+# - "none": nothing; run `python -m app.cli bootstrap` at deploy time instead
+STARTUP_MODE = os.getenv("STARTUP_MODE", "dev").lower()
+
+schema_log = logging.getLogger("hrms.schema")
+
+
+def _aggregates_missing(db: Session) -> bool:
+    source = attendance_source()
+    has_attendance = db.execute(select(source.id).limit(1)).first()
+    has_aggregates = db.execute(select(AttendanceDaily.date).limit(1)).first()
+    return bool(has_attendance) and not has_aggregates
+
+
+def _status_is_coded(bind) -> bool:
+    columns = {c["name"]: c["type"] for c in inspect(bind).get_columns("attendance")}
+    return isinstance(columns["status"], Integer)
+
+
+STATUS_CODE = "CASE status WHEN 'Present' THEN 1 ELSE 0 END"
+
+# The text-status table while SQLite rebuilds `attendance`
+LEGACY_TABLE = "attendance_legacy"
+
+
+@contextmanager
+def sqlite_table_rebuild(bind):
+    """
+    SQLite's table-rebuild procedure: foreign keys off, every step inside one
+    explicit BEGIN … COMMIT, and a foreign key check before committing.
+    pysqlite runs DDL outside any transaction, so `bind.begin()` alone would
+    leave a failed rebuild half done.
+    """
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        # A no-op inside a transaction, so it goes first
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        try:
+            conn.exec_driver_sql("BEGIN")
+            try:
+                yield conn
+
+                violations = conn.exec_driver_sql("PRAGMA foreign_key_check(attendance)").fetchall()
+                if violations:
+                    raise RuntimeError(
+                        f"{len(violations)} attendance rows reference missing employees"
+                    )
+            except BaseException:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+            conn.exec_driver_sql("COMMIT")
+        finally:
+            conn.exec_driver_sql(f"PRAGMA foreign_keys={SQLITE_PRAGMAS['foreign_keys']}")
+
+
+def _has_autoincrement(bind) -> bool:
+    with bind.connect() as conn:
+        sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'attendance'"
+        ).scalar()
+    return "AUTOINCREMENT" in sql.upper()
+
+
+def _rebuild_attendance(conn, status: str = STATUS_CODE):
+    """
+    Recreate `attendance` from its current definition, converting `status`
+    with the given SQL expression. Rows whose id is also in the archive
+    (given out again before ids were AUTOINCREMENT) get new ids.
+    """
+    drop_history_view(conn)
+
+    # Index names are global in SQLite; free them for the new table
+    legacy_indexes = conn.exec_driver_sql(
+        "SELECT name FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = 'attendance' AND sql IS NOT NULL"
+    ).scalars().all()
+    for name in legacy_indexes:
+        conn.exec_driver_sql(f'DROP INDEX "{name}"')
+
+    conn.exec_driver_sql(f"ALTER TABLE attendance RENAME TO {LEGACY_TABLE}")
+    Attendance.__table__.create(conn)
+    clashes = f"id IN (SELECT id FROM {AttendanceArchive.__tablename__})"
+    conn.exec_driver_sql(
+        "INSERT INTO attendance (id, employee_id, date, status) "
+        f"SELECT id, employee_id, date, {status} FROM {LEGACY_TABLE} WHERE NOT {clashes}"
+    )
+
+    # New ids start above every archived one
+    archived_max = conn.exec_driver_sql(
+        f"SELECT max(id) FROM {AttendanceArchive.__tablename__}"
+    ).scalar()
+    if archived_max is not None:
+        conn.exec_driver_sql("DELETE FROM sqlite_sequence WHERE name = 'attendance'")
+        conn.exec_driver_sql(
+            "INSERT INTO sqlite_sequence (name, seq) "
+            "SELECT 'attendance', max(?, coalesce(max(id), 0)) FROM attendance",
+            (archived_max,),
+        )
+
+    conn.exec_driver_sql(
+        "INSERT INTO attendance (employee_id, date, status) "
+        f"SELECT employee_id, date, {status} FROM {LEGACY_TABLE} WHERE {clashes} ORDER BY id"
+    )
+    conn.exec_driver_sql(f"DROP TABLE {LEGACY_TABLE}")
+
+
+def _finish_legacy_rebuild(conn) -> int:
+    """
+    Earlier versions ran the rebuild step by step; one that failed left the
+    rows in attendance_legacy behind an empty, since-written `attendance`.
+    Move them back (skipping employee-days marked since and rows whose
+    employee is gone), log them if the event log has started, drop the table.
+    """
+    last_id = conn.execute(select(func.max(Attendance.id))).scalar()
+
+    # Ids are internal; keep them only when nothing can clash
+    id_column = "" if last_id else "id, "
+    recovered = conn.exec_driver_sql(
+        f"INSERT INTO attendance ({id_column}employee_id, date, status) "
+        f"SELECT {id_column}employee_id, date, {STATUS_CODE} FROM {LEGACY_TABLE} AS l "
+        "WHERE EXISTS (SELECT 1 FROM employees e WHERE e.employee_id = l.employee_id) "
+        "AND NOT EXISTS (SELECT 1 FROM attendance a "
+        "WHERE a.employee_id = l.employee_id AND a.date = l.date) "
+        "ORDER BY l.id"
+    ).rowcount
+
+    if recovered and log_started(conn):
+        log_table_rows(conn, Attendance, Attendance.id > (last_id or 0), source="baseline")
+
+    conn.exec_driver_sql(f"DROP TABLE {LEGACY_TABLE}")
+    return recovered
+
+
+def migrate_status_codes(bind) -> int:
+    """
+    Convert a text `attendance.status` ("Present"/"Absent") to SMALLINT codes.
+    SQLite cannot change a column type in place, so the table is rebuilt.
+    Returns the rows recovered from a rebuild an earlier version left half done.
+    """
+    if bind.dialect.name == "postgresql":
+        if not _status_is_coded(bind):
+            with bind.begin() as conn:
+                drop_history_view(conn)
+                conn.exec_driver_sql(
+                    f"ALTER TABLE attendance ALTER COLUMN status TYPE SMALLINT USING {STATUS_CODE}"
+                )
+        return 0
+
+    if inspect(bind).has_table(LEGACY_TABLE):
+        with sqlite_table_rebuild(bind) as conn:
+            recovered = _finish_legacy_rebuild(conn)
+        schema_log.warning("Recovered %d attendance rows from %s", recovered, LEGACY_TABLE)
+        return recovered
+
+    if not _status_is_coded(bind):
+        with sqlite_table_rebuild(bind) as conn:
+            _rebuild_attendance(conn)
+    return 0
+
+
+def migrate_attendance_ids(bind):
+    """
+    SQLite reuses the highest rowid unless the table is AUTOINCREMENT, so
+    ids of archived rows went to new marks. Tables created before that are
+    rebuilt once. PostgreSQL sequences never go back.
+    """
+    if bind.dialect.name == "sqlite" and not _has_autoincrement(bind):
+        with sqlite_table_rebuild(bind) as conn:
+            _rebuild_attendance(conn, status="status")
+
+
+def create_schema():
+    """Create missing tables, indexes, views and the search index (DDL only)."""
+    Base.metadata.create_all(bind=engine)
+
+    # Attendance of employees deleted before foreign keys were enforced
+    # would fail the rebuild's foreign key check
+    for table, rows in (clear_orphans_once(engine) or {}).items():
+        if rows:
+            schema_log.warning("Deleted %d orphaned rows from %s", rows, table)
+
+    recovered = migrate_status_codes(engine)
+    migrate_attendance_ids(engine)
+
+    # create_all skips tables that already exist, including their new indexes
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    with engine.begin() as conn:
+        # Superseded by ix_attendance_employee_date_status
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_attendance_employee_id")
+
+    ensure_search_index(engine)
+    ensure_history_view(engine)
+    ensure_append_only(engine)
+
+    if recovered:
+        db = SessionLocal()
+        try:
+            rebuild_daily_aggregates(db)
+        finally:
+            db.close()
+
+
+def bootstrap(seed: bool = False):
+    """
+    Idempotent schema setup: tables, search index and derived tables.
+    Safe to run on every deploy; with `seed` it also loads demo data.
+    """
+    create_schema()
+
+    db = SessionLocal()
+    try:
+        backfill_event_log(db)
+
+        if seed:
+            run_seed(db)
+        elif _aggregates_missing(db):
+            rebuild_daily_aggregates(db)
+    finally:
+        db.close()
+
+
+def on_startup():
+    if STARTUP_MODE == "none":
+        return
+    bootstrap(seed=STARTUP_MODE == "dev")
@@ -0,0 +1,204 @@
+# backend/app/core/cache.py
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from urllib.parse import urlencode
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+# "memory" (per worker), "redis://host:6379/0" (shared across workers) or "none"
+CACHE_URL = os.getenv("CACHE_URL", "memory")
+CACHE_TTL = int(os.getenv("CACHE_TTL", "30"))  # seconds
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+
+# Cached GET routes → the data they depend on.
+# Writes invalidate by tag (see `invalidate`), never by key.
+CACHED_ROUTES = {
+    "/employees": ("employees",),
+    "/dashboard/today": ("employees", "attendance"),
+    "/dashboard/last-30-days": ("attendance",),
+    "/reports/attendance/summary": ("attendance",),
+}
+
+
+class MemoryCache:
+    """In-process LRU with per-entry TTL. Each worker has its own copy."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._generations: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: int = CACHE_TTL):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def generation(self, tag: str) -> int:
+        return self._generations[tag]
+
+    def bump(self, tag: str):
+        with self._lock:
+            self._generations[tag] += 1
+            self.stats["invalidations"] += 1
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache:
+    """Shared cache for multi-worker deployments (needs the `redis` package)."""
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key: str) -> bytes | None:
+        value = self._client.get(f"hrms:cache:{key}")
+        self.stats["hits" if value is not None else "misses"] += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl: int = CACHE_TTL):
+        # Redis evicts on its own (maxmemory-policy), counted server-side
+        self._client.set(f"hrms:cache:{key}", value, ex=ttl)
+
+    def generation(self, tag: str) -> int:
+        return int(self._client.get(f"hrms:gen:{tag}") or 0)
+
+    def bump(self, tag: str):
+        self._client.incr(f"hrms:gen:{tag}")
+        self.stats["invalidations"] += 1
+
+    def size(self) -> int:
+        return sum(1 for _ in self._client.scan_iter("hrms:cache:*"))
+
+
+def _build_backend():
+    if CACHE_URL == "none":
+        return None
+    if CACHE_URL.startswith("redis"):
+        return RedisCache(CACHE_URL)
+    return MemoryCache()
+
+
+cache = _build_backend()
+
+
+def invalidate(*tags: str):
+    """Drop every cached response that depends on any of `tags`."""
+    if cache is None:
+        return
+    for tag in tags:
+        cache.bump(tag)
+
+
+def cache_stats() -> dict:
+    if cache is None:
+        return {"backend": "none"}
+    return {
+        "backend": type(cache).__name__,
+        "entries": cache.size(),
+        **cache.stats,
+    }
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+def _pack(content_type: str, etag: str, body: bytes) -> bytes:
+    return f"{content_type}\n{etag}\n".encode() + body
+
+
+def _unpack(value: bytes) -> tuple[str, str, bytes]:
+    content_type, etag, body = value.split(b"\n", 2)
+    return content_type.decode(), etag.decode(), body
+
+
+class ResponseCacheMiddleware:
+    """
+    Serves CACHED_ROUTES from the cache and adds ETags so clients can
+    revalidate with If-None-Match and get a bodiless 304.
+
+    Every other request passes straight through at the ASGI level, so
+    uncached routes and long-lived streams pay nothing for it.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._caching = _CachingMiddleware(app)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            cache is not None
+            and scope["type"] == "http"
+            and scope["method"] == "GET"
+            and scope["path"] in CACHED_ROUTES
+        ):
+            await self._caching(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+class _CachingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        tags = CACHED_ROUTES[request.url.path]
+
+        # Re-encoded, so a value containing "&" or "=" cannot pose as another parameter
+        query = urlencode(sorted(request.query_params.multi_items()))
+        versions = ",".join(f"{tag}:{cache.generation(tag)}" for tag in tags)
+        key = f"{request.url.path}?{query}#{versions}"
+
+        cached = cache.get(key)
+
+        if cached is not None:
+            content_type, etag, body = _unpack(cached)
+            state = "HIT"
+        else:
+            response = await call_next(request)
+            if response.status_code != 200:
+                return response
+
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            content_type = response.headers.get("content-type", "application/json")
+            etag = _etag(body)
+            cache.set(key, _pack(content_type, etag, body))
+            state = "MISS"
+
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "private, no-cache",
+            "X-Cache": state,
+        }
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=body, media_type=content_type, headers=headers)
@@ -0,0 +1,425 @@
+# backend/app/core/event_log.py
+
+import os
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+
+from sqlalchemy import DateTime, String, delete, func, insert, literal, null, select
+from sqlalchemy.orm import Session
+
+from app.core.database import chunked
+from app.models.attendance import Attendance, AttendanceArchive
+from app.models.attendance_event import (
+    AttendanceEvent,
+    AttendanceSnapshot,
+    AttendanceSnapshotYear,
+)
+
+EVENT_COLUMNS = ["recorded_at", "employee_id", "date", "status", "source"]
+
+# Bytes per stored bitset (366 days)
+YEAR_BYTES = 46
+
+# Rows read from the cursor at a time while replaying
+REPLAY_BATCH_SIZE = 10_000
+
+# SQLite commits in seq order. On PostgreSQL a transaction still in flight
+# can hold a lower seq than one already committed, so snapshots leave the
+# newest minute of the log for the next run.
+POSTGRES_SETTLE_SECONDS = 60
+
+# Snapshots kept by prune_snapshots: the newest SNAPSHOT_KEEP_RECENT, then
+# the newest of each of the last SNAPSHOT_KEEP_DAILY days and of the last
+# SNAPSHOT_KEEP_MONTHLY months. Each one holds every employee-year.
+SNAPSHOT_KEEP_RECENT = int(os.getenv("SNAPSHOT_KEEP_RECENT", "24"))
+SNAPSHOT_KEEP_DAILY = int(os.getenv("SNAPSHOT_KEEP_DAILY", "30"))
+SNAPSHOT_KEEP_MONTHLY = int(os.getenv("SNAPSHOT_KEEP_MONTHLY", "12"))
+
+_APPEND_ONLY_SQLITE = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS attendance_events_no_{action.lower()}
+    BEFORE {action} ON attendance_events
+    BEGIN SELECT RAISE(ABORT, 'attendance_events is append-only'); END
+    """
+    for action in ("UPDATE", "DELETE")
+]
+
+_APPEND_ONLY_POSTGRES = [
+    """
+    CREATE OR REPLACE FUNCTION attendance_events_append_only() RETURNS trigger AS $$
+    BEGIN RAISE EXCEPTION 'attendance_events is append-only'; END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS attendance_events_append_only ON attendance_events",
+    """
+    CREATE TRIGGER attendance_events_append_only
+    BEFORE UPDATE OR DELETE ON attendance_events
+    FOR EACH ROW EXECUTE FUNCTION attendance_events_append_only()
+    """,
+]
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def to_utc(moment: datetime) -> datetime:
+    """Naive UTC, as stored; naive input is taken to be UTC already."""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def ensure_append_only(engine):
+    """Triggers rejecting UPDATE and DELETE on the log."""
+    with engine.begin() as conn:
+        ddl = _APPEND_ONLY_POSTGRES if conn.dialect.name == "postgresql" else _APPEND_ONLY_SQLITE
+        for statement in ddl:
+            conn.exec_driver_sql(statement)
+
+
+# ----------------------------
+# Writing (inside the caller's transaction)
+# ----------------------------
+def log_attendance(db: Session, changes, source: str):
+    """Append (employee_id, date, status) changes; status None = removed."""
+    now = utcnow()
+    rows = [
+        {
+            "recorded_at": now,
+            "employee_id": employee_id,
+            "date": day,
+            "status": status,
+            "source": source,
+        }
+        for employee_id, day, status in changes
+    ]
+
+    if rows:
+        db.execute(insert(AttendanceEvent), rows)
+
+
+def log_table_rows(db: Session, table, *criteria, source: str, removed: bool = False) -> int:
+    """
+    Set-based twin of log_attendance for rows already in `table`: logs them
+    as they are, or as removed (call that before deleting them).
+    """
+    rows = select(
+        literal(utcnow(), DateTime),
+        table.employee_id,
+        table.date,
+        null() if removed else table.status,
+        literal(source, String),
+    ).where(*criteria).order_by(table.id)
+
+    return db.execute(
+        insert(AttendanceEvent).from_select(EVENT_COLUMNS, rows)
+    ).rowcount
+
+
+def log_started(db: Session) -> bool:
+    return db.execute(select(AttendanceEvent.seq).limit(1)).first() is not None
+
+
+def backfill_event_log(db: Session) -> int:
+    """
+    First run on a database that predates the log: record the current rows
+    once as "baseline" events, so replaying the log reproduces them.
+    """
+    if log_started(db):
+        return 0
+
+    logged = sum(
+        log_table_rows(db, table, source="baseline")
+        for table in (Attendance, AttendanceArchive)
+    )
+    db.commit()
+
+    if logged:
+        take_snapshot(db)
+    return logged
+
+
+# ----------------------------
+# State: {(employee_id, year): [marked, present]} bitsets, bit 0 = Jan 1
+# ----------------------------
+@lru_cache(maxsize=4096)
+def _day_bit(day: date) -> tuple[int, int]:
+    return day.year, 1 << (day.timetuple().tm_yday - 1)
+
+
+def apply_event(state: dict, employee_id: str, day: date, status: str | None) -> tuple[str, int]:
+    year, bit = _day_bit(day)
+    key = (employee_id, year)
+    entry = state.setdefault(key, [0, 0])
+
+    if status is None:
+        entry[0] &= ~bit
+        entry[1] &= ~bit
+    else:
+        entry[0] |= bit
+        if status == "Present":
+            entry[1] |= bit
+        else:
+            entry[1] &= ~bit
+
+    return key
+
+
+def _batches(db: Session, stmt):
+    """Core rows, REPLAY_BATCH_SIZE at a time; per-row ORM overhead would dominate."""
+    result = db.connection().execute(stmt.execution_options(yield_per=REPLAY_BATCH_SIZE))
+    return result.partitions()
+
+
+def _load_snapshot(
+    db: Session,
+    snapshot_id: int | None,
+    employee_id: str | None = None,
+    years: tuple[int, int] | None = None,
+) -> dict:
+    """Employee-years stored in one snapshot; a primary key range read."""
+    state: dict = {}
+    if snapshot_id is None:
+        return state
+
+    stmt = select(
+        AttendanceSnapshotYear.employee_id,
+        AttendanceSnapshotYear.year,
+        AttendanceSnapshotYear.marked,
+        AttendanceSnapshotYear.present,
+    ).where(AttendanceSnapshotYear.snapshot_id == snapshot_id)
+
+    if employee_id is not None:
+        stmt = stmt.where(AttendanceSnapshotYear.employee_id == employee_id)
+    if years is not None:
+        stmt = stmt.where(AttendanceSnapshotYear.year.between(*years))
+
+    for batch in _batches(db, stmt):
+        for emp_id, year, marked, present in batch:
+            state[(emp_id, year)] = [
+                int.from_bytes(marked, "little"),
+                int.from_bytes(present, "little"),
+            ]
+
+    return state
+
+
+def _replay(db: Session, state: dict, window) -> int:
+    stmt = select(
+        AttendanceEvent.employee_id, AttendanceEvent.date, AttendanceEvent.status
+    ).where(*window).order_by(AttendanceEvent.seq)
+
+    replayed = 0
+    for batch in _batches(db, stmt):
+        for employee_id, day, status in batch:
+            apply_event(state, employee_id, day, status)
+        replayed += len(batch)
+
+    return replayed
+
+
+# ----------------------------
+# Snapshots
+# ----------------------------
+def _latest_snapshot(db: Session, upto_seq: int | None = None):
+    """(id, upto_seq) of the newest snapshot at or before a log position."""
+    stmt = select(AttendanceSnapshot.id, AttendanceSnapshot.upto_seq)
+    if upto_seq is not None:
+        stmt = stmt.where(AttendanceSnapshot.upto_seq <= upto_seq)
+
+    row = db.execute(stmt.order_by(AttendanceSnapshot.upto_seq.desc()).limit(1)).first()
+    return (row.id, row.upto_seq) if row else (None, 0)
+
+
+def log_position(db: Session, at: datetime) -> int:
+    """
+    Seq of the last event recorded at or before `at`; 0 before the log.
+    The state as of `at` is the log up to and including this position.
+    """
+    seq = db.execute(
+        select(AttendanceEvent.seq)
+        .where(AttendanceEvent.recorded_at <= at)
+        .order_by(AttendanceEvent.recorded_at.desc(), AttendanceEvent.seq.desc())
+        .limit(1)
+    ).scalar()
+    return seq or 0
+
+
+def settled_position(db: Session, head: int | None = None) -> int:
+    """
+    Log position up to which every event has committed, for readers that
+    resume from it later. `head` (the newest seq) saves a query on SQLite.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return log_position(db, utcnow() - timedelta(seconds=POSTGRES_SETTLE_SECONDS))
+    if head is None:
+        head = db.execute(select(func.max(AttendanceEvent.seq))).scalar() or 0
+    return head
+
+
+def take_snapshot(db: Session) -> AttendanceSnapshot | None:
+    """
+    Fold the events since the previous snapshot into a new, self-contained
+    one. Returns None when there is nothing new.
+    """
+    previous_id, after_seq = _latest_snapshot(db)
+    upto_seq = settled_position(db)
+
+    if upto_seq <= after_seq:
+        return None
+
+    state = _load_snapshot(db, previous_id)
+    replayed = _replay(db, state, (AttendanceEvent.seq > after_seq, AttendanceEvent.seq <= upto_seq))
+
+    snapshot = AttendanceSnapshot(upto_seq=upto_seq, taken_at=utcnow(), events=replayed)
+    db.add(snapshot)
+    db.flush()
+
+    rows = [
+        {
+            "snapshot_id": snapshot.id,
+            "employee_id": employee_id,
+            "year": year,
+            "marked": marked.to_bytes(YEAR_BYTES, "little"),
+            "present": present.to_bytes(YEAR_BYTES, "little"),
+        }
+        for (employee_id, year), (marked, present) in state.items()
+        if marked
+    ]
+    for chunk in chunked(rows, REPLAY_BATCH_SIZE):
+        db.execute(insert(AttendanceSnapshotYear), chunk)
+
+    db.commit()
+    db.refresh(snapshot)
+    return snapshot
+
+
+def _snapshots_to_keep(snapshots: list) -> set[int]:
+    """Ids to keep from (id, taken_at) rows, newest first."""
+    keep = {snapshot_id for snapshot_id, _ in snapshots[:SNAPSHOT_KEEP_RECENT]}
+
+    daily: dict = {}
+    monthly: dict = {}
+    for snapshot_id, taken_at in snapshots:
+        daily.setdefault(taken_at.date(), snapshot_id)
+        monthly.setdefault((taken_at.year, taken_at.month), snapshot_id)
+
+    keep.update(list(daily.values())[:SNAPSHOT_KEEP_DAILY])
+    keep.update(list(monthly.values())[:SNAPSHOT_KEEP_MONTHLY])
+    return keep
+
+
+def prune_snapshots(db: Session) -> int:
+    """
+    Delete snapshots outside the retention settings; the newest always stays.
+    As-of queries older than the oldest kept one replay from the log start.
+    Returns the number deleted.
+    """
+    snapshots = db.execute(
+        select(AttendanceSnapshot.id, AttendanceSnapshot.taken_at)
+        .order_by(AttendanceSnapshot.upto_seq.desc())
+    ).all()
+
+    keep = _snapshots_to_keep(snapshots)
+    doomed = [snapshot_id for snapshot_id, _ in snapshots if snapshot_id not in keep]
+
+    # Explicit rather than ON DELETE CASCADE, which SQLite may run without
+    for chunk in chunked(doomed):
+        db.execute(delete(AttendanceSnapshotYear).where(AttendanceSnapshotYear.snapshot_id.in_(chunk)))
+        db.execute(delete(AttendanceSnapshot).where(AttendanceSnapshot.id.in_(chunk)))
+
+    db.commit()
+    return len(doomed)
+
+
+# ----------------------------
+# Queries
+# ----------------------------
+def state_as_of(
+    db: Session,
+    at: datetime | None = None,
+    employee_id: str | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    use_snapshots: bool = True,
+) -> tuple[dict, int]:
+    """
+    Attendance state at `at` (naive UTC; None = now): the newest snapshot
+    at or before that log position plus a replay of the events after it.
+    Returns the state and the number of events replayed.
+    """
+    upto_seq = (
+        log_position(db, at) if at is not None
+        else db.execute(select(func.max(AttendanceEvent.seq))).scalar() or 0
+    )
+    snapshot_id, after_seq = _latest_snapshot(db, upto_seq) if use_snapshots else (None, 0)
+
+    years = None
+    if start_date is not None or end_date is not None:
+        years = (
+            start_date.year if start_date else date.min.year,
+            end_date.year if end_date else date.max.year,
+        )
+
+    state = _load_snapshot(db, snapshot_id, employee_id, years)
+
+    window = [AttendanceEvent.seq > after_seq, AttendanceEvent.seq <= upto_seq]
+    if employee_id:
+        window.append(AttendanceEvent.employee_id == employee_id)
+    if start_date:
+        window.append(AttendanceEvent.date >= start_date)
+    if end_date:
+        window.append(AttendanceEvent.date <= end_date)
+
+    return state, _replay(db, state, window)
+
+
+def state_records(state: dict, start_date: date | None = None, end_date: date | None = None):
+    """Yield (employee_id, date, status) for marked days, by employee then date."""
+    for (employee_id, year), (marked, present) in sorted(state.items()):
+        jan1 = date(year, 1, 1)
+        while marked:
+            low = marked & -marked
+            day = jan1 + timedelta(days=low.bit_length() - 1)
+            marked ^= low
+
+            if (start_date and day < start_date) or (end_date and day > end_date):
+                continue
+            yield employee_id, day, "Present" if present & low else "Absent"
+
+
+def attendance_as_of(
+    db: Session,
+    at: datetime,
+    employee_id: str | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> list[tuple[str, date, str]]:
+    state, _ = state_as_of(db, at, employee_id, start_date, end_date)
+    return list(state_records(state, start_date, end_date))
+
+
+def has_history(db: Session, employee_id: str) -> bool:
+    return db.execute(
+        select(AttendanceEvent.seq).where(AttendanceEvent.employee_id == employee_id).limit(1)
+    ).first() is not None
+
+
+def log_drift(db: Session) -> int:
+    """
+    Employee-years where replaying the log disagrees with the attendance
+    tables; 0 when the tables are exactly the state the log leads to.
+    """
+    replayed, _ = state_as_of(db)
+
+    stored: dict = {}
+    for table in (Attendance, AttendanceArchive):
+        rows = select(table.employee_id, table.date, table.status)
+        for employee_id, day, status in db.execute(
+            rows.execution_options(yield_per=REPLAY_BATCH_SIZE)
+        ):
+            apply_event(stored, employee_id, day, status)
+
+    keys = {k for k, v in replayed.items() if v[0]} | {k for k, v in stored.items() if v[0]}
+    return sum(replayed.get(k) != stored.get(k) for k in keys)
@@ -0,0 +1,145 @@
+# backend/app/core/exports.py
+
+import csv
+import importlib.util
+import io
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.partitions import attendance_source
+from app.core.reports import date_range
+from app.models.employee import Employee
+
+EXPORT_COLUMNS = ["employee_id", "full_name", "department", "date", "status"]
+
+# Rows fetched from the cursor (and flushed to the client) at a time
+EXPORT_BATCH_SIZE = 5000
+
+
+def parquet_available() -> bool:
+    """Parquet export is optional; pyarrow is imported only to write one."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def attendance_batches(
+    db: Session,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    department: str | None = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+):
+    """Attendance history as lists of row tuples, straight off the cursor."""
+    source = attendance_source(start_date)
+    stmt = (
+        select(
+            source.employee_id,
+            Employee.full_name,
+            Employee.department,
+            source.date,
+            source.status,
+        )
+        .join(Employee, Employee.employee_id == source.employee_id)
+        .where(*date_range(start_date, end_date, source))
+        .order_by(source.date, source.employee_id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    if department:
+        stmt = stmt.where(Employee.department == department)
+
+    for partition in db.execute(stmt).partitions():
+        yield partition
+
+
+def attendance_count(
+    db: Session,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    department: str | None = None,
+) -> int:
+    """Rows attendance_batches will yield; an index range count."""
+    source = attendance_source(start_date)
+    stmt = select(func.count()).select_from(source).where(*date_range(start_date, end_date, source))
+
+    if department:
+        stmt = stmt.join(Employee, Employee.employee_id == source.employee_id).where(
+            Employee.department == department
+        )
+
+    return db.execute(stmt).scalar()
+
+
+def csv_stream(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_COLUMNS)
+
+    for batch in batches:
+        writer.writerows(
+            (emp_id, name, dept, day.isoformat(), st)
+            for emp_id, name, dept, day, st in batch
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header only, when there were no rows
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands written bytes back out in chunks."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def parquet_stream(batches):
+    """One Parquet row group per batch, bytes flushed as each one is written."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("employee_id", pa.string()),
+        ("full_name", pa.string()),
+        ("department", pa.string()),
+        ("date", pa.date32()),
+        ("status", pa.string()),
+    ])
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+
+    try:
+        for batch in batches:
+            columns = list(zip(*batch))
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(col, type=field.type) for col, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
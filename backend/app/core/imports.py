@@ -0,0 +1,156 @@
+# backend/app/core/imports.py
+
+import csv
+import json
+import time
+from typing import Iterable, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.database import chunked
+from app.models.employee import Employee
+from app.schemas.employee import CreateEmployee
+
+# Rows validated, checked for duplicates and inserted together
+IMPORT_CHUNK_SIZE = 1000
+
+# Keeps the error report bounded for badly broken files
+MAX_REPORTED_ERRORS = 1000
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+        for err in exc.errors()
+    )
+
+
+class EmployeeImporter:
+    """
+    Chunked employee import.
+
+    Feed parsed records (dicts) through `process`; each call validates the
+    chunk with CreateEmployee, drops duplicates already seen in the file or
+    present in the DB (one IN lookup per chunk), bulk-inserts the rest and
+    commits. `report()` returns the row-level errors and throughput.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.imported_ids: set[str] = set()
+        self.total_rows = 0
+        self.imported = 0
+        self.rejected = 0
+        self.errors: list[dict] = []
+        self.started = time.perf_counter()
+
+    def _reject(self, row: int, employee_id, reason: str):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({
+                "row": row,
+                "employee_id": employee_id,
+                "reason": reason,
+            })
+
+    def process(self, records: Iterable[tuple[int, dict]]):
+        valid: list[tuple[int, CreateEmployee]] = []
+
+        for row, record in records:
+            self.total_rows += 1
+
+            if not isinstance(record, dict):
+                self._reject(row, None, "Malformed record")
+                continue
+
+            try:
+                valid.append((row, CreateEmployee(**record)))
+            except ValidationError as exc:
+                self._reject(row, record.get("employee_id"), _format_validation_error(exc))
+
+        if not valid:
+            return
+
+        candidate_ids = {emp.employee_id for _, emp in valid}
+        existing = {
+            emp_id for (emp_id,) in self.db.query(Employee.employee_id).filter(
+                Employee.employee_id.in_(candidate_ids)
+            )
+        }
+
+        rows = []
+        for row, emp in valid:
+            if emp.employee_id in existing:
+                self._reject(row, emp.employee_id, "Employee with this employee_id already exists")
+            elif emp.employee_id in self.imported_ids:
+                self._reject(row, emp.employee_id, "Duplicate employee_id in file")
+            else:
+                self.imported_ids.add(emp.employee_id)
+                rows.append(emp.model_dump())
+
+        if rows:
+            # List of parameter sets → executemany
+            self.db.execute(insert(Employee), rows)
+            self.db.commit()
+            self.imported += len(rows)
+
+    def report(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "total_rows": self.total_rows,
+            "imported": self.imported,
+            "rejected": self.rejected,
+            "errors": sorted(self.errors, key=lambda e: e["row"]),
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(self.total_rows / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+
+class RecordParser:
+    """
+    Incremental CSV / NDJSON parser: feed text lines, get (row, dict) pairs.
+    CSV takes its column names from the first line.
+    """
+
+    def __init__(self, format: str):
+        self.format = format
+        self.header: list[str] | None = None
+        self.row = 0
+
+    def parse(self, lines: Iterable[str]) -> Iterator[tuple[int, dict]]:
+        for line in lines:
+            if not line.strip():
+                continue
+
+            if self.format == "ndjson":
+                self.row += 1
+                try:
+                    yield self.row, json.loads(line)
+                except json.JSONDecodeError:
+                    yield self.row, None
+                continue
+
+            values = next(csv.reader([line]))
+            if self.header is None:
+                self.header = [v.strip() for v in values]
+                continue
+
+            self.row += 1
+            yield self.row, dict(zip(self.header, values))
+
+
+def import_employee_file(db: Session, path: str, format: str | None = None) -> dict:
+    """Import a CSV/NDJSON file from disk; format defaults from the extension."""
+    if format is None:
+        format = "ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv"
+
+    importer = EmployeeImporter(db)
+    parser = RecordParser(format)
+
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        for chunk in chunked(parser.parse(fh), IMPORT_CHUNK_SIZE):
+            importer.process(chunk)
+
+    return importer.report()
@@ -0,0 +1,441 @@
+# backend/app/core/jobs.py
+
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import secrets
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+
+# Job state (<id>.json) and results live here; any API worker on the host
+# can answer status polls and downloads from it
+JOBS_DIR = os.getenv("JOBS_DIR", "./job_results")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# Queued + running jobs per API worker; further submissions get a 503
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "16"))
+# Seconds a finished result is served (and identical submissions reuse it)
+JOB_RESULT_TTL = int(os.getenv("JOB_RESULT_TTL", "3600"))
+
+# Seconds between progress writes from a running job
+PROGRESS_INTERVAL = 0.5
+
+# Seconds between sweeps for expired results (done on submit)
+PURGE_INTERVAL = 60
+
+ACTIVE = ("queued", "running")
+
+_JOB_ID = re.compile(r"^[0-9a-f]{24}$")
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+# ----------------------------
+# Job kinds (run inside pool processes)
+# ----------------------------
+def _dates(params: dict):
+    return tuple(
+        date.fromisoformat(params[k]) if params.get(k) else None
+        for k in ("start_date", "end_date")
+    )
+
+
+def _attendance_export(params: dict, out, progress):
+    from app.core.database import SessionLocal
+    from app.core.exports import attendance_batches, attendance_count, csv_stream, parquet_stream
+
+    start_date, end_date = _dates(params)
+    department = params.get("department")
+    encode = parquet_stream if params["format"] == "parquet" else csv_stream
+
+    db = SessionLocal()
+    try:
+        total = attendance_count(db, start_date, end_date, department)
+        done = 0
+        progress(done, total)
+
+        def counted(batches):
+            nonlocal done
+            for batch in batches:
+                yield batch
+                done += len(batch)
+                progress(done, total)
+
+        for chunk in encode(counted(attendance_batches(db, start_date, end_date, department))):
+            out.write(chunk.encode() if isinstance(chunk, str) else chunk)
+    finally:
+        db.close()
+
+
+def _attendance_monthly(params: dict, out, progress):
+    from app.core.database import SessionLocal
+    from app.core.reports import monthly_matrix
+    from app.core.serialization import dumps
+
+    start_date, end_date = _dates(params)
+
+    db = SessionLocal()
+    try:
+        done = 0
+        for row in monthly_matrix(db, start_date, end_date, params["group_by"]):
+            out.write(dumps(row) + b"\n")
+            done += 1
+            progress(done, None)
+        progress(done, done)
+    finally:
+        db.close()
+
+
+def _export_format(params: dict) -> tuple[str, str]:
+    if params["format"] == "parquet":
+        return "parquet", "application/vnd.apache.parquet"
+    return "csv", "text/csv"
+
+
+# kind → (runner, params → (file extension, media type))
+JOB_KINDS = {
+    "attendance_export": (_attendance_export, _export_format),
+    "attendance_monthly": (_attendance_monthly, lambda params: ("ndjson", "application/x-ndjson")),
+}
+
+
+# ----------------------------
+# State files
+# ----------------------------
+def job_key(kind: str, params: dict) -> str:
+    """Identical requests get the same id; that is the deduplication."""
+    canonical = json.dumps({"kind": kind, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:24]
+
+
+def _state_path(directory: str, job_id: str) -> str:
+    return os.path.join(directory, f"{job_id}.json")
+
+
+def _read_state(directory: str, job_id: str) -> dict | None:
+    try:
+        with open(_state_path(directory, job_id)) as fh:
+            return json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _temp_path(path: str) -> str:
+    """Unique per writer (process and thread), renamed over `path` when complete."""
+    return f"{path}.{os.getpid()}.{secrets.token_hex(4)}.tmp"
+
+
+def _write_state(directory: str, state: dict):
+    """Atomic replace, so readers never see a half-written file."""
+    path = _state_path(directory, state["id"])
+    tmp = _temp_path(path)
+    with open(tmp, "w") as fh:
+        json.dump(state, fh)
+    os.replace(tmp, path)
+
+
+def _update_state(directory: str, job_id: str, **changes) -> dict:
+    state = {**(_read_state(directory, job_id) or {"id": job_id}), **changes}
+    _write_state(directory, state)
+    return state
+
+
+def _alive(pid: int | None) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _claim_path(directory: str, job_id: str) -> str:
+    return os.path.join(directory, f"{job_id}.claim")
+
+
+def _claim_pid(path: str) -> int | None:
+    try:
+        with open(path) as fh:
+            return int(fh.read())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _claim(directory: str, job_id: str) -> bool:
+    """
+    Claim `job_id` for this process, across every API worker on the host.
+    The claim file holds the claimer's pid and is released once the job
+    has finished; one left by a process that died is taken over.
+    """
+    path = _claim_path(directory, job_id)
+    tmp = _temp_path(path)
+    with open(tmp, "w") as fh:
+        fh.write(str(os.getpid()))
+
+    try:
+        for _ in range(2):
+            try:
+                # Fails if the claim exists, like O_EXCL, and is never
+                # seen half-written
+                os.link(tmp, path)
+                return True
+            except FileExistsError:
+                if _alive(_claim_pid(path)):
+                    return False
+
+            # Stale: move it aside first, so only one worker takes it over
+            stale = _temp_path(path)
+            try:
+                os.rename(path, stale)
+            except FileNotFoundError:
+                continue
+            if _alive(_claim_pid(stale)):
+                # A fresh claim replaced the stale one in between; restore it
+                try:
+                    os.link(stale, path)
+                except FileExistsError:
+                    pass
+                os.remove(stale)
+                return False
+            os.remove(stale)
+        return False
+    finally:
+        os.remove(tmp)
+
+
+def _release(directory: str, job_id: str):
+    path = _claim_path(directory, job_id)
+    if _claim_pid(path) == os.getpid():
+        os.remove(path)
+
+
+def _run(directory: str, job_id: str, kind: str, params: dict):
+    """Pool process entry point: runs one job, writing state as it goes."""
+    runner, result_format = JOB_KINDS[kind]
+    extension, _ = result_format(params)
+    result = os.path.join(directory, f"{job_id}.{extension}")
+    partial = _temp_path(result)
+
+    _update_state(directory, job_id, status="running", pid=os.getpid(), started_at=time.time())
+
+    last_write = 0.0
+
+    def progress(done: int, total: int | None):
+        nonlocal last_write
+        now = time.monotonic()
+        if now - last_write >= PROGRESS_INTERVAL or done == total:
+            _update_state(directory, job_id, progress={"done": done, "total": total})
+            last_write = now
+
+    try:
+        with open(partial, "wb") as out:
+            runner(params, out, progress)
+        os.replace(partial, result)
+    except Exception as exc:
+        if os.path.exists(partial):
+            os.remove(partial)
+        _update_state(
+            directory, job_id,
+            status="failed", finished_at=time.time(), error=f"{type(exc).__name__}: {exc}",
+        )
+        return
+
+    _update_state(
+        directory, job_id,
+        status="done", finished_at=time.time(), size=os.path.getsize(result),
+    )
+
+
+# ----------------------------
+# Manager (API side)
+# ----------------------------
+class JobManager:
+    """
+    Runs report/export jobs on a process pool, off the request threads.
+
+    - submit() returns at once; identical requests share one job id, and a
+      finished result is reused until it is JOB_RESULT_TTL seconds old
+    - a claim file per job lets only one API worker on the host start it
+    - at most `queue_size` jobs are queued or running per API worker
+    - state and results are files, so no broker is needed
+    """
+
+    def __init__(
+        self,
+        directory: str = JOBS_DIR,
+        workers: int = JOB_WORKERS,
+        queue_size: int = JOB_QUEUE_SIZE,
+        ttl: int = JOB_RESULT_TTL,
+    ):
+        self.directory = directory
+        self.workers = workers
+        self.queue_size = queue_size
+        self.ttl = ttl
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            os.makedirs(self.directory, exist_ok=True)
+            # spawn: children get a fresh engine instead of the parent's sockets
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def submit(self, kind: str, params: dict) -> dict:
+        job_id = job_key(kind, params)
+
+        if time.monotonic() - self._last_purge >= PURGE_INTERVAL:
+            self._last_purge = time.monotonic()
+            self.purge_expired()
+
+        with self._lock:
+            state = self.get(job_id)
+            if state is not None and state["status"] in (*ACTIVE, "done"):
+                return state
+
+            if len(self._pending) >= self.queue_size:
+                raise JobQueueFull()
+
+            executor = self._pool()
+            queued = {
+                "id": job_id,
+                "kind": kind,
+                "params": params,
+                "status": "queued",
+                "pid": os.getpid(),
+                "progress": {"done": 0, "total": None},
+                "created_at": time.time(),
+            }
+
+            if not _claim(self.directory, job_id):
+                # Another API worker is starting or running it
+                state = self.get(job_id)
+                return state if state is not None and state["status"] in ACTIVE else queued
+
+            # It may have run start to finish since the check above
+            state = self.get(job_id)
+            if state is not None and state["status"] in (*ACTIVE, "done"):
+                _release(self.directory, job_id)
+                return state
+
+            state = queued
+            _write_state(self.directory, state)
+
+            try:
+                future = executor.submit(_run, self.directory, job_id, kind, params)
+            except Exception:
+                _release(self.directory, job_id)
+                raise
+            self._pending.add(job_id)
+
+        future.add_done_callback(lambda f: self._finished(job_id, f))
+        return state
+
+    def _finished(self, job_id: str, future):
+        with self._lock:
+            self._pending.discard(job_id)
+            # A killed pool process breaks the whole pool; start a fresh one
+            # on the next submit (jobs still queued on it fail below)
+            if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+                self._executor = None
+
+        # The pool process died (or was cancelled) before recording an outcome
+        state = _read_state(self.directory, job_id)
+        if state is not None and state["status"] in ACTIVE:
+            error = "cancelled" if future.cancelled() else repr(future.exception())
+            _update_state(
+                self.directory, job_id,
+                status="failed", finished_at=time.time(), error=error,
+            )
+
+        _release(self.directory, job_id)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def get(self, job_id: str) -> dict | None:
+        if not _JOB_ID.match(job_id):
+            return None
+
+        state = _read_state(self.directory, job_id)
+        if state is None:
+            return None
+
+        finished_at = state.get("finished_at")
+        expired = finished_at is not None and time.time() - finished_at > self.ttl
+        missing = state["status"] == "done" and not os.path.exists(self.result(state)[0])
+        if expired or missing:
+            self._remove(state)
+            return None
+
+        if state["status"] in ACTIVE and not _alive(state.get("pid")):
+            # Its API worker or pool process is gone; allow a resubmit
+            state = _update_state(
+                self.directory, job_id,
+                status="failed", finished_at=time.time(), error="Job runner exited",
+            )
+
+        if state.get("finished_at") is not None:
+            state["expires_at"] = state["finished_at"] + self.ttl
+
+        return state
+
+    def result(self, state: dict) -> tuple[str, str, str]:
+        """(path, media type, download filename) of a finished job."""
+        _, result_format = JOB_KINDS[state["kind"]]
+        extension, media_type = result_format(state["params"])
+        path = os.path.join(self.directory, f"{state['id']}.{extension}")
+        return path, media_type, f"{state['kind']}-{state['id'][:8]}.{extension}"
+
+    def _remove(self, state: dict):
+        result = self.result(state)[0]
+        for path in (result, _state_path(self.directory, state["id"])):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired results; get() also does this lazily per job. Temp
+        files older than the TTL were left by processes that died mid-write.
+        """
+        if not os.path.isdir(self.directory):
+            return 0
+
+        removed = 0
+        for name in os.listdir(self.directory):
+            job_id, ext = os.path.splitext(name)
+            if ext == ".json" and _read_state(self.directory, job_id) is not None:
+                removed += self.get(job_id) is None
+            elif ext == ".tmp":
+                path = os.path.join(self.directory, name)
+                try:
+                    if time.time() - os.path.getmtime(path) > self.ttl:
+                        os.remove(path)
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+job_manager = JobManager()
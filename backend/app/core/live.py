@@ -0,0 +1,205 @@
+# backend/app/core/live.py
+
+import asyncio
+import json
+import os
+from collections import defaultdict
+from datetime import date
+from urllib.parse import urlparse
+
+# "memory" (subscribers of this worker only) or "tcp://127.0.0.1:8765" to fan
+# out across workers through `python -m app.cli events-broker`
+EVENTS_URL = os.getenv("EVENTS_URL", "memory")
+
+# Events buffered per subscriber; a client that falls further behind is
+# sent `resync` instead of the backlog
+EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", "256"))
+
+# Comment line sent on idle streams so proxies keep them open
+HEARTBEAT_SECONDS = 15
+
+RESYNC = "event: resync\ndata: {}\n\n"
+
+
+def sse_frame(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class LiveHub:
+    """
+    In-process pub/sub for the dashboard live feed.
+
+    publish() is O(1) for the writer and safe from any thread: it hands the
+    event to the event loop, which copies it into each subscriber's bounded
+    queue. An idle subscriber is one parked coroutine and an empty queue.
+    """
+
+    def __init__(self):
+        self._subscribers: set[asyncio.Queue] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._broker: "BrokerLink | None" = None
+        self.stats = {"published": 0, "dropped": 0}
+
+    # ----------------------------
+    # Lifecycle
+    # ----------------------------
+    async def start(self, url: str = EVENTS_URL):
+        self._loop = asyncio.get_running_loop()
+
+        if url.startswith("tcp://"):
+            parsed = urlparse(url)
+            self._broker = BrokerLink(self, parsed.hostname, parsed.port)
+            self._broker.start()
+
+    async def stop(self):
+        if self._broker is not None:
+            await self._broker.stop()
+            self._broker = None
+
+    # ----------------------------
+    # Subscribers
+    # ----------------------------
+    def subscribe(self) -> asyncio.Queue:
+        self._loop = self._loop or asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=EVENTS_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    # ----------------------------
+    # Publish / deliver
+    # ----------------------------
+    def publish(self, event: str, data: dict):
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        if self._broker is None and not self._subscribers:
+            return
+
+        self.stats["published"] += 1
+        message = json.dumps({"event": event, "data": data}, default=str)
+
+        if self._broker is not None:
+            loop.call_soon_threadsafe(self._broker.send, message)
+        else:
+            loop.call_soon_threadsafe(self.deliver, message)
+
+    def deliver(self, message: str):
+        """Runs on the event loop; the frame is encoded once for everyone."""
+        decoded = json.loads(message)
+        frame = sse_frame(decoded["event"], decoded["data"])
+
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                # Slow client: drop its backlog, it must refetch the snapshot
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+                self.stats["dropped"] += 1
+
+
+class BrokerLink:
+    """
+    This worker's connection to the events broker. Every published message
+    goes to the broker, which echoes it to all workers (this one included).
+    Reconnects in the background; while the broker is down, messages are
+    delivered to local subscribers only.
+    """
+
+    def __init__(self, hub: LiveHub, host: str, port: int):
+        self.hub = hub
+        self.host = host
+        self.port = port
+        self._writer: asyncio.StreamWriter | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def send(self, message: str):
+        if self._writer is None or self._writer.is_closing():
+            self.hub.deliver(message)
+            return
+        self._writer.write(message.encode() + b"\n")
+
+    async def _run(self):
+        while True:
+            try:
+                reader, self._writer = await asyncio.open_connection(self.host, self.port)
+                async for line in reader:
+                    self.hub.deliver(line.decode())
+            except OSError:
+                pass
+            finally:
+                if self._writer is not None:
+                    self._writer.close()
+                self._writer = None
+
+            await asyncio.sleep(1)
+
+
+async def run_broker(host: str, port: int):
+    """
+    Stand-in for a real message broker: relays every line from any worker
+    to all connected workers. One process per host, no persistence.
+    """
+    clients: set[asyncio.StreamWriter] = set()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        clients.add(writer)
+        try:
+            async for line in reader:
+                for client in list(clients):
+                    client.write(line)
+        except ConnectionError:
+            pass
+        finally:
+            clients.discard(writer)
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+live_hub = LiveHub()
+
+
+# ----------------------------
+# Dashboard deltas
+# ----------------------------
+def publish_attendance(changes):
+    """
+    Per-date present/absent deltas, from the same (date, department, status,
+    delta) changes fed to apply_attendance_deltas. Call after commit.
+    """
+    per_day: dict[date, dict[str, int]] = defaultdict(lambda: {"present": 0, "absent": 0})
+
+    for day, _, status, delta in changes:
+        per_day[day]["present" if status == "Present" else "absent"] += delta
+
+    for day in sorted(per_day):
+        counts = per_day[day]
+        if counts["present"] or counts["absent"]:
+            live_hub.publish("attendance", {"date": day.isoformat(), **counts})
+
+
+def publish_employees(delta: int):
+    if delta:
+        live_hub.publish("employees", {"delta": delta})
@@ -0,0 +1,113 @@
+# backend/app/core/maintenance.py
+
+from sqlalchemy.orm import Session
+
+from app.core.database import engine as default_engine
+from app.core.event_log import log_started, log_table_rows
+from app.models.attendance import Attendance, AttendanceArchive
+from app.models.attendance_daily import AttendanceDaily
+from app.models.employee import Employee
+
+# PRAGMA user_version once a SQLite database has been cleared of orphans
+ORPHANS_CLEARED_VERSION = 1
+
+
+def database_bytes(engine) -> int:
+    """Size of the database as the backend accounts it (pages in use + free)."""
+    with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            return conn.exec_driver_sql(
+                "SELECT pg_database_size(current_database())"
+            ).scalar()
+
+        page_count = conn.exec_driver_sql("PRAGMA page_count").scalar()
+        page_size = conn.exec_driver_sql("PRAGMA page_size").scalar()
+        return page_count * page_size
+
+
+def delete_orphans(db: Session) -> dict[str, int]:
+    """
+    Attendance whose employee is gone (left behind while SQLite ran without
+    foreign keys), and aggregate rows that no longer count anything.
+    """
+    removed = {}
+
+    # Before the log starts, backfill_event_log records whatever is left
+    logged = log_started(db)
+
+    for table in (Attendance, AttendanceArchive):
+        has_employee = db.query(Employee.id).filter(
+            Employee.employee_id == table.employee_id
+        ).exists()
+        if logged:
+            log_table_rows(db, table, ~has_employee, source="compact", removed=True)
+        removed[table.__tablename__] = db.query(table).filter(
+            ~has_employee
+        ).delete(synchronize_session=False)
+
+    removed[AttendanceDaily.__tablename__] = db.query(AttendanceDaily).filter(
+        AttendanceDaily.total <= 0
+    ).delete(synchronize_session=False)
+
+    db.commit()
+    return removed
+
+
+def clear_orphans_once(engine) -> dict[str, int] | None:
+    """
+    delete_orphans, once per SQLite database and before anything that needs
+    foreign keys to hold (the status rebuild, archiving). Orphans predate
+    enforcement, so later runs skip the scan; `compact` still catches rows
+    left while SQLITE_FOREIGN_KEYS was OFF. None when skipped.
+    """
+    if engine.dialect.name != "sqlite":
+        return None
+
+    with engine.connect() as conn:
+        if conn.exec_driver_sql("PRAGMA user_version").scalar() >= ORPHANS_CLEARED_VERSION:
+            return None
+
+    db = Session(bind=engine)
+    try:
+        removed = delete_orphans(db)
+    finally:
+        db.close()
+
+    with engine.connect() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {ORPHANS_CLEARED_VERSION}")
+
+    return removed
+
+
+def vacuum(engine):
+    """Return free pages to the filesystem; needs a connection outside any transaction."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql("VACUUM ANALYZE")
+            return
+
+        conn.exec_driver_sql("VACUUM")
+        conn.exec_driver_sql("ANALYZE")
+        if conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal":
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def compact_database(engine=default_engine) -> dict:
+    """Delete orphaned rows, then VACUUM. Reports rows and bytes freed."""
+    bytes_before = database_bytes(engine)
+
+    db = Session(bind=engine)
+    try:
+        rows_deleted = delete_orphans(db)
+    finally:
+        db.close()
+
+    vacuum(engine)
+    bytes_after = database_bytes(engine)
+
+    return {
+        "rows_deleted": rows_deleted,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_freed": bytes_before - bytes_after,
+    }
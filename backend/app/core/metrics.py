@@ -0,0 +1,194 @@
+# backend/app/core/metrics.py
+
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Log statements slower than this (ms) with their query plan; unset = off
+SLOW_QUERY_MS = os.getenv("SLOW_QUERY_MS")
+
+slow_query_log = logging.getLogger("hrms.slow_query")
+
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+QUERY_COUNT_BUCKETS = [0, 1, 2, 3, 5, 10, 25, 50, 100]
+
+# Per-request DB counters; the dict is shared with threadpool/greenlet
+# workers because they run in a copy of the request's context
+_request_db: ContextVar[dict | None] = ContextVar("request_db", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets: list[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency: dict[tuple, Histogram] = {}
+        self.queries: dict[tuple, Histogram] = {}
+        self.db_seconds: dict[tuple, float] = defaultdict(float)
+        self.responses: dict[tuple, int] = defaultdict(int)
+
+    def observe(self, method: str, route: str, status: int, seconds: float, db: dict):
+        key = (method, route)
+        with self._lock:
+            self.latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+            self.queries.setdefault(key, Histogram(QUERY_COUNT_BUCKETS)).observe(db["queries"])
+            self.db_seconds[key] += db["seconds"]
+            self.responses[(method, route, status)] += 1
+
+    def render(self, extra: dict[str, float] | None = None) -> str:
+        """Prometheus text exposition format."""
+        lines = []
+
+        def labels(method, route, **more):
+            pairs = {"method": method, "route": route, **more}
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs.items()) + "}"
+
+        def histogram(name, help_text, series):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for (method, route), hist in sorted(series.items()):
+                cumulative = 0
+                for bound, count in zip([*hist.buckets, "+Inf"], hist.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{labels(method, route, le=bound)} {cumulative}")
+                lines.append(f"{name}_sum{labels(method, route)} {hist.sum}")
+                lines.append(f"{name}_count{labels(method, route)} {hist.count}")
+
+        with self._lock:
+            histogram(
+                "hrms_request_duration_seconds",
+                "Request latency by route",
+                self.latency,
+            )
+            histogram(
+                "hrms_request_sql_statements",
+                "SQL statements executed per request",
+                self.queries,
+            )
+
+            lines.append("# HELP hrms_request_db_seconds_total Time spent in SQL by route")
+            lines.append("# TYPE hrms_request_db_seconds_total counter")
+            for (method, route), seconds in sorted(self.db_seconds.items()):
+                lines.append(f"hrms_request_db_seconds_total{labels(method, route)} {seconds}")
+
+            lines.append("# HELP hrms_responses_total Responses by route and status")
+            lines.append("# TYPE hrms_responses_total counter")
+            for (method, route, status), count in sorted(self.responses.items()):
+                lines.append(f"hrms_responses_total{labels(method, route, status=status)} {count}")
+
+        for name, value in (extra or {}).items():
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+# ----------------------------
+# SQL statement timing
+# ----------------------------
+def _explain(cursor, statement: str, parameters) -> str:
+    dialect_prefix = "EXPLAIN QUERY PLAN " if "sqlite" in type(cursor).__module__ else "EXPLAIN "
+    plan_cursor = cursor.connection.cursor()
+    try:
+        plan_cursor.execute(dialect_prefix + statement, parameters)
+        return "\n".join(" | ".join(str(col) for col in row) for row in plan_cursor.fetchall())
+    except Exception as exc:  # plan is best-effort diagnostics
+        return f"<no plan: {exc}>"
+    finally:
+        plan_cursor.close()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+
+    stats = _request_db.get()
+    if stats is not None:
+        stats["queries"] += 1
+        stats["seconds"] += elapsed
+
+    if SLOW_QUERY_MS is not None and elapsed * 1000 >= float(SLOW_QUERY_MS):
+        plan = "" if executemany else _explain(cursor, statement, parameters)
+        slow_query_log.warning(
+            "slow query %.1f ms\n%s\nparams: %.300s\nplan:\n%s",
+            elapsed * 1000, statement, repr(parameters), plan,
+        )
+
+
+# ----------------------------
+# Request middleware
+# ----------------------------
+class MetricsMiddleware:
+    """
+    Plain ASGI middleware: nothing is buffered or wrapped in extra tasks,
+    which keeps long-lived streams (SSE, exports) as cheap as without it.
+    A request is observed when its response headers go out.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = {"queries": 0, "seconds": 0.0}
+        token = _request_db.set(stats)
+        started = time.perf_counter()
+
+        async def send_observed(message):
+            if message["type"] == "http.response.start":
+                self._observe(scope, message, started, stats)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_observed)
+        finally:
+            _request_db.reset(token)
+
+    @staticmethod
+    def _observe(scope, message, started: float, stats: dict):
+        # Route template (/attendance/{employee_id}), not the raw path.
+        # Cache hits never reach the router; cached routes are static paths.
+        route = scope.get("route")
+        if route is not None:
+            path = route.path
+        elif any(name == b"x-cache" for name, _ in message.get("headers", ())):
+            path = scope["path"]
+        else:
+            path = "<unmatched>"
+
+        registry.observe(
+            scope["method"],
+            path,
+            message["status"],
+            time.perf_counter() - started,
+            stats,
+        )
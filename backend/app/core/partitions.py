@@ -0,0 +1,95 @@
+# backend/app/core/partitions.py
+
+import os
+from datetime import date, timedelta
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance, AttendanceArchive, AttendanceHistory
+
+# Attendance older than this many days is moved to attendance_archive by
+# `python -m app.cli archive-attendance`; unset keeps everything in one table.
+# Keep it set once rows have been archived, or they drop out of reads.
+_hot_days = os.getenv("ATTENDANCE_HOT_DAYS")
+ATTENDANCE_HOT_DAYS = int(_hot_days) if _hot_days else None
+
+HISTORY_VIEW = "attendance_history"
+
+ATTENDANCE_COLUMNS = ["id", "employee_id", "date", "status"]
+
+
+def partitioning_enabled() -> bool:
+    return ATTENDANCE_HOT_DAYS is not None
+
+
+def hot_cutoff(today: date | None = None) -> date | None:
+    """Oldest date guaranteed to still be in the hot table."""
+    if not partitioning_enabled():
+        return None
+    return (today or date.today()) - timedelta(days=ATTENDANCE_HOT_DAYS)
+
+
+def is_archived(day: date) -> bool:
+    """Dates before the cutoff may live in the archive and are read-only."""
+    cutoff = hot_cutoff()
+    return cutoff is not None and day < cutoff
+
+
+def attendance_source(start_date: date | None = None):
+    """
+    Model to read attendance from for rows on or after `start_date`.
+
+    Archiving only ever moves rows older than its own cutoff, and the cutoff
+    only moves forward, so a range starting at or after today's cutoff is
+    entirely in the hot table. Anything older reads the history view.
+    No query is needed to decide.
+    """
+    cutoff = hot_cutoff()
+    if cutoff is None or (start_date is not None and start_date >= cutoff):
+        return Attendance
+    return AttendanceHistory
+
+
+# ----------------------------
+# Maintenance
+# ----------------------------
+def ensure_history_view(engine):
+    """(Re)create the history view; cheap, it holds no data."""
+    columns = ", ".join(ATTENDANCE_COLUMNS)
+    body = (
+        f"SELECT {columns} FROM {Attendance.__tablename__} "
+        f"UNION ALL SELECT {columns} FROM {AttendanceArchive.__tablename__}"
+    )
+
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql(f"CREATE OR REPLACE VIEW {HISTORY_VIEW} AS {body}")
+        else:
+            conn.exec_driver_sql(f"CREATE VIEW IF NOT EXISTS {HISTORY_VIEW} AS {body}")
+
+
+def drop_history_view(conn):
+    conn.exec_driver_sql(f"DROP VIEW IF EXISTS {HISTORY_VIEW}")
+
+
+def archive_attendance(db: Session, before: date | None = None) -> int:
+    """
+    Move attendance older than `before` (default: the hot cutoff) into the
+    archive in one transaction. Returns the number of rows moved.
+    """
+    before = before or hot_cutoff()
+    if before is None:
+        return 0
+
+    old = select(
+        *(getattr(Attendance, c) for c in ATTENDANCE_COLUMNS)
+    ).where(Attendance.date < before)
+
+    moved = db.execute(
+        insert(AttendanceArchive).from_select(ATTENDANCE_COLUMNS, old)
+    ).rowcount
+    db.execute(delete(Attendance).where(Attendance.date < before))
+    db.commit()
+
+    return moved
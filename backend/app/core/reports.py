@@ -0,0 +1,194 @@
+# backend/app/core/reports.py
+
+from datetime import date
+from itertools import groupby
+
+from sqlalchemy import func, case, and_, select
+from sqlalchemy.orm import Session
+
+from app.core.partitions import attendance_source
+from app.models.employee import Employee
+from app.models.attendance import Attendance
+
+
+def attendance_totals(source=Attendance):
+    """total / present columns for a single SUM(CASE…) pass."""
+    return (
+        func.count(source.id).label("total"),
+        func.coalesce(
+            func.sum(case((source.status == "Present", 1), else_=0)),
+            0,
+        ).label("present"),
+    )
+
+
+def month_bucket(db: Session, column):
+    """'YYYY-MM' for a date column on the active backend."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.to_char(column, "YYYY-MM")
+    return func.strftime("%Y-%m", column)
+
+
+def date_range(start_date: date | None, end_date: date | None, source=Attendance) -> list:
+    conditions = []
+    if start_date:
+        conditions.append(source.date >= start_date)
+    if end_date:
+        conditions.append(source.date <= end_date)
+    return conditions
+
+
+def summarize(total: int, present: int) -> dict:
+    return {
+        "total": total,
+        "present": present,
+        "absent": total - present,
+        "present_percentage": round(
+            (present / total) * 100 if total > 0 else 0, 2
+        ),
+    }
+
+
+def employee_attendance_counts(
+    db: Session,
+    employee_id: str,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    by_month: bool = False,
+):
+    """
+    Attendance totals for one employee in ONE statement.
+
+    employees LEFT JOIN attendance (range in the ON clause), so:
+    - no rows at all        → employee does not exist, returns None
+    - row with total == 0   → employee exists, no attendance in range
+
+    With `by_month` the result is one row per month instead of one row.
+    """
+    source = attendance_source(start_date)
+    total, present = attendance_totals(source)
+    columns = [total, present]
+    group_by = [Employee.employee_id]
+
+    if by_month:
+        month = month_bucket(db, source.date).label("month")
+        columns.insert(0, month)
+        group_by.append(month)
+
+    query = (
+        db.query(*columns)
+        .select_from(Employee)
+        .outerjoin(
+            source,
+            and_(
+                source.employee_id == Employee.employee_id,
+                *date_range(start_date, end_date, source),
+            ),
+        )
+        .filter(Employee.employee_id == employee_id)
+        .group_by(*group_by)
+    )
+
+    if by_month:
+        rows = query.order_by("month").all()
+        if not rows:
+            return None
+        # LEFT JOIN with no matches yields a single NULL-month row
+        return [r for r in rows if r.month is not None]
+
+    return query.first()
+
+
+def organization_attendance_counts(
+    db: Session,
+    start_date: date | None = None,
+    end_date: date | None = None,
+):
+    source = attendance_source(start_date)
+    total, present = attendance_totals(source)
+    return db.query(total, present).filter(*date_range(start_date, end_date, source)).one()
+
+
+def monthly_matrix(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    group_by: str = "employee",
+    batch_size: int = 1000,
+):
+    """
+    Month × employee (or month × department) totals in one grouped query.
+    Yields summary dicts as rows come off the cursor, so memory stays flat
+    regardless of headcount.
+    """
+    source = attendance_source(start_date)
+    month = month_bucket(db, source.date).label("month")
+    total, present = attendance_totals(source)
+
+    if group_by == "department":
+        keys = [Employee.department]
+    else:
+        keys = [Employee.employee_id, Employee.full_name, Employee.department]
+
+    stmt = (
+        select(month, *keys, total, present)
+        .join(Employee, Employee.employee_id == source.employee_id)
+        .where(*date_range(start_date, end_date, source))
+        .group_by(month, *keys)
+        .order_by(month, keys[0])
+        .execution_options(yield_per=batch_size)
+    )
+
+    for row in db.execute(stmt):
+        data = row._asdict()
+        summary = summarize(data.pop("total"), data.pop("present"))
+
+        yield {
+            **data,
+            "total_days": summary["total"],
+            "present_days": summary["present"],
+            "absent_days": summary["absent"],
+            "present_percentage": summary["present_percentage"],
+        }
+
+
+def status_matrix(
+    db: Session,
+    department: str,
+    start_date: date,
+    end_date: date,
+    batch_size: int = 5000,
+):
+    """
+    Employee × day grid for one department, one char per day:
+    P(resent), A(bsent) or - (not marked), as on the calendar endpoint.
+
+    ONE ordered scan: employees LEFT JOIN attendance (range in the ON clause)
+    ordered by (employee_id, date), which the composite attendance index
+    serves directly. Yields (employee_id, full_name, days) per employee,
+    including employees with nothing marked.
+    """
+    source = attendance_source(start_date)
+    days = (end_date - start_date).days + 1
+
+    stmt = (
+        select(Employee.employee_id, Employee.full_name, source.date, source.status)
+        .select_from(Employee)
+        .outerjoin(
+            source,
+            and_(
+                source.employee_id == Employee.employee_id,
+                *date_range(start_date, end_date, source),
+            ),
+        )
+        .where(Employee.department == department)
+        .order_by(Employee.employee_id, source.date)
+        .execution_options(yield_per=batch_size)
+    )
+
+    for (emp_id, name), rows in groupby(db.execute(stmt), key=lambda r: (r[0], r[1])):
+        cells = bytearray(b"-" * days)
+        for _, _, day, status in rows:
+            if day is not None:
+                cells[(day - start_date).days] = ord(status[0])
+        yield emp_id, name, cells.decode()
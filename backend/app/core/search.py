@@ -0,0 +1,154 @@
+# backend/app/core/search.py
+
+import re
+
+from sqlalchemy import or_, select, text, literal_column, table
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query
+
+from app.models.employee import Employee
+
+# SQLite FTS5 index over the searchable employee columns.
+# External-content table: rows live in `employees`, triggers keep it in sync.
+FTS_TABLE = "employees_fts"
+
+# bm25 weights per column: employee_id, full_name, email, department
+FTS_RANK = f"bm25({FTS_TABLE}, 10.0, 5.0, 2.0, 1.0)"
+
+_FTS_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        employee_id, full_name, email, department,
+        content='employees', content_rowid='id'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON employees BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, employee_id, full_name, email, department)
+        VALUES (new.id, new.employee_id, new.full_name, new.email, new.department);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON employees BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, employee_id, full_name, email, department)
+        VALUES ('delete', old.id, old.employee_id, old.full_name, old.email, old.department);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON employees BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, employee_id, full_name, email, department)
+        VALUES ('delete', old.id, old.employee_id, old.full_name, old.email, old.department);
+        INSERT INTO {FTS_TABLE}(rowid, employee_id, full_name, email, department)
+        VALUES (new.id, new.employee_id, new.full_name, new.email, new.department);
+    END
+    """,
+]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Whether the index exists; None until checked (lazily, on first search)
+_fts_enabled: bool | None = None
+
+
+def ensure_search_index(engine: Engine) -> bool:
+    """
+    Create the FTS5 index and its sync triggers if missing.
+    Backfills from `employees` the first time it is created.
+    Returns False when the backend has no FTS5 (non-SQLite or old build).
+    """
+    global _fts_enabled
+
+    if engine.dialect.name != "sqlite":
+        _fts_enabled = False
+        return False
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        ).first()
+
+        try:
+            for ddl in _FTS_DDL:
+                conn.exec_driver_sql(ddl)
+        except Exception:
+            # SQLite compiled without FTS5
+            _fts_enabled = False
+            return False
+
+        if not exists:
+            conn.exec_driver_sql(
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+            )
+
+    _fts_enabled = True
+    return True
+
+
+def _search_index_ready(bind) -> bool:
+    """Detect an index created by another process (e.g. the bootstrap command)."""
+    global _fts_enabled
+
+    if _fts_enabled is None:
+        if bind.dialect.name != "sqlite":
+            _fts_enabled = False
+        else:
+            with bind.connect() as conn:
+                _fts_enabled = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": FTS_TABLE},
+                ).first() is not None
+
+    return _fts_enabled
+
+
+def build_match_query(term: str) -> str | None:
+    """
+    Turn free text into an FTS5 prefix query.
+    "amit sh" → "amit"* AND "sh"*
+    """
+    tokens = _TOKEN_RE.findall(term)
+    if not tokens:
+        return None
+    return " AND ".join(f'"{t}"*' for t in tokens)
+
+
+def ilike_filter(term: str):
+    """Legacy substring match, used when FTS5 is unavailable."""
+    # autoescape: a "%" or "_" in the term is matched literally
+    return or_(
+        Employee.employee_id.icontains(term, autoescape=True),
+        Employee.full_name.icontains(term, autoescape=True),
+        Employee.email.icontains(term, autoescape=True),
+        Employee.department.icontains(term, autoescape=True),
+    )
+
+
+def apply_search(query: Query, term: str, ranked: bool = True) -> tuple[Query, bool]:
+    """
+    Restrict an Employee query to rows matching `term`.
+    Returns (query, is_ranked). When ranked, best matches are ordered first
+    and callers should not impose their own primary ordering.
+    """
+    ready = _search_index_ready(query.session.get_bind())
+    match = build_match_query(term) if ready else None
+
+    if match is None:
+        return query.filter(ilike_filter(term)), False
+
+    hits = (
+        select(
+            literal_column("rowid").label("rowid"),
+            literal_column(FTS_RANK).label("score"),
+        )
+        .select_from(table(FTS_TABLE))
+        .where(text(f"{FTS_TABLE} MATCH :match").bindparams(match=match))
+        .subquery("search_hits")
+    )
+
+    query = query.join(hits, Employee.id == hits.c.rowid)
+
+    if ranked:
+        query = query.order_by(hits.c.score)
+
+    return query, ranked
@@ -1,8 +1,11 @@
 from datetime import date, timedelta
 import random
 
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
+from app.core.aggregates import rebuild_daily_aggregates
+from app.core.event_log import log_table_rows, take_snapshot
 from app.models.employee import Employee
 from app.models.attendance import Attendance
 
@@ -70,75 +73,188 @@ EMPLOYEES_DATA = [
 ]
 
 
+# Rows per INSERT executemany batch
+BATCH_SIZE = 10_000
+
+# Default seed so dev data is the same on every machine
+DEFAULT_SEED = 42
+
+FIRST_NAMES = sorted({name.split()[0] for name, _ in EMPLOYEES_DATA})
+LAST_NAMES = sorted({name.split()[-1] for name, _ in EMPLOYEES_DATA})
+
+
+def employee_code(i: int) -> str:
+    """EMP001 … EMP999, EMP1000 …; the same for i whatever the seed size."""
+    return f"EMP{i:03d}"
+
+
+def generate_employees(total: int, seed: int = DEFAULT_SEED):
+    """
+    Deterministically yield `total` employee rows (dicts).
+    The first rows use EMPLOYEES_DATA as-is, the rest combine its first and
+    last names; the same seed always produces the same people.
+    """
+    rng = random.Random(seed)
+
+    for i in range(1, total + 1):
+        if i <= len(EMPLOYEES_DATA):
+            name, email = EMPLOYEES_DATA[i - 1]
+        else:
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            name = f"{first} {last}"
+            email = f"{first.lower()}.{last.lower()}{i}@company.com"
+
+        yield {
+            "employee_id": employee_code(i),
+            "full_name": name,
+            "email": email,
+            "department": rng.choice(DEPARTMENTS),
+        }
+
+
+def _insert_batches(db: Session, table, columns: list[str], rows, batch_size: int) -> int:
+    """
+    executemany straight on the driver cursor, in the caller's transaction.
+    Rows are tuples in `columns` order, already in driver form (see
+    _driver_value); this skips per-row parameter processing in SQLAlchemy.
+    """
+    conn = db.connection()
+    compiled = insert(table).compile(dialect=conn.dialect, column_keys=columns)
+
+    # Positional placeholders follow table column order, not `columns`
+    order = [columns.index(name) for name in compiled.positiontup or ()]
+
+    def params(batch):
+        if not compiled.positional:
+            return [dict(zip(columns, row)) for row in batch]
+        if order == sorted(order):
+            return batch
+        return [tuple(row[i] for i in order) for row in batch]
+
+    inserted = 0
+    batch = []
+
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            conn.exec_driver_sql(compiled.string, params(batch))
+            inserted += len(batch)
+            batch = []
+
+    if batch:
+        conn.exec_driver_sql(compiled.string, params(batch))
+        inserted += len(batch)
+
+    return inserted
+
+
+def _driver_value(db: Session, column, value):
+    """Convert a value the way SQLAlchemy would before handing it to the driver."""
+    process = column.type.bind_processor(db.get_bind().dialect)
+    return process(value) if process else value
+
+
 # -------------------------------------------------
 # SEED EMPLOYEES
 # -------------------------------------------------
-def seed_employees(db: Session):
+def seed_employees(
+    db: Session,
+    total: int = TOTAL_EMPLOYEES,
+    seed: int = DEFAULT_SEED,
+    batch_size: int = BATCH_SIZE,
+) -> int:
     """
-    Seed exactly 50 realistic employees.
-    Safe to re-run.
+    Seed up to `total` generated employees.
+    Safe to re-run, also with a different `total`: ids and emails already
+    present are skipped.
     """
-    existing_count = db.query(Employee).count()
-    if existing_count >= TOTAL_EMPLOYEES:
-        return
-
-    employees = []
-
-    for i, (name, email) in enumerate(
-        EMPLOYEES_DATA[existing_count:TOTAL_EMPLOYEES],
-        start=existing_count + 1,
-    ):
-        emp_id = f"EMP{i:03d}"
-        employees.append(
-            Employee(
-                employee_id=emp_id,
-                full_name=name,
-                email=email,
-                department=random.choice(DEPARTMENTS),
-            )
-        )
+    existing_ids, existing_emails = set(), set()
+    for employee_id, email in db.execute(select(Employee.employee_id, Employee.email)):
+        existing_ids.add(employee_id)
+        existing_emails.add(email)
+
+    columns = ["employee_id", "full_name", "email", "department"]
 
-    db.add_all(employees)
+    inserted = _insert_batches(
+        db,
+        Employee.__table__,
+        columns,
+        (
+            tuple(e[c] for c in columns)
+            for e in generate_employees(total, seed)
+            if e["employee_id"] not in existing_ids and e["email"] not in existing_emails
+        ),
+        batch_size,
+    )
     db.commit()
 
+    return inserted
+
 
 # -------------------------------------------------
-# SEED ATTENDANCE (LAST 30 DAYS, EXCLUDING TODAY)
+# SEED ATTENDANCE (LAST N DAYS, EXCLUDING TODAY)
 # -------------------------------------------------
-def seed_attendance(db: Session, days: int = 30):
+def seed_attendance(
+    db: Session,
+    days: int = 30,
+    seed: int = DEFAULT_SEED,
+    batch_size: int = BATCH_SIZE,
+) -> int:
     """
     Seed attendance for last N days (excluding today).
+    Existing (employee, date) pairs are loaded in one query and skipped.
+    The new rows are logged as "seed" events in one INSERT … SELECT and
+    committed together with them.
     """
-    employees = db.query(Employee).all()
-    if not employees:
-        return
+    employee_ids = db.execute(
+        select(Employee.employee_id).order_by(Employee.employee_id)
+    ).scalars().all()
+    if not employee_ids:
+        return 0
 
     today = date.today()
+    dates = [today - timedelta(days=i) for i in range(1, days + 1)]
 
-    for emp in employees:
-        for i in range(1, days + 1):
-            attendance_date = today - timedelta(days=i)
+    existing = {
+        (emp_id, attendance_date)
+        for emp_id, attendance_date in db.execute(
+            select(Attendance.employee_id, Attendance.date).where(
+                Attendance.date >= dates[-1],
+                Attendance.date <= dates[0],
+            )
+        )
+    }
 
-            exists = db.query(Attendance).filter(
-                Attendance.employee_id == emp.employee_id,
-                Attendance.date == attendance_date,
-            ).first()
+    # Dates and statuses repeat for every employee, convert each one once
+    driver_dates = [_driver_value(db, Attendance.date, d) for d in dates]
+    present_code = _driver_value(db, Attendance.status, "Present")
+    absent_code = _driver_value(db, Attendance.status, "Absent")
+    rng = random.Random(seed)
 
-            if exists:
-                continue
+    def rows():
+        for emp_id in employee_ids:
+            for attendance_date, driver_date in zip(dates, driver_dates):
+                # Draw for every pair so output does not depend on what exists
+                present = rng.random() < 0.75
+                if (emp_id, attendance_date) in existing:
+                    continue
+                yield (emp_id, driver_date, present_code if present else absent_code)
 
-            status = "Present" if random.random() < 0.75 else "Absent"
+    last_id = db.execute(select(func.max(Attendance.id))).scalar() or 0
 
-            db.add(
-                Attendance(
-                    employee_id=emp.employee_id,
-                    date=attendance_date,
-                    status=status,
-                )
-            )
+    inserted = _insert_batches(
+        db,
+        Attendance.__table__,
+        ["employee_id", "date", "status"],
+        rows(),
+        batch_size,
+    )
 
+    log_table_rows(db, Attendance, Attendance.id > last_id, source="seed")
     db.commit()
 
+    return inserted
+
 
 # -------------------------------------------------
 # SEED TODAY (ALL EMPLOYEES UNMARKED)
@@ -150,6 +266,7 @@ def seed_today_unmarked(db: Session):
     """
     today = date.today()
 
+    log_table_rows(db, Attendance, Attendance.date == today, source="clear", removed=True)
     db.query(Attendance).filter(
         Attendance.date == today
     ).delete()
@@ -160,7 +277,16 @@ def seed_today_unmarked(db: Session):
 # -------------------------------------------------
 # MASTER SEED
 # -------------------------------------------------
-def run_seed(db: Session):
-    seed_employees(db)
-    seed_attendance(db, days=30)
+def run_seed(
+    db: Session,
+    employees: int = TOTAL_EMPLOYEES,
+    days: int = 30,
+    seed: int = DEFAULT_SEED,
+):
+    seed_employees(db, total=employees, seed=seed)
+    seed_attendance(db, days=days, seed=seed)
     seed_today_unmarked(db)
+
+    # Seeding writes rows directly, refresh the derived aggregates
+    rebuild_daily_aggregates(db)
+    take_snapshot(db)
@@ -0,0 +1,43 @@
+# backend/app/core/serialization.py
+
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Sequence
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback, same output
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(Response):
+    """JSON response encoded with orjson when installed."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def rows_response(rows: Iterable[Sequence], columns: Sequence[str]) -> FastJSONResponse:
+    """
+    Core result rows straight to a JSON array of objects.
+
+    Skips the per-row Pydantic model FastAPI builds for `response_model`,
+    so routes returning this must select exactly the schema's fields; the
+    route keeps `response_model` for the OpenAPI schema.
+    """
+    return FastJSONResponse([dict(zip(columns, row)) for row in rows])
@@ -1,15 +1,18 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import RedirectResponse, PlainTextResponse
 
-from app.core.database import Base, engine, SessionLocal
-from app.core.seed_data import run_seed
+from app.core.bootstrap import on_startup
+from app.core.cache import ResponseCacheMiddleware, cache_stats
+from app.core.database import DB_MODE
+from app.core.jobs import job_manager
+from app.core.live import live_hub
+from app.core.metrics import MetricsMiddleware, registry
 
 # ----------------------------
 # Routers
 # ----------------------------
-from app.routes import employees, attendance, reports, dashboard
+from app.routes import employees, attendance, reports, dashboard, exports, jobs
 
 # ----------------------------
 # FastAPI App
@@ -20,6 +23,11 @@ app = FastAPI(
     version="1.2.0"
 )
 
+# ----------------------------
+# Response Cache (added before CORS so 304s still get CORS headers)
+# ----------------------------
+app.add_middleware(ResponseCacheMiddleware)
+
 # ----------------------------
 # CORS Middleware (FIXED)
 # ----------------------------
@@ -36,28 +44,78 @@ app.add_middleware(
 )
 
 # ----------------------------
-# Create DB Tables
+# Request Metrics (outermost, so cache hits are measured too)
+# ----------------------------
+app.add_middleware(MetricsMiddleware)
+
+# ----------------------------
+# Schema / Seed on Startup (STARTUP_MODE, see app.core.bootstrap)
 # ----------------------------
-Base.metadata.create_all(bind=engine)
+@app.on_event("startup")
+def bootstrap_database():
+    on_startup()
 
 # ----------------------------
-# Seed Data on Startup (DEV only)
+# Live Dashboard Feed (EVENTS_URL, see app.core.live)
 # ----------------------------
 @app.on_event("startup")
-def seed_database():
-    db: Session = SessionLocal()
-    try:
-        run_seed(db)
-    finally:
-        db.close()
+async def start_live_feed():
+    await live_hub.start()
+
+@app.on_event("shutdown")
+async def stop_live_feed():
+    await live_hub.stop()
+
+# ----------------------------
+# Background Jobs (JOBS_DIR, see app.core.jobs)
+# ----------------------------
+@app.on_event("shutdown")
+def stop_job_pool():
+    job_manager.shutdown()
 
 # ----------------------------
 # Include Routers
 # ----------------------------
-app.include_router(employees.router)
-app.include_router(attendance.router)
-app.include_router(reports.router)
-app.include_router(dashboard.router)
+if DB_MODE == "async":
+    from app.core.async_routes import make_async_router
+
+    for module in (employees, attendance, reports, dashboard):
+        app.include_router(make_async_router(module.router))
+else:
+    app.include_router(employees.router)
+    app.include_router(attendance.router)
+    app.include_router(reports.router)
+    app.include_router(dashboard.router)
+
+app.include_router(exports.router)
+app.include_router(jobs.router)
+
+# ----------------------------
+# Cache Counters
+# ----------------------------
+@app.get("/cache/stats", include_in_schema=False)
+def get_cache_stats():
+    return cache_stats()
+
+# ----------------------------
+# Prometheus Metrics
+# ----------------------------
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    gauges = {
+        f"hrms_cache_{name}": value
+        for name, value in cache_stats().items()
+        if isinstance(value, int)
+    }
+    gauges["hrms_live_subscribers"] = live_hub.subscribers
+    gauges.update(
+        (f"hrms_live_{name}", value) for name, value in live_hub.stats.items()
+    )
+    gauges["hrms_jobs_pending"] = job_manager.pending
+    return PlainTextResponse(
+        registry.render(gauges),
+        media_type="text/plain; version=0.0.4",
+    )
 
 # ----------------------------
 # Root → Redirect to Swagger
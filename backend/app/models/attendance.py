@@ -1,27 +1,70 @@
 # backend/app/models/attendance.py
 
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    Integer,
+    SmallInteger,
+    String,
+    Date,
+    ForeignKey,
+    UniqueConstraint,
+    Index,
+    MetaData,
+    Table,
+)
+from sqlalchemy.orm import declared_attr
+from sqlalchemy.types import TypeDecorator
+
 from app.core.database import Base
 
 
-class Attendance(Base):
-    __tablename__ = "attendance"
+class AttendanceStatus(TypeDecorator):
+    """
+    "Present" / "Absent" in Python, a SMALLINT code on disk.
+    Comparisons such as `status == "Present"` bind the code automatically.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    CODES = {"Absent": 0, "Present": 1}
+    NAMES = {code: name for name, code in CODES.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.CODES[value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.NAMES[value]
+
+
+class AttendanceColumns:
+    """Columns shared by the hot table and the archive."""
 
     # Internal DB identifier (never exposed to UI or APIs)
     id = Column(Integer, primary_key=True, index=True)
 
     # Business identifier (EMP001 style)
-    employee_id = Column(
-        String,
-        ForeignKey("employees.employee_id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
-    )
+    # Lookups by employee use the composite indexes below
+    @declared_attr
+    def employee_id(cls):
+        return Column(
+            String,
+            ForeignKey("employees.employee_id", ondelete="CASCADE"),
+            nullable=False,
+        )
 
     date = Column(Date, nullable=False)
 
     # Allowed values enforced at API level: "Present" | "Absent"
-    status = Column(String, nullable=False)
+    status = Column(AttendanceStatus, nullable=False)
+
+
+class Attendance(AttendanceColumns, Base):
+    """Recent attendance; every write lands here."""
+    __tablename__ = "attendance"
 
     __table_args__ = (
         # Enforce ONE attendance record per employee per date
@@ -30,4 +73,41 @@ class Attendance(Base):
             "date",
             name="unique_employee_date"
         ),
+        # Dashboard / org reports: filter on date (and status) alone
+        Index("ix_attendance_date_status", "date", "status"),
+        # Per-employee history, covering: answered from the index alone
+        Index("ix_attendance_employee_date_status", "employee_id", "date", "status"),
+        # Archived rows keep their ids; SQLite must never hand them out again
+        {"sqlite_autoincrement": True},
+    )
+
+
+class AttendanceArchive(AttendanceColumns, Base):
+    """Rows moved out of `attendance` once older than ATTENDANCE_HOT_DAYS."""
+    __tablename__ = "attendance_archive"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "employee_id",
+            "date",
+            name="unique_archive_employee_date"
+        ),
+        Index("ix_attendance_archive_date_status", "date", "status"),
+        Index("ix_attendance_archive_employee_date_status", "employee_id", "date", "status"),
+    )
+
+
+# Views are created by app.core.partitions, not by create_all
+view_metadata = MetaData()
+
+
+class AttendanceHistory(Base):
+    """Read-only `attendance UNION ALL attendance_archive` view."""
+    __table__ = Table(
+        "attendance_history",
+        view_metadata,
+        Column("id", Integer, primary_key=True),
+        Column("employee_id", String, nullable=False),
+        Column("date", Date, nullable=False),
+        Column("status", AttendanceStatus, nullable=False),
     )
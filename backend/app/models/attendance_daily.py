@@ -0,0 +1,20 @@
+# backend/app/models/attendance_daily.py
+
+from sqlalchemy import Column, Integer, String, Date
+from app.core.database import Base
+
+
+class AttendanceDaily(Base):
+    """
+    Per-day, per-department attendance counts.
+    Derived from `attendance`; maintained on every write path and
+    rebuildable with `python -m app.cli rebuild-aggregates`.
+    """
+    __tablename__ = "attendance_daily"
+
+    date = Column(Date, primary_key=True)
+    department = Column(String, primary_key=True)
+
+    total = Column(Integer, nullable=False, default=0)
+    present = Column(Integer, nullable=False, default=0)
+    absent = Column(Integer, nullable=False, default=0)
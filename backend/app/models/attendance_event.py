@@ -0,0 +1,79 @@
+# backend/app/models/attendance_event.py
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    DateTime,
+    LargeBinary,
+    ForeignKey,
+    Index,
+)
+
+from app.core.database import Base
+from app.models.attendance import AttendanceStatus
+
+
+class AttendanceEvent(Base):
+    """
+    Append-only log of every attendance change; `attendance` is the state
+    it leads to. Never updated or deleted (enforced by triggers, see
+    app.core.event_log).
+    """
+    __tablename__ = "attendance_events"
+
+    # Log position; replay order
+    seq = Column(Integer, primary_key=True)
+
+    # UTC, naive
+    recorded_at = Column(DateTime, nullable=False)
+
+    # No foreign key: the trail outlives the employee
+    employee_id = Column(String, nullable=False)
+    date = Column(Date, nullable=False)
+
+    # None: the record was removed
+    status = Column(AttendanceStatus, nullable=True)
+
+    # Write path: "mark", "bulk", "seed", "clear", "offboard", "compact", "baseline"
+    source = Column(String, nullable=False)
+
+    __table_args__ = (
+        # "As of T" → log position
+        Index("ix_attendance_events_recorded_at", "recorded_at", "seq"),
+        # Per-employee replay and audit trail
+        Index("ix_attendance_events_employee_seq", "employee_id", "seq"),
+    )
+
+
+class AttendanceSnapshot(Base):
+    """The state the log leads to up to `upto_seq`, in attendance_snapshot_years."""
+    __tablename__ = "attendance_snapshots"
+
+    id = Column(Integer, primary_key=True)
+    upto_seq = Column(Integer, nullable=False, unique=True)
+    taken_at = Column(DateTime, nullable=False)
+
+    # Events folded in since the previous snapshot
+    events = Column(Integer, nullable=False, default=0)
+
+
+class AttendanceSnapshotYear(Base):
+    """
+    One employee-year as of a snapshot: `marked` and `present` bitsets, one
+    bit per day of year (little-endian bytes). Every snapshot holds all
+    non-empty employee-years, so reading one never needs another.
+    """
+    __tablename__ = "attendance_snapshot_years"
+
+    snapshot_id = Column(
+        Integer,
+        ForeignKey("attendance_snapshots.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    employee_id = Column(String, primary_key=True)
+    year = Column(Integer, primary_key=True)
+
+    marked = Column(LargeBinary, nullable=False)
+    present = Column(LargeBinary, nullable=False)
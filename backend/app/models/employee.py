@@ -1,6 +1,6 @@
 # backend/app/models/employee.py
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 from app.core.database import Base
 
 
@@ -12,3 +12,8 @@ class Employee(Base):
     full_name = Column(String, nullable=False)
     email = Column(String, nullable=False)
     department = Column(String, nullable=False)
+
+    __table_args__ = (
+        # Department filters (team matrix, analytics) walked in id order
+        Index("ix_employees_department_employee_id", "department", "employee_id"),
+    )
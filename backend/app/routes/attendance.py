@@ -1,17 +1,41 @@
 # backend/app/routes/attendance.py
 
-from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import date, datetime
+from typing import Annotated
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from app.core.database import get_db
+from app.core.aggregates import apply_attendance_deltas
+from app.core.bitmaps import bitmap_store, month_bounds
+from app.core.cache import invalidate
+from app.core.database import chunked, get_db, dialect_insert, lock_for_write
+from app.core.event_log import attendance_as_of, has_history, log_attendance, to_utc, utcnow
+from app.core.live import publish_attendance
+from app.core.partitions import attendance_source, hot_cutoff, is_archived
+from app.core.reports import status_matrix
+from app.core.serialization import rows_response
 from app.models.employee import Employee
 from app.models.attendance import Attendance
-from app.schemas.attendance import CreateAttendance, AttendanceResponse
+from app.models.attendance_event import AttendanceEvent
+from app.schemas.attendance import (
+    MAX_BULK_ATTENDANCE,
+    CreateAttendance,
+    AttendanceResponse,
+    BulkAttendanceResponse,
+)
 
 router = APIRouter(prefix="/attendance", tags=["Attendance"])
 
+# Longest range the team matrix serves in one response
+MAX_MATRIX_DAYS = 366
+
+# Columns selected for AttendanceResponse, in schema order
+ATTENDANCE_FIELDS = tuple(AttendanceResponse.model_fields)
+
+# Columns of the audit trail
+EVENT_FIELDS = ("seq", "recorded_at", "date", "status", "source")
+
 
 # ----------------------------
 # Mark Attendance
@@ -32,6 +56,12 @@ def mark_attendance(
             detail="Future dates are not allowed"
         )
 
+    if is_archived(attendance.date):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Attendance before {hot_cutoff()} is archived and read-only"
+        )
+
     # Check if employee exists
     employee = db.query(Employee).filter(
         Employee.employee_id == attendance.employee_id
@@ -50,6 +80,9 @@ def mark_attendance(
     )
 
     db.add(new_attendance)
+    changes = [(attendance.date, employee.department, attendance.status, 1)]
+    apply_attendance_deltas(db, changes)
+    log_attendance(db, [(attendance.employee_id, attendance.date, attendance.status)], "mark")
 
     try:
         db.commit()
@@ -60,10 +93,190 @@ def mark_attendance(
             detail="Attendance already marked for this employee on this date"
         )
 
+    invalidate("attendance")
+    publish_attendance(changes)
+
     db.refresh(new_attendance)
     return new_attendance
 
 
+# ----------------------------
+# Bulk Mark Attendance
+# ----------------------------
+@router.post(
+    "/bulk",
+    response_model=BulkAttendanceResponse,
+    status_code=status.HTTP_200_OK
+)
+def bulk_mark_attendance(
+    records: Annotated[list[CreateAttendance], Body(max_length=MAX_BULK_ATTENDANCE)],
+    db: Session = Depends(get_db)
+):
+    """
+    Marks up to MAX_BULK_ATTENDANCE employee-days in one transaction.
+    - Existing (employee_id, date) rows are updated
+    - Rows breaking a rule (future or archived date, unknown employee) are
+      rejected individually, never the whole batch
+    - A malformed row (missing field, unknown status) fails the whole
+      request with 422 and nothing is written
+    - Later duplicates in the same batch win over earlier ones
+    """
+    today = date.today()
+    results: list[dict] = [
+        {
+            "index": i,
+            "employee_id": r.employee_id,
+            "date": r.date,
+            "result": None,
+            "reason": None,
+        }
+        for i, r in enumerate(records)
+    ]
+
+    # One set-based lookup for every referenced employee
+    requested_ids = list({r.employee_id for r in records})
+    departments: dict[str, str] = {}
+    for chunk in chunked(requested_ids):
+        departments.update(
+            db.query(Employee.employee_id, Employee.department).filter(
+                Employee.employee_id.in_(chunk)
+            )
+        )
+
+    accepted: dict[tuple[str, date], int] = {}
+
+    for i, r in enumerate(records):
+        if r.date > today:
+            results[i]["result"] = "rejected"
+            results[i]["reason"] = "Future dates are not allowed"
+            continue
+
+        if is_archived(r.date):
+            results[i]["result"] = "rejected"
+            results[i]["reason"] = "Date is archived and read-only"
+            continue
+
+        if r.employee_id not in departments:
+            results[i]["result"] = "rejected"
+            results[i]["reason"] = "Employee does not exist"
+            continue
+
+        key = (r.employee_id, r.date)
+        if key in accepted:
+            earlier = accepted[key]
+            results[earlier]["result"] = "rejected"
+            results[earlier]["reason"] = "Superseded by a later entry in this batch"
+
+        accepted[key] = i
+
+    # Which of the accepted rows already exist decides created vs updated,
+    # and what the aggregates lose; read under the write lock so a
+    # concurrent mark cannot change them before this commits
+    existing: dict[tuple[str, date], str] = {}
+    if accepted:
+        lock_for_write(db, Attendance)
+        dates = [d for _, d in accepted]
+        accepted_ids = list({emp_id for emp_id, _ in accepted})
+        for chunk in chunked(accepted_ids):
+            existing.update(
+                ((emp_id, d), st) for emp_id, d, st in db.query(
+                    Attendance.employee_id, Attendance.date, Attendance.status
+                ).filter(
+                    Attendance.employee_id.in_(chunk),
+                    Attendance.date >= min(dates),
+                    Attendance.date <= max(dates),
+                )
+            )
+
+    rows = []
+    deltas = []
+    events = []
+    for key, i in accepted.items():
+        emp_id, day = key
+        new_status = records[i].status
+        rows.append({
+            "employee_id": emp_id,
+            "date": day,
+            "status": new_status,
+        })
+        results[i]["result"] = "updated" if key in existing else "created"
+
+        old_status = existing.get(key)
+        if old_status != new_status:
+            if old_status is not None:
+                deltas.append((day, departments[emp_id], old_status, -1))
+            deltas.append((day, departments[emp_id], new_status, 1))
+            events.append((emp_id, day, new_status))
+
+    try:
+        for chunk in chunked(rows):
+            stmt = dialect_insert(db, Attendance).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["employee_id", "date"],
+                set_={"status": stmt.excluded.status},
+            )
+            db.execute(stmt)
+        apply_attendance_deltas(db, deltas)
+        log_attendance(db, events, "bulk")
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Attendance batch conflicted with a concurrent change, retry"
+        )
+
+    if rows:
+        invalidate("attendance")
+        publish_attendance(deltas)
+
+    return {
+        "created": sum(r["result"] == "created" for r in results),
+        "updated": sum(r["result"] == "updated" for r in results),
+        "rejected": sum(r["result"] == "rejected" for r in results),
+        "results": results,
+    }
+
+
+# ----------------------------
+# Team Matrix (employee × date)
+# ----------------------------
+# Declared before /{employee_id} so "matrix" is not taken for an id
+@router.get("/matrix")
+def get_attendance_matrix(
+    department: str,
+    start_date: date,
+    end_date: date,
+    db: Session = Depends(get_db)
+):
+    """
+    A department's attendance as one string per employee, one char per day
+    from start_date: P(resent), A(bsent), - (not marked).
+    Replaces one /attendance/{employee_id} call per team member.
+    """
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date cannot be greater than end_date"
+        )
+
+    if (end_date - start_date).days >= MAX_MATRIX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range cannot exceed {MAX_MATRIX_DAYS} days"
+        )
+
+    return {
+        "department": department,
+        "start_date": start_date,
+        "end_date": end_date,
+        "employees": [
+            {"employee_id": emp_id, "full_name": name, "days": days}
+            for emp_id, name, days in status_matrix(db, department, start_date, end_date)
+        ],
+    }
+
+
 # ----------------------------
 # View Attendance per Employee
 # ----------------------------
@@ -95,17 +308,165 @@ def get_attendance(
             detail="start_date cannot be greater than end_date"
         )
 
-    query = db.query(Attendance).filter(
-        Attendance.employee_id == employee_id
+    source = attendance_source(start_date)
+    query = db.query(
+        *[getattr(source, c) for c in ATTENDANCE_FIELDS]
+    ).filter(
+        source.employee_id == employee_id
     )
 
     if start_date:
-        query = query.filter(Attendance.date >= start_date)
+        query = query.filter(source.date >= start_date)
 
     if end_date:
-        query = query.filter(Attendance.date <= end_date)
+        query = query.filter(source.date <= end_date)
 
-    records = query.order_by(Attendance.date.desc()).all()
+    records = query.order_by(source.date.desc()).all()
 
     # Employee exists but no attendance → empty list
-    return records
+    # Tuples straight to JSON; response_model only documents the shape
+    return rows_response(records, ATTENDANCE_FIELDS)
+
+
+# ----------------------------
+# Calendar Month per Employee (bitmap store)
+# ----------------------------
+@router.get("/{employee_id}/calendar")
+def get_attendance_calendar(
+    employee_id: str,
+    year: int = Query(ge=1900, le=9999),
+    month: int = Query(ge=1, le=12),
+    db: Session = Depends(get_db)
+):
+    """
+    Month view as one char per day: P(resent), A(bsent), - (not marked).
+    Served from the in-memory bitmap store, not the attendance table.
+    """
+    if not bitmap_store.sync(db, employee_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found"
+        )
+
+    start, end = month_bounds(year, month)
+
+    return {
+        "employee_id": employee_id,
+        "year": year,
+        "month": month,
+        "days": bitmap_store.day_statuses(employee_id, start, end),
+    }
+
+
+# ----------------------------
+# Counts and Streaks per Employee (bitmap store)
+# ----------------------------
+@router.get("/{employee_id}/stats")
+def get_attendance_stats(
+    employee_id: str,
+    start_date: date,
+    end_date: date,
+    db: Session = Depends(get_db)
+):
+    """Present/absent counts plus longest present streak and absence run."""
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date cannot be greater than end_date"
+        )
+
+    if not bitmap_store.sync(db, employee_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found"
+        )
+
+    return {
+        "employee_id": employee_id,
+        **bitmap_store.summary(employee_id, start_date, end_date),
+    }
+
+
+# ----------------------------
+# History (event log)
+# ----------------------------
+def _check_history(db: Session, employee_id: str, start_date, end_date):
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date cannot be greater than end_date"
+        )
+
+    # Offboarded employees keep their history
+    exists = db.query(Employee.id).filter(
+        Employee.employee_id == employee_id
+    ).first()
+
+    if not exists and not has_history(db, employee_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found"
+        )
+
+
+@router.get("/{employee_id}/as-of")
+def get_attendance_as_of(
+    employee_id: str,
+    at: datetime | None = Query(default=None),
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    db: Session = Depends(get_db)
+):
+    """
+    The employee's attendance as it stood at `at` (UTC unless an offset is
+    given; defaults to now), newest first. Rebuilt from the latest snapshot
+    before `at` plus the events recorded after it.
+    """
+    _check_history(db, employee_id, start_date, end_date)
+
+    at = utcnow() if at is None else at
+    try:
+        at_utc = to_utc(at)
+    except OverflowError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="at is out of range once converted to UTC"
+        )
+
+    records = attendance_as_of(db, at_utc, employee_id, start_date, end_date)
+
+    return {
+        "employee_id": employee_id,
+        "as_of": at,
+        "records": [
+            {"date": day, "status": st} for _, day, st in reversed(records)
+        ],
+    }
+
+
+@router.get("/{employee_id}/events")
+def get_attendance_events(
+    employee_id: str,
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    db: Session = Depends(get_db)
+):
+    """
+    Audit trail: every recorded change, oldest first.
+    `status` null means the record was removed; `recorded_at` is UTC.
+    """
+    _check_history(db, employee_id, start_date, end_date)
+
+    query = db.query(
+        *[getattr(AttendanceEvent, c) for c in EVENT_FIELDS]
+    ).filter(
+        AttendanceEvent.employee_id == employee_id
+    )
+
+    if start_date:
+        query = query.filter(AttendanceEvent.date >= start_date)
+
+    if end_date:
+        query = query.filter(AttendanceEvent.date <= end_date)
+
+    return rows_response(query.order_by(AttendanceEvent.seq).all(), EVENT_FIELDS)
@@ -1,11 +1,15 @@
+import asyncio
 from datetime import date, timedelta
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case
+from sqlalchemy import func
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
+from app.core.live import live_hub, sse_frame, HEARTBEAT_SECONDS
 from app.models.employee import Employee
-from app.models.attendance import Attendance
+from app.models.attendance_daily import AttendanceDaily
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
@@ -13,21 +17,18 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 # -------------------------------------------------
 # TODAY SNAPSHOT
 # -------------------------------------------------
-@router.get("/today")
-def dashboard_today(db: Session = Depends(get_db)):
+def today_snapshot(db: Session) -> dict:
     today = date.today()
 
     total_employees = db.query(Employee).count()
 
-    present_today = db.query(Attendance).filter(
-        Attendance.date == today,
-        Attendance.status == "Present"
-    ).count()
-
-    absent_today = db.query(Attendance).filter(
-        Attendance.date == today,
-        Attendance.status == "Absent"
-    ).count()
+    # One row per department from the maintained daily aggregates
+    present_today, absent_today = db.query(
+        func.coalesce(func.sum(AttendanceDaily.present), 0),
+        func.coalesce(func.sum(AttendanceDaily.absent), 0),
+    ).filter(
+        AttendanceDaily.date == today
+    ).one()
 
     attendance_rate = (
         (present_today / total_employees) * 100
@@ -42,6 +43,53 @@ def dashboard_today(db: Session = Depends(get_db)):
     }
 
 
+@router.get("/today")
+def dashboard_today(db: Session = Depends(get_db)):
+    return today_snapshot(db)
+
+
+# -------------------------------------------------
+# LIVE FEED (SERVER-SENT EVENTS)
+# -------------------------------------------------
+def _snapshot_in_own_session() -> dict:
+    db = SessionLocal()
+    try:
+        return {"date": date.today().isoformat(), **today_snapshot(db)}
+    finally:
+        db.close()
+
+
+@router.get("/live")
+async def dashboard_live():
+    """
+    Server-Sent Events replacing /dashboard/today polling:
+    - `snapshot`: the /dashboard/today counts (plus `date`), sent first
+    - `attendance`: {date, present, absent} deltas as marks commit
+    - `employees`: {delta} as employees are added or removed
+    - `resync`: deltas were dropped for this client, reconnect
+    """
+
+    async def events():
+        # Subscribe before reading the snapshot so no commit falls in between
+        queue = live_hub.subscribe()
+        try:
+            yield sse_frame("snapshot", await run_in_threadpool(_snapshot_in_own_session))
+
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            live_hub.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # -------------------------------------------------
 # LAST 30 DAYS TREND (DASHBOARD ONLY)
 # -------------------------------------------------
@@ -50,23 +98,20 @@ def dashboard_last_30_days(db: Session = Depends(get_db)):
     today = date.today()
     start_date = today - timedelta(days=29)
 
+    # Reads O(days × departments) aggregate rows, not raw attendance
     records = (
         db.query(
-            Attendance.date.label("date"),
-            func.count().label("total"),
-            func.sum(
-                case(
-                    (Attendance.status == "Present", 1),
-                    else_=0
-                )
-            ).label("present"),
+            AttendanceDaily.date.label("date"),
+            func.sum(AttendanceDaily.total).label("total"),
+            func.sum(AttendanceDaily.present).label("present"),
         )
         .filter(
-            Attendance.date >= start_date,
-            Attendance.date <= today
+            AttendanceDaily.date >= start_date,
+            AttendanceDaily.date <= today
         )
-        .group_by(Attendance.date)
-        .order_by(Attendance.date)
+        .group_by(AttendanceDaily.date)
+        .having(func.sum(AttendanceDaily.total) > 0)
+        .order_by(AttendanceDaily.date)
         .all()
     )
 
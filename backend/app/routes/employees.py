@@ -1,15 +1,76 @@
 # backend/app/routes/employees.py
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import base64
+import binascii
+import codecs
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 
-from app.core.database import get_db
+from app.core.aggregates import apply_attendance_deltas
+from app.core.cache import invalidate
+from app.core.database import chunked, get_db, lock_for_write
+from app.core.event_log import log_table_rows
+from app.core.imports import EmployeeImporter, RecordParser, IMPORT_CHUNK_SIZE
+from app.core.live import publish_attendance, publish_employees
+from app.core.partitions import attendance_source
+from app.core.search import apply_search
+from app.core.serialization import FastJSONResponse, rows_response
 from app.models.employee import Employee
-from app.schemas.employee import CreateEmployee, EmployeeResponse
+from app.models.attendance import Attendance, AttendanceArchive
+from app.schemas.employee import (
+    CreateEmployee,
+    EmployeeResponse,
+    EmployeeImportReport,
+    EmployeeOffboardRequest,
+    EmployeeOffboardReport,
+)
 
 router = APIRouter(prefix="/employees", tags=["Employees"])
 
+# Columns that may be requested through ?fields=
+EMPLOYEE_FIELDS = ("id", "employee_id", "full_name", "email", "department")
+
+MAX_PAGE_SIZE = 1000
+
+
+def _encode_cursor(employee_id: str) -> str:
+    return base64.urlsafe_b64encode(employee_id.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> str:
+    # validate=True: urlsafe_b64decode would drop stray characters, so
+    # "!!!" decoded to "" and silently restarted at page 1
+    try:
+        employee_id = base64.b64decode(cursor, altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        employee_id = ""
+
+    if not employee_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return employee_id
+
+
+def _parse_fields(fields: str) -> list[str]:
+    selected = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in selected if f not in EMPLOYEE_FIELDS]
+
+    if not selected or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"fields must be a comma-separated subset of: "
+                   f"{', '.join(EMPLOYEE_FIELDS)}"
+        )
+
+    # Preserve request order, drop repeats
+    return list(dict.fromkeys(selected))
+
 
 # ----------------------------
 # Add Employee
@@ -42,11 +103,63 @@ def add_employee(
 
     db.add(new_employee)
     db.commit()
+    invalidate("employees")
+    publish_employees(1)
     db.refresh(new_employee)
 
     return new_employee
 
 
+# ----------------------------
+# Bulk Import Employees
+# ----------------------------
+@router.post(
+    "/import",
+    response_model=EmployeeImportReport,
+    status_code=status.HTTP_200_OK
+)
+async def import_employees(
+    request: Request,
+    format: Literal["csv", "ndjson"] | None = Query(default=None),
+    db: Session = Depends(get_db),
+):
+    """
+    Imports employees from a raw CSV (header row first) or NDJSON body.
+    The body is read as a stream and processed in chunks; rows that fail
+    validation or duplicate an employee_id are reported, not fatal.
+    Format defaults from the Content-Type header.
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "ndjson" if "json" in content_type else "csv"
+
+    importer = EmployeeImporter(db)
+    parser = RecordParser(format)
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    pending = ""
+    lines: list[str] = []
+
+    async for data in request.stream():
+        pending += decoder.decode(data)
+        *complete, pending = pending.split("\n")
+        lines.extend(complete)
+
+        if len(lines) >= IMPORT_CHUNK_SIZE:
+            await run_in_threadpool(importer.process, list(parser.parse(lines)))
+            lines = []
+
+    pending += decoder.decode(b"", final=True)
+    lines.append(pending)
+    await run_in_threadpool(importer.process, list(parser.parse(lines)))
+
+    if importer.imported:
+        invalidate("employees")
+        publish_employees(importer.imported)
+
+    return importer.report()
+
+
 # ----------------------------
 # List Employees
 # ----------------------------
@@ -56,6 +169,9 @@ def add_employee(
 )
 def list_employees(
     search: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+    fields: str | None = Query(default=None),
     db: Session = Depends(get_db),
 ):
     """
@@ -63,28 +179,148 @@ def list_employees(
     - No pagination wrapper
     - No metadata
     - Frontend-safe for dropdowns
+
+    Opt-in extras:
+    - fields=a,b → only those columns, still a plain list
+    - limit (+ cursor) → keyset page on employee_id as
+      {"items": [...], "next_cursor": "..." | null}
+
+    search uses the FTS5 index (token prefix match, best match first)
+    and falls back to substring ILIKE where FTS5 is unavailable.
     """
 
-    query = db.query(Employee)
+    paginated = limit is not None or cursor is not None
+    columns = _parse_fields(fields) if fields is not None else list(EMPLOYEE_FIELDS)
+
+    # employee_id is always fetched, it is the keyset column; it goes last
+    # so rows still zip with `columns`
+    fetched = columns if "employee_id" in columns else [*columns, "employee_id"]
+    query = db.query(*[getattr(Employee, c) for c in fetched])
 
     if search:
-        query = query.filter(
-            or_(
-                Employee.employee_id.ilike(f"%{search}%"),
-                Employee.full_name.ilike(f"%{search}%"),
-                Employee.email.ilike(f"%{search}%"),
-                Employee.department.ilike(f"%{search}%"),
-            )
-        )
+        # Ranked by relevance, except for keyset pages which need a stable order
+        query, _ = apply_search(query, search, ranked=not paginated)
+
+    if cursor is not None:
+        query = query.filter(Employee.employee_id > _decode_cursor(cursor))
+
+    query = query.order_by(Employee.employee_id.asc())
 
-    employees = query.order_by(Employee.employee_id.asc()).all()
+    # Tuples straight to JSON; response_model only documents the shape
+    if not paginated:
+        return rows_response(query.all(), columns)
 
-    return employees
+    page_size = limit or MAX_PAGE_SIZE
+
+    # One extra row tells us whether another page exists
+    rows = query.limit(page_size + 1).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    next_cursor = (
+        _encode_cursor(rows[-1]._mapping["employee_id"])
+        if has_more else None
+    )
+
+    return FastJSONResponse({
+        "items": [dict(zip(columns, row)) for row in rows],
+        "next_cursor": next_cursor,
+    })
 
 
 # ----------------------------
-# Delete Employee
+# Delete Employee(s)
 # ----------------------------
+def _delete_employees(db: Session, employee_ids: list[str]) -> tuple[list[str], int, list]:
+    """
+    Set-based delete of employees and all their attendance (hot and archived)
+    inside the caller's transaction, which must not have written yet;
+    aggregates are adjusted first. Returns the ids that existed, the
+    attendance rows removed and the aggregate changes applied.
+    """
+    # The counts subtracted from the aggregates must be the rows deleted
+    lock_for_write(db, Attendance)
+
+    source = attendance_source()
+    deleted: list[str] = []
+    attendance_deleted = 0
+    changes = []
+
+    for chunk in chunked(employee_ids):
+        found = [
+            emp_id for (emp_id,) in db.query(Employee.employee_id).filter(
+                Employee.employee_id.in_(chunk)
+            )
+        ]
+        if not found:
+            continue
+
+        removed = (
+            db.query(source.date, Employee.department, source.status, func.count())
+            .join(Employee, Employee.employee_id == source.employee_id)
+            .filter(source.employee_id.in_(found))
+            .group_by(source.date, Employee.department, source.status)
+            .all()
+        )
+        chunk_changes = [
+            (day, department, st, -count)
+            for day, department, st, count in removed
+        ]
+        apply_attendance_deltas(db, chunk_changes)
+        changes.extend(chunk_changes)
+
+        # Explicit rather than ON DELETE CASCADE, so the counts are known
+        # and the removals reach the event log
+        for table in (Attendance, AttendanceArchive):
+            log_table_rows(db, table, table.employee_id.in_(found), source="offboard", removed=True)
+            attendance_deleted += db.query(table).filter(
+                table.employee_id.in_(found)
+            ).delete(synchronize_session=False)
+
+        db.query(Employee).filter(
+            Employee.employee_id.in_(found)
+        ).delete(synchronize_session=False)
+
+        deleted.extend(found)
+
+    return deleted, attendance_deleted, changes
+
+
+def _after_delete(employee_ids: list[str], changes: list):
+    invalidate("employees", "attendance")
+    publish_employees(-len(employee_ids))
+    publish_attendance(changes)
+
+
+@router.post(
+    "/offboard",
+    response_model=EmployeeOffboardReport,
+    status_code=status.HTTP_200_OK
+)
+def offboard_employees(
+    request: EmployeeOffboardRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Deletes many employees and their attendance in one transaction.
+    Unknown ids are reported, never an error.
+    """
+    requested = list(dict.fromkeys(request.employee_ids))
+
+    deleted, attendance_deleted, changes = _delete_employees(db, requested)
+    db.commit()
+
+    if deleted:
+        _after_delete(deleted, changes)
+
+    found = set(deleted)
+    return {
+        "deleted": len(deleted),
+        "attendance_deleted": attendance_deleted,
+        "not_found": [emp_id for emp_id in requested if emp_id not in found],
+    }
+
+
 @router.delete(
     "/{employee_id}",
     status_code=status.HTTP_200_OK
@@ -93,17 +329,15 @@ def delete_employee(
     employee_id: str,
     db: Session = Depends(get_db)
 ):
-    employee = db.query(Employee).filter(
-        Employee.employee_id == employee_id
-    ).first()
+    deleted, _, changes = _delete_employees(db, [employee_id])
 
-    if not employee:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Employee not found"
         )
 
-    db.delete(employee)
     db.commit()
+    _after_delete(deleted, changes)
 
     return {"message": "Employee deleted successfully"}
@@ -0,0 +1,68 @@
+# backend/app/routes/exports.py
+
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.core.database import SessionLocal
+from app.core.exports import (
+    attendance_batches,
+    csv_stream,
+    parquet_available,
+    parquet_stream,
+)
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+
+# ----------------------------
+# Attendance History Export
+# ----------------------------
+@router.get("/attendance")
+def export_attendance(
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    department: str | None = Query(default=None),
+    format: Literal["csv", "parquet"] = Query(default="csv"),
+):
+    """
+    Streams attendance history for a date range (optionally one department).
+    Rows are read in server-side batches and sent as they are encoded,
+    so memory use does not grow with the export size.
+    """
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date cannot be greater than end_date"
+        )
+
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Parquet export requires pyarrow to be installed"
+        )
+
+    encode = parquet_stream if format == "parquet" else csv_stream
+
+    def body():
+        # Own session: it must outlive the request handler while streaming
+        db = SessionLocal()
+        try:
+            yield from encode(
+                attendance_batches(db, start_date, end_date, department)
+            )
+        finally:
+            db.close()
+
+    media_type = (
+        "application/vnd.apache.parquet" if format == "parquet" else "text/csv"
+    )
+    filename = f"attendance.{format}"
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
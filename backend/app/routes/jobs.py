@@ -0,0 +1,112 @@
+# backend/app/routes/jobs.py
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+
+from app.core.exports import parquet_available
+from app.core.jobs import JobQueueFull, job_manager
+from app.schemas.job import AttendanceExportJob, AttendanceMonthlyJob, JobResponse
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+# Suggested wait before resubmitting when the queue is full
+RETRY_AFTER_SECONDS = 30
+
+
+def _job_response(state: dict) -> dict:
+    return {
+        **state,
+        "result_url": f"/jobs/{state['id']}/result" if state["status"] == "done" else None,
+    }
+
+
+def _submit(kind: str, params: dict) -> dict:
+    try:
+        state = job_manager.submit(kind, params)
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Job queue is full, retry later",
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+
+    return _job_response(state)
+
+
+def _check_range(start_date, end_date):
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date cannot be greater than end_date"
+        )
+
+
+# ----------------------------
+# Submit
+# ----------------------------
+@router.post(
+    "/exports/attendance",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+def submit_attendance_export(request: AttendanceExportJob):
+    """
+    Background version of GET /exports/attendance. Returns the job at once;
+    the same request while it runs (or within JOB_RESULT_TTL of it
+    finishing) returns the same job.
+    """
+    _check_range(request.start_date, request.end_date)
+
+    if request.format == "parquet" and not parquet_available():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Parquet export requires pyarrow to be installed"
+        )
+
+    return _submit("attendance_export", request.model_dump(mode="json"))
+
+
+@router.post(
+    "/reports/attendance/monthly",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+def submit_attendance_monthly(request: AttendanceMonthlyJob):
+    """Background version of GET /reports/attendance/monthly (NDJSON result)."""
+    _check_range(request.start_date, request.end_date)
+
+    return _submit("attendance_monthly", request.model_dump(mode="json"))
+
+
+# ----------------------------
+# Status / Result
+# ----------------------------
+def _get_job(job_id: str) -> dict:
+    state = job_manager.get(job_id)
+
+    if state is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found or expired"
+        )
+
+    return state
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: str):
+    return _job_response(_get_job(job_id))
+
+
+@router.get("/{job_id}/result")
+def get_job_result(job_id: str):
+    state = _get_job(job_id)
+
+    if state["status"] != "done":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job is {state['status']}"
+        )
+
+    path, media_type, filename = job_manager.result(state)
+    return FileResponse(path, media_type=media_type, filename=filename)
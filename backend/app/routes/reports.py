@@ -1,14 +1,28 @@
-from datetime import date
+import json
+from datetime import date, timedelta
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case
 
-from app.core.database import get_db
-from app.models.employee import Employee
-from app.models.attendance import Attendance
+from app.core import analytics
+from app.core.database import get_db, SessionLocal
+from app.core.reports import (
+    employee_attendance_counts,
+    monthly_matrix,
+    organization_attendance_counts,
+    summarize,
+)
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
+# NDJSON lines per streamed chunk
+STREAM_BATCH_ROWS = 500
+
+# The attendance reports are each answered by a single SQL statement: totals come
+# from one SUM(CASE…) pass and the employee existence check rides on the same query.
+
 
 # -------------------------------------------------
 # Employee-wise Attendance Summary
@@ -20,42 +34,19 @@ def employee_attendance_report(
     end_date: date | None = Query(default=None),
     db: Session = Depends(get_db),
 ):
-    employee = db.query(Employee).filter(
-        Employee.employee_id == employee_id
-    ).first()
+    counts = employee_attendance_counts(db, employee_id, start_date, end_date)
 
-    if not employee:
+    if counts is None:
         raise HTTPException(status_code=404, detail="Employee not found")
 
-    query = db.query(Attendance).filter(
-        Attendance.employee_id == employee_id
-    )
-
-    if start_date:
-        query = query.filter(Attendance.date >= start_date)
-
-    if end_date:
-        query = query.filter(Attendance.date <= end_date)
-
-    total_days = query.count()
-
-    present_days = query.filter(
-        Attendance.status == "Present"
-    ).count()
-
-    absent_days = total_days - present_days
-
-    present_percentage = (
-        (present_days / total_days) * 100
-        if total_days > 0 else 0
-    )
+    summary = summarize(counts.total, counts.present)
 
     return {
         "employee_id": employee_id,
-        "total_days": total_days,
-        "present_days": present_days,
-        "absent_days": absent_days,
-        "present_percentage": round(present_percentage, 2),
+        "total_days": summary["total"],
+        "present_days": summary["present"],
+        "absent_days": summary["absent"],
+        "present_percentage": summary["present_percentage"],
     }
 
 
@@ -69,53 +60,72 @@ def monthly_attendance_report(
     end_date: date,
     db: Session = Depends(get_db),
 ):
-    employee = db.query(Employee).filter(
-        Employee.employee_id == employee_id
-    ).first()
+    records = employee_attendance_counts(
+        db,
+        employee_id,
+        start_date,
+        end_date,
+        by_month=True,
+    )
 
-    if not employee:
+    if records is None:
         raise HTTPException(status_code=404, detail="Employee not found")
 
-    records = (
-        db.query(
-            func.strftime("%Y-%m", Attendance.date).label("month"),
-            func.count().label("total_days"),
-            func.sum(
-                case(
-                    (Attendance.status == "Present", 1),
-                    else_=0
-                )
-            ).label("present_days"),
-        )
-        .filter(
-            Attendance.employee_id == employee_id,
-            Attendance.date >= start_date,
-            Attendance.date <= end_date,
-        )
-        .group_by("month")
-        .order_by("month")
-        .all()
-    )
-
     report = []
 
     for row in records:
-        present_percentage = (
-            (row.present_days / row.total_days) * 100
-            if row.total_days > 0 else 0
-        )
+        summary = summarize(row.total, row.present)
 
         report.append({
             "month": row.month,
-            "total_days": row.total_days,
-            "present_days": row.present_days,
-            "absent_days": row.total_days - row.present_days,
-            "present_percentage": round(present_percentage, 2),
+            "total_days": summary["total"],
+            "present_days": summary["present"],
+            "absent_days": summary["absent"],
+            "present_percentage": summary["present_percentage"],
         })
 
     return report
 
 
+# -------------------------------------------------
+# Monthly Attendance Report (whole organization)
+# -------------------------------------------------
+@router.get("/attendance/monthly")
+def organization_monthly_report(
+    start_date: date,
+    end_date: date,
+    group_by: Literal["employee", "department"] = Query(default="employee"),
+):
+    """
+    Streams one NDJSON line per (month, employee) or (month, department).
+    Replaces calling /attendance/monthly/{employee_id} once per employee.
+    """
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=400,
+            detail="start_date cannot be greater than end_date"
+        )
+
+    def rows():
+        # Own session: it must outlive the request handler while streaming
+        db = SessionLocal()
+        try:
+            # Sync iterators are pulled through the threadpool one chunk at
+            # a time, so send lines in batches rather than one per chunk
+            batch = []
+            for row in monthly_matrix(db, start_date, end_date, group_by):
+                batch.append(json.dumps(row))
+                if len(batch) >= STREAM_BATCH_ROWS:
+                    yield "\n".join(batch) + "\n"
+                    batch = []
+            if batch:
+                yield "\n".join(batch) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
 # -------------------------------------------------
 # Organization-level Attendance Summary
 # -------------------------------------------------
@@ -125,30 +135,79 @@ def organization_attendance_summary(
     end_date: date | None = Query(default=None),
     db: Session = Depends(get_db),
 ):
-    query = db.query(Attendance)
+    counts = organization_attendance_counts(db, start_date, end_date)
+    summary = summarize(counts.total, counts.present)
 
-    if start_date:
-        query = query.filter(Attendance.date >= start_date)
+    return {
+        "total_records": summary["total"],
+        "present_records": summary["present"],
+        "absent_records": summary["absent"],
+        "present_percentage": summary["present_percentage"],
+    }
 
-    if end_date:
-        query = query.filter(Attendance.date <= end_date)
 
-    total_records = query.count()
+# -------------------------------------------------
+# Analytics (vectorised over an employee × day matrix)
+# -------------------------------------------------
+MAX_ANALYTICS_DAYS = 3660
 
-    present_records = query.filter(
-        Attendance.status == "Present"
-    ).count()
 
-    absent_records = total_records - present_records
+def analytics_matrix(
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    department: str | None = Query(default=None),
+    db: Session = Depends(get_db),
+):
+    """Shared loader; defaults to the last 90 days."""
+    end_date = end_date or date.today()
+    if start_date is None:
+        if end_date.toordinal() <= 89:
+            raise HTTPException(
+                status_code=400,
+                detail="end_date is too early for the default 90-day range, pass start_date"
+            )
+        start_date = end_date - timedelta(days=89)
+
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=400,
+            detail="start_date cannot be greater than end_date"
+        )
 
-    present_percentage = (
-        (present_records / total_records) * 100
-        if total_records > 0 else 0
-    )
+    if (end_date - start_date).days >= MAX_ANALYTICS_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range cannot exceed {MAX_ANALYTICS_DAYS} days"
+        )
 
-    return {
-        "total_records": total_records,
-        "present_records": present_records,
-        "absent_records": absent_records,
-        "present_percentage": round(present_percentage, 2),
-    }
+    return analytics.load_matrix(db, start_date, end_date, department)
+
+
+@router.get("/analytics/rolling")
+def analytics_rolling_rates(
+    window: int = Query(default=7, ge=1, le=365),
+    matrix: analytics.AttendanceMatrix = Depends(analytics_matrix),
+):
+    return analytics.rolling_rates(matrix, window)
+
+
+@router.get("/analytics/departments")
+def analytics_departments(
+    matrix: analytics.AttendanceMatrix = Depends(analytics_matrix),
+):
+    return analytics.department_rollup(matrix)
+
+
+@router.get("/analytics/weekdays")
+def analytics_weekdays(
+    matrix: analytics.AttendanceMatrix = Depends(analytics_matrix),
+):
+    return analytics.weekday_histogram(matrix)
+
+
+@router.get("/analytics/top-absentees")
+def analytics_top_absentees(
+    limit: int = Query(default=10, ge=1, le=1000),
+    matrix: analytics.AttendanceMatrix = Depends(analytics_matrix),
+):
+    return analytics.top_absentees(matrix, limit)
@@ -4,6 +4,9 @@ from datetime import date
 from typing import Literal
 from pydantic import BaseModel
 
+# Rows per bulk marking request
+MAX_BULK_ATTENDANCE = 10_000
+
 
 class CreateAttendance(BaseModel):
     employee_id: str
@@ -19,3 +22,18 @@ class AttendanceResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class BulkAttendanceResult(BaseModel):
+    index: int
+    employee_id: str
+    date: date
+    result: Literal["created", "updated", "rejected"]
+    reason: str | None = None
+
+
+class BulkAttendanceResponse(BaseModel):
+    created: int
+    updated: int
+    rejected: int
+    results: list[BulkAttendanceResult]
@@ -1,6 +1,9 @@
 # backend/app/schemas/employee.py
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+
+# Employees per offboarding request
+MAX_OFFBOARD_BATCH = 10_000
 
 
 class CreateEmployee(BaseModel):
@@ -19,3 +22,28 @@ class EmployeeResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class EmployeeImportError(BaseModel):
+    row: int
+    employee_id: str | None = None
+    reason: str
+
+
+class EmployeeImportReport(BaseModel):
+    total_rows: int
+    imported: int
+    rejected: int
+    errors: list[EmployeeImportError]
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+class EmployeeOffboardRequest(BaseModel):
+    employee_ids: list[str] = Field(min_length=1, max_length=MAX_OFFBOARD_BATCH)
+
+
+class EmployeeOffboardReport(BaseModel):
+    deleted: int
+    attendance_deleted: int
+    not_found: list[str]
@@ -0,0 +1,36 @@
+# backend/app/schemas/job.py
+
+from datetime import date, datetime
+from typing import Literal
+from pydantic import BaseModel
+
+
+class AttendanceExportJob(BaseModel):
+    start_date: date | None = None
+    end_date: date | None = None
+    department: str | None = None
+    format: Literal["csv", "parquet"] = "csv"
+
+
+class AttendanceMonthlyJob(BaseModel):
+    start_date: date
+    end_date: date
+    group_by: Literal["employee", "department"] = "employee"
+
+
+class JobProgress(BaseModel):
+    done: int
+    total: int | None = None
+
+
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    status: Literal["queued", "running", "done", "failed"]
+    progress: JobProgress
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    expires_at: datetime | None = None
+    error: str | None = None
+    result_url: str | None = None
@@ -0,0 +1,109 @@
+# backend/benchmarks/analytics_bench.py
+"""
+Vectorised analytics vs per-row Python loops at 10k employees × 365 days.
+
+Builds a synthetic AttendanceMatrix (no database) so the numbers isolate
+the computation; the Python baseline walks the equivalent row list the way
+the report endpoints post-process aggregates.
+
+Run from backend/:
+    python -m benchmarks.analytics_bench --employees 10000 --days 365
+"""
+
+import argparse
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+import numpy as np
+
+from app.core import analytics
+from app.core.seed_data import DEPARTMENTS
+
+
+def build_matrix(employees: int, days: int, seed: int = 42) -> analytics.AttendanceMatrix:
+    rng = np.random.default_rng(seed)
+    marked = rng.random((employees, days)) < 0.95
+    present = marked & (rng.random((employees, days)) < 0.75)
+    return analytics.AttendanceMatrix(
+        start_date=date.today() - timedelta(days=days - 1),
+        employee_ids=np.array([f"EMP{i:05d}" for i in range(employees)], dtype=object),
+        departments=np.array(rng.choice(DEPARTMENTS, employees), dtype=object),
+        marked=marked,
+        present=present,
+    )
+
+
+def as_rows(matrix: analytics.AttendanceMatrix) -> list[tuple]:
+    dates = matrix.dates()
+    emp_idx, day_idx = np.nonzero(matrix.marked)
+    return [
+        (matrix.employee_ids[e], matrix.departments[e], dates[d], bool(matrix.present[e, d]))
+        for e, d in zip(emp_idx.tolist(), day_idx.tolist())
+    ]
+
+
+def python_baseline(rows: list[tuple], window: int, limit: int):
+    per_day = defaultdict(lambda: [0, 0])
+    per_dept = defaultdict(lambda: [0, 0])
+    per_weekday = defaultdict(lambda: [0, 0])
+    absences = defaultdict(int)
+
+    for emp_id, dept, day, present in rows:
+        for bucket in (per_day[day], per_dept[dept], per_weekday[day.weekday()]):
+            bucket[0] += present
+            bucket[1] += 1
+        if not present:
+            absences[emp_id] += 1
+
+    days = sorted(per_day)
+    rolling = []
+    for i in range(len(days)):
+        span = days[max(0, i - window + 1):i + 1]
+        p = sum(per_day[d][0] for d in span)
+        t = sum(per_day[d][1] for d in span)
+        rolling.append(p / t * 100 if t else 0)
+
+    top = sorted(absences.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+    return rolling, per_dept, per_weekday, top
+
+
+def vectorised(matrix: analytics.AttendanceMatrix, window: int, limit: int):
+    return (
+        analytics.rolling_rates(matrix, window),
+        analytics.department_rollup(matrix),
+        analytics.weekday_histogram(matrix),
+        analytics.top_absentees(matrix, limit),
+    )
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--window", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    matrix = build_matrix(args.employees, args.days)
+    rows = as_rows(matrix)
+
+    numpy_ms = best_of(lambda: vectorised(matrix, args.window, 10), args.repeat)
+    python_ms = best_of(lambda: python_baseline(rows, args.window, 10), args.repeat)
+
+    print(f"{args.employees} employees × {args.days} days, {len(rows)} marked cells")
+    print(f"python loops: {python_ms:>9.1f} ms")
+    print(f"numpy:        {numpy_ms:>9.1f} ms  ({python_ms / numpy_ms:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
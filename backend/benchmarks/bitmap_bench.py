@@ -0,0 +1,118 @@
+# backend/benchmarks/bitmap_bench.py
+"""
+Calendar month + yearly stats: bitmap store vs row-based path.
+
+The row-based path is what the calendar does today: load the employee's
+attendance rows through the ORM and serialise each one with
+AttendanceResponse. The bitmap path answers from AttendanceBitmapStore,
+after the one statement each request spends checking the event log head.
+
+Run from backend/:
+    python -m benchmarks.bitmap_bench --employees 2000 --days 365
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.bitmaps import AttendanceBitmapStore, month_bounds
+from app.core.database import Base
+from app.core.seed_data import employee_code, seed_employees, seed_attendance
+from app.models.attendance import Attendance
+from app.schemas.attendance import AttendanceResponse
+
+
+def row_based(db, emp_id: str, start: date, end: date):
+    records = (
+        db.query(Attendance)
+        .filter(
+            Attendance.employee_id == emp_id,
+            Attendance.date >= start,
+            Attendance.date <= end,
+        )
+        .order_by(Attendance.date)
+        .all()
+    )
+    rows = [AttendanceResponse.model_validate(r) for r in records]
+    present = sum(r.status == "Present" for r in rows)
+    return len(rows), present
+
+
+def bitmap_based(store: AttendanceBitmapStore, db, emp_id: str, start: date, end: date):
+    # What a request does: one statement for the log head and the employee
+    store.sync(db, emp_id)
+    summary = store.summary(emp_id, start, end)
+    return summary["total_days"], summary["present_days"]
+
+
+def timed(fn, calls) -> list[float]:
+    out = []
+    for args in calls:
+        started = time.perf_counter()
+        fn(*args)
+        out.append((time.perf_counter() - started) * 1_000_000)
+    return sorted(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+
+        seed_employees(db, total=args.employees)
+        seed_attendance(db, days=args.days)
+
+        store = AttendanceBitmapStore()
+        started = time.perf_counter()
+        store.sync(db, "EMP001")
+        build_s = time.perf_counter() - started
+
+        # Separate build for memory: tracemalloc slows allocation down
+        tracemalloc.start()
+        AttendanceBitmapStore().sync(db, "EMP001")
+        store_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        rows = db.query(Attendance).count()
+        rng = random.Random(1)
+        today = date.today()
+
+        month_calls = []
+        year_calls = []
+        for _ in range(args.queries):
+            emp_id = employee_code(rng.randint(1, args.employees))
+            month_calls.append((emp_id, *month_bounds(today.year, today.month)))
+            year_calls.append((emp_id, today - timedelta(days=args.days), today))
+
+        print(f"{rows} attendance rows, bitmap store {store_bytes / 1024 / 1024:.1f} MiB, built in {build_s:.2f}s")
+        print(f"{'query':>6} {'path':>7} {'p50 µs':>10} {'p99 µs':>10}")
+
+        for label, calls in (("month", month_calls), ("year", year_calls)):
+            for name, fn in (
+                ("rows", lambda *a: row_based(db, *a)),
+                ("bitmap", lambda *a: bitmap_based(store, db, *a)),
+            ):
+                t = timed(fn, calls)
+                print(f"{label:>6} {name:>7} {statistics.median(t):>10.1f} {t[int(len(t) * 0.99) - 1]:>10.1f}")
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+# backend/benchmarks/event_log_bench.py
+"""
+"Attendance as of T" from the event log: snapshot + replay vs full replay.
+
+Builds a SQLite log of --events attendance events: every employee marked
+each day, plus --corrections of them re-marked or removed later that day
+for one of the previous 7 days. A snapshot is taken every
+--snapshot-every events while the log grows, as a periodic
+`python -m app.cli snapshot-attendance` would.
+
+Then, at random moments T across the timeline:
+- one employee, the 31 days before T
+- every employee, one day in the week before T
+- every employee, the 31 days before T
+
+each answered from the nearest snapshot plus the events after it, and by
+replaying the whole log up to T. Both must agree.
+
+Run from backend/:
+    python -m benchmarks.event_log_bench --events 10000000
+"""
+
+import argparse
+import math
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.core.event_log import state_as_of, state_records, take_snapshot
+from app.models import employee  # noqa: F401  (attendance's foreign key target)
+from app.models.attendance_event import AttendanceEvent
+
+INSERT_EVENT = (
+    "INSERT INTO attendance_events (recorded_at, employee_id, date, status, source) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+# Days back a correction may reach
+CORRECTION_WINDOW = 7
+
+
+def generate(employees: int, days: int, corrections: float, seed: int):
+    """Yield (recorded_at, employee_id, date, status, source) in log order."""
+    rng = random.Random(seed)
+    ids = [f"EMP{i:05d}" for i in range(1, employees + 1)]
+    start = date.today() - timedelta(days=days)
+
+    for k in range(days):
+        day = start + timedelta(days=k)
+        morning = f"{day} 09:00:00.000000"
+        evening = f"{day} 18:00:00.000000"
+
+        for emp_id in ids:
+            yield morning, emp_id, day.isoformat(), int(rng.random() < 0.75), "bulk"
+
+        for _ in range(int(employees * corrections)):
+            back = rng.randrange(min(k, CORRECTION_WINDOW) + 1)
+            status = None if rng.random() < 0.1 else rng.randrange(2)
+            yield (
+                evening, rng.choice(ids),
+                (day - timedelta(days=back)).isoformat(), status, "mark",
+            )
+
+
+def build(path: str, args) -> tuple[int, int, float, float, date]:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    per_day = args.employees + int(args.employees * args.corrections)
+    days = math.ceil(args.events / per_day)
+
+    conn = sqlite3.connect(path)
+    insert_seconds = snapshot_seconds = 0.0
+    written = snapshots = 0
+    batch = []
+
+    def flush():
+        nonlocal insert_seconds
+        started = time.perf_counter()
+        conn.executemany(INSERT_EVENT, batch)
+        conn.commit()
+        insert_seconds += time.perf_counter() - started
+        batch.clear()
+
+    for event in generate(args.employees, days, args.corrections, args.seed):
+        batch.append(event)
+        written += 1
+
+        if len(batch) >= 50_000:
+            flush()
+
+        if written % args.snapshot_every == 0:
+            flush()
+            started = time.perf_counter()
+            take_snapshot(db)
+            snapshot_seconds += time.perf_counter() - started
+            snapshots += 1
+
+        if written >= args.events:
+            break
+
+    flush()
+    conn.execute("ANALYZE")
+    conn.close()
+    db.close()
+    engine.dispose()
+
+    return written, snapshots, insert_seconds, snapshot_seconds, date.today() - timedelta(days=days)
+
+
+def table_sizes(path: str) -> dict[str, int]:
+    """Bytes per table including its indexes, when SQLite has dbstat."""
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT m.tbl_name, sum(s.pgsize) FROM dbstat s "
+            "JOIN sqlite_master m ON m.name = s.name GROUP BY m.tbl_name"
+        ).fetchall()
+    except sqlite3.OperationalError:
+        rows = []
+    conn.close()
+    return dict(rows)
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - started) * 1000, result
+
+
+def compare(db, moments, query, full_samples: int) -> dict:
+    """Median ms and events replayed, with and without snapshots."""
+    fast_ms, fast_replayed, full_ms, full_replayed = [], [], [], []
+
+    for i, at in enumerate(moments):
+        employee_id, start, end = query(at)
+
+        ms, (state, replayed) = timed(lambda: state_as_of(db, at, employee_id, start, end))
+        fast_ms.append(ms)
+        fast_replayed.append(replayed)
+
+        if i < full_samples:
+            ms, (full, replayed) = timed(
+                lambda: state_as_of(db, at, employee_id, start, end, use_snapshots=False)
+            )
+            full_ms.append(ms)
+            full_replayed.append(replayed)
+
+            expected = list(state_records(full, start, end))
+            assert list(state_records(state, start, end)) == expected, at
+
+    return {
+        "snapshot_ms": statistics.median(fast_ms),
+        "snapshot_replayed": statistics.median(fast_replayed),
+        "full_ms": statistics.median(full_ms),
+        "full_replayed": statistics.median(full_replayed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000_000)
+    parser.add_argument("--employees", type=int, default=20_000)
+    parser.add_argument("--corrections", type=float, default=0.05, help="share of employees corrected per day")
+    parser.add_argument("--snapshot-every", type=int, default=500_000)
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("--full-samples", type=int, default=5, help="samples also answered by full replay")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.db")
+        events, snapshots, insert_s, snapshot_s, first_day = build(path, args)
+        last_day = date.today()
+
+        print(f"{events:,} events, {args.employees:,} employees, {(last_day - first_day).days} days")
+        print(f"  insert: {insert_s:.1f}s ({events / insert_s:,.0f} events/s)")
+        print(f"  {snapshots} snapshots: {snapshot_s:.1f}s total, {snapshot_s / max(snapshots, 1):.2f}s each")
+
+        sizes = table_sizes(path)
+        for table in (AttendanceEvent.__tablename__, "attendance_snapshot_years"):
+            if table in sizes:
+                print(f"  {table} + indexes: {sizes[table] / 1024 / 1024:.1f} MiB")
+
+        rng = random.Random(args.seed)
+        span = (last_day - first_day).days
+        moments = [
+            datetime.combine(first_day + timedelta(days=rng.randrange(1, span)), datetime.min.time())
+            + timedelta(hours=rng.randrange(24))
+            for _ in range(args.samples)
+        ]
+        employees = [f"EMP{i:05d}" for i in range(1, args.employees + 1)]
+
+        def one_employee(at):
+            return rng.choice(employees), at.date() - timedelta(days=30), at.date()
+
+        def one_day(at):
+            day = at.date() - timedelta(days=rng.randrange(CORRECTION_WINDOW))
+            return None, day, day
+
+        def everyone(at):
+            return None, at.date() - timedelta(days=30), at.date()
+
+        engine = create_engine(f"sqlite:///{path}")
+        db = sessionmaker(bind=engine)()
+
+        print(f"\n{'as of T (median)':32}{'snapshot+replay':>18}{'full replay':>14}{'replayed (snap/full)':>24}")
+        queries = (
+            ("one employee, 31 days", one_employee),
+            ("all employees, one day", one_day),
+            ("all employees, 31 days", everyone),
+        )
+        for name, query in queries:
+            r = compare(db, moments, query, args.full_samples)
+            print(
+                f"{name:32}{r['snapshot_ms']:>15.1f} ms{r['full_ms']:>11.1f} ms"
+                f"{r['snapshot_replayed']:>12,.0f} / {r['full_replayed']:,.0f}"
+            )
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+# backend/benchmarks/http_bench.py
+"""
+Reproducible HTTP benchmark for the whole API.
+
+Seeds a scratch SQLite database (python -m app.cli seed), starts the API
+under uvicorn and drives each scenario at a fixed concurrency. Results
+(RPS, p50/p95/p99 latency, server peak RSS) are written as JSON; with
+--baseline the run fails when a scenario regresses beyond --tolerance.
+
+Run from backend/:
+    python -m benchmarks.http_bench --output bench.json
+    python -m benchmarks.http_bench --baseline bench.json --tolerance 0.15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from app.core.seed_data import employee_code
+from benchmarks.load_test import drive, free_port, start_server, wait_ready
+
+
+def scenarios(employees: int, days: int) -> dict:
+    """name → send(client, i); i is unique per request within a scenario."""
+    today = date.today()
+    start = (today - timedelta(days=days)).isoformat()
+
+    def emp(i: int) -> str:
+        return employee_code(i % employees + 1)
+
+    def mark(client, i):
+        # Unique (employee, date) per request, older than the seeded history
+        day = today - timedelta(days=days + 1 + i // employees)
+        return client.post("/attendance", json={
+            "employee_id": emp(i),
+            "date": day.isoformat(),
+            "status": "Present" if i % 4 else "Absent",
+        })
+
+    return {
+        "employees_list": lambda c, i: c.get("/employees"),
+        "employees_page": lambda c, i: c.get("/employees", params={"limit": 50}),
+        "employees_search": lambda c, i: c.get("/employees", params={"search": ["sharma", "priya", "eng", "EMP01"][i % 4]}),
+        "attendance_mark": mark,
+        "attendance_history": lambda c, i: c.get(f"/attendance/{emp(i)}"),
+        "dashboard_today": lambda c, i: c.get("/dashboard/today"),
+        "dashboard_last_30_days": lambda c, i: c.get("/dashboard/last-30-days"),
+        "report_employee": lambda c, i: c.get(f"/reports/attendance/employee/{emp(i)}"),
+        "report_monthly_employee": lambda c, i: c.get(
+            f"/reports/attendance/monthly/{emp(i)}",
+            params={"start_date": start, "end_date": today.isoformat()},
+        ),
+        "report_monthly_org": lambda c, i: c.get(
+            "/reports/attendance/monthly",
+            params={"start_date": start, "end_date": today.isoformat()},
+        ),
+        "report_summary": lambda c, i: c.get("/reports/attendance/summary"),
+    }
+
+
+def peak_rss_kib(pid: int) -> int | None:
+    """High-water RSS of a running process (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    failures = []
+    for name, current in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        if current["rps"] < before["rps"] * (1 - tolerance):
+            failures.append(f"{name}: rps {current['rps']} < baseline {before['rps']}")
+        if current["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            failures.append(f"{name}: p99 {current['p99_ms']}ms > baseline {before['p99_ms']}ms")
+        if current["errors"] > before["errors"]:
+            failures.append(f"{name}: {current['errors']} errors (baseline {before['errors']})")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10, help="seconds per scenario")
+    parser.add_argument("--db-mode", choices=["sync", "async"], default="sync")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--cache", action="store_true", help="keep the response cache on")
+    parser.add_argument("--only", nargs="+", help="run just these scenarios")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed regression, 0.10 = 10%%")
+    args = parser.parse_args()
+
+    all_scenarios = scenarios(args.employees, args.days)
+    selected = {k: v for k, v in all_scenarios.items() if not args.only or k in args.only}
+
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            **{k: v for k, v in vars(args).items() if k not in ("output", "baseline")},
+        },
+        "scenarios": {},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}"}
+
+        subprocess.run(
+            [sys.executable, "-m", "app.cli", "seed",
+             "--employees", str(args.employees), "--days", str(args.days)],
+            env=env, check=True,
+        )
+
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(
+            args.db_mode, db_path, port, args.workers,
+            STARTUP_MODE="none",
+            CACHE_URL="memory" if args.cache else "none",
+        )
+
+        try:
+            asyncio.run(wait_ready(base_url))
+
+            print(f"{'scenario':>24} {'rps':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'errors':>7}")
+            for name, send in selected.items():
+                result = asyncio.run(drive(base_url, args.concurrency, args.duration, send))
+                results["scenarios"][name] = result
+                print(
+                    f"{name:>24} {result['rps']:>9} {result['p50_ms']:>8} "
+                    f"{result['p95_ms']:>8} {result['p99_ms']:>8} {result['errors']:>7}"
+                )
+
+            results["meta"]["server_peak_rss_kib"] = peak_rss_kib(server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"server peak RSS: {results['meta']['server_peak_rss_kib']} KiB")
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            failures = compare(results, json.load(fh), args.tolerance)
+        if failures:
+            print("Regressions:\n  " + "\n  ".join(failures))
+            sys.exit(1)
+        print("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
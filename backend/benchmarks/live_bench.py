@@ -0,0 +1,129 @@
+# backend/benchmarks/live_bench.py
+"""
+Live dashboard feed: memory per idle SSE subscriber and fan-out latency.
+
+Starts the API under uvicorn, opens --subscribers idle /dashboard/live
+streams, then marks attendance --writes times and measures how long each
+write takes to reach every subscriber.
+
+Run from backend/:
+    python -m benchmarks.live_bench --subscribers 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+
+import httpx
+
+from benchmarks.load_test import free_port, start_server, wait_ready
+
+
+def rss_kib(pid: int) -> int | None:
+    """Current RSS of a running process (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+async def subscriber(client: httpx.AsyncClient, ready: asyncio.Event, arrivals: list, ready_count: list, total: int):
+    async with client.stream("GET", "/dashboard/live") as response:
+        async for line in response.aiter_lines():
+            if line.startswith("event: snapshot"):
+                ready_count[0] += 1
+                if ready_count[0] == total:
+                    ready.set()
+            elif line.startswith("event: attendance"):
+                arrivals.append(time.perf_counter())
+
+
+async def run(base_url: str, pid: int, subscribers: int, writes: int) -> dict:
+    limits = httpx.Limits(max_connections=subscribers + 10, max_keepalive_connections=0)
+    baseline_kib = rss_kib(pid)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=None) as client:
+        ready = asyncio.Event()
+        ready_count = [0]
+        arrivals: list[list[float]] = [[] for _ in range(subscribers)]
+
+        started = time.perf_counter()
+        tasks = [
+            asyncio.create_task(subscriber(client, ready, arrivals[i], ready_count, subscribers))
+            for i in range(subscribers)
+        ]
+        await asyncio.wait_for(ready.wait(), 120)
+        connect_s = time.perf_counter() - started
+
+        await asyncio.sleep(1)
+        subscribed_kib = rss_kib(pid)
+
+        today = date.today().isoformat()
+        latencies = []
+        for i in range(writes):
+            sent = time.perf_counter()
+            await client.post("/attendance", json={
+                "employee_id": f"EMP{i + 1:03d}", "date": today, "status": "Present",
+            })
+            # Wait until every subscriber has this write
+            while min(len(a) for a in arrivals) <= i:
+                await asyncio.sleep(0.001)
+            latencies.append((max(a[i] for a in arrivals) - sent) * 1000)
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return {
+        "connect_s": connect_s,
+        "baseline_kib": baseline_kib,
+        "subscribed_kib": subscribed_kib,
+        "latencies_ms": latencies,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=2000)
+    parser.add_argument("--writes", type=int, default=20)
+    parser.add_argument("--mode", choices=["sync", "async"], default="sync")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(args.mode, os.path.join(tmp, "bench.db"), port, 1, CACHE_URL="none")
+
+        try:
+            asyncio.run(wait_ready(base_url))
+            result = asyncio.run(run(base_url, server.pid, args.subscribers, args.writes))
+        finally:
+            server.terminate()
+            server.wait()
+
+    per_subscriber = (result["subscribed_kib"] - result["baseline_kib"]) / args.subscribers
+    latencies = sorted(result["latencies_ms"])
+
+    print(json.dumps({
+        "subscribers": args.subscribers,
+        "connect_seconds": round(result["connect_s"], 2),
+        "server_rss_kib": {"idle": result["baseline_kib"], "subscribed": result["subscribed_kib"]},
+        "kib_per_subscriber": round(per_subscriber, 1),
+        "fanout_ms_to_last_subscriber": {
+            "p50": round(statistics.median(latencies), 2),
+            "max": round(latencies[-1], 2),
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# backend/benchmarks/load_test.py
+"""
+Sync vs async handler throughput under concurrent load.
+
+Starts the API under uvicorn once per DB_MODE against a scratch SQLite
+database and drives read endpoints with N concurrent clients.
+Needs httpx (client) and aiosqlite (async mode).
+
+Run from backend/:
+    python -m benchmarks.load_test --concurrency 500 --duration 20
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+PATHS = [
+    "/employees",
+    "/dashboard/today",
+    "/dashboard/last-30-days",
+    "/reports/attendance/summary",
+    "/reports/attendance/employee/EMP001",
+    "/attendance/EMP002",
+]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(mode: str, db_path: str, port: int, workers: int, **env_overrides) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DB_MODE": mode,
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        **env_overrides,
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(port),
+            "--workers", str(workers),
+            "--log-level", "warning",
+        ],
+        env=env,
+    )
+
+
+async def wait_ready(base_url: str, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/dashboard/today")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def get_paths(client: httpx.AsyncClient, i: int):
+    return client.get(PATHS[i % len(PATHS)])
+
+
+async def drive(base_url: str, concurrency: int, duration: float, send=get_paths) -> dict:
+    """
+    `concurrency` clients issue `send(client, i)` back to back for
+    `duration` seconds; i is unique across all clients.
+    """
+    latencies: list[float] = []
+    errors = 0
+    stop_at = time.monotonic() + duration
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+
+        async def worker(offset: int):
+            nonlocal errors
+            i = offset
+            while time.monotonic() < stop_at:
+                start = time.perf_counter()
+                try:
+                    response = await send(client, i)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+                i += concurrency
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(pct(0.50), 2),
+        "p95_ms": round(pct(0.95), 2),
+        "p99_ms": round(pct(0.99), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--modes", nargs="+", default=["sync", "async"])
+    args = parser.parse_args()
+
+    print(f"{'mode':>6} {'requests':>9} {'errors':>7} {'rps':>9} {'p50 ms':>9} {'p99 ms':>9}")
+
+    for mode in args.modes:
+        with tempfile.TemporaryDirectory() as tmp:
+            port = free_port()
+            base_url = f"http://127.0.0.1:{port}"
+            server = start_server(mode, os.path.join(tmp, "bench.db"), port, args.workers)
+
+            try:
+                asyncio.run(wait_ready(base_url))
+                result = asyncio.run(drive(base_url, args.concurrency, args.duration))
+            finally:
+                server.terminate()
+                server.wait()
+
+        print(
+            f"{mode:>6} {result['requests']:>9} {result['errors']:>7} {result['rps']:>9} "
+            f"{result['p50_ms']:>9} {result['p99_ms']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# backend/benchmarks/report_memory_bench.py
+"""
+Server memory while streaming the organization monthly report.
+
+Seeds a scratch SQLite database (python -m app.cli seed), starts the API
+under uvicorn and reads GET /reports/attendance/monthly over the whole
+seeded range, once per group_by. Records the server's RSS when idle and
+its peak RSS afterwards. A report built in memory instead of streamed
+shows up as a peak that grows with headcount × months; SQLite's mmap and
+page cache (SQLITE_MMAP_SIZE, SQLITE_CACHE_SIZE) are counted too.
+
+Run from backend/:
+    python -m benchmarks.report_memory_bench --employees 5000 --months 12
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import httpx
+
+from benchmarks.http_bench import peak_rss_kib
+from benchmarks.load_test import free_port, start_server, wait_ready
+
+
+def rss_kib(pid: int) -> int | None:
+    """Current RSS of a running process (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+async def stream_report(base_url: str, params: dict) -> dict:
+    lines = size = 0
+    start = time.perf_counter()
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+        async with client.stream("GET", "/reports/attendance/monthly", params=params) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line:
+                    lines += 1
+                    size += len(line) + 1
+
+    return {
+        "lines": lines,
+        "mib": round(size / 2**20, 1),
+        "seconds": round(time.perf_counter() - start, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=5000)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--output", help="write results JSON here")
+    args = parser.parse_args()
+
+    days = args.months * 365 // 12
+    today = date.today()
+    params = {
+        "start_date": (today - timedelta(days=days)).isoformat(),
+        "end_date": today.isoformat(),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}"}
+
+        subprocess.run(
+            [sys.executable, "-m", "app.cli", "seed",
+             "--employees", str(args.employees), "--days", str(days)],
+            env=env, check=True,
+        )
+
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server("sync", db_path, port, 1, STARTUP_MODE="none", CACHE_URL="none")
+
+        try:
+            asyncio.run(wait_ready(base_url))
+            idle_kib = rss_kib(server.pid)
+
+            runs = {}
+            for group_by in ("employee", "department"):
+                runs[group_by] = asyncio.run(stream_report(base_url, {**params, "group_by": group_by}))
+                print(f"{group_by:>10}: {runs[group_by]}")
+
+            peak_kib = peak_rss_kib(server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"server RSS idle: {idle_kib} KiB, peak: {peak_kib} KiB")
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump({
+                "meta": {
+                    **{k: v for k, v in vars(args).items() if k != "output"},
+                    "range": params,
+                    # mmap and the page cache count towards RSS
+                    **{k: v for k, v in os.environ.items() if k.startswith("SQLITE_")},
+                },
+                "server_idle_rss_kib": idle_kib,
+                "server_peak_rss_kib": peak_kib,
+                "runs": runs,
+            }, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
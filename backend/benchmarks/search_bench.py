@@ -0,0 +1,96 @@
+# backend/benchmarks/search_bench.py
+"""
+Employee search: FTS5 index vs legacy four-way ILIKE scan.
+
+Run from backend/:
+    python -m benchmarks.search_bench --sizes 10000 100000 1000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.core.search import apply_search, ensure_search_index, ilike_filter
+from app.models.employee import Employee
+
+FIRST = ["Aarav", "Vivaan", "Aditya", "Rohan", "Ananya", "Priya", "Neha", "Kriti", "Pooja", "Sneha"]
+LAST = ["Sharma", "Verma", "Singh", "Mehta", "Patel", "Gupta", "Nair", "Rao", "Iyer", "Kapoor"]
+DEPARTMENTS = ["Engineering", "HR", "Finance", "Sales", "Marketing", "Operations", "Support", "IT"]
+
+TERMS = ["EMP0001", "priya", "sharma", "neha ver", "engin", "kapoor@"]
+
+
+def build_db(path: str, size: int, seed: int = 42):
+    rng = random.Random(seed)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+
+    rows = []
+    for i in range(1, size + 1):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        rows.append({
+            "employee_id": f"EMP{i:07d}",
+            "full_name": f"{first} {last}",
+            "email": f"{first.lower()}.{last.lower()}{i}@company.com",
+            "department": rng.choice(DEPARTMENTS),
+        })
+
+    with engine.begin() as conn:
+        for i in range(0, len(rows), 50_000):
+            conn.execute(insert(Employee), rows[i:i + 50_000])
+
+    # Index is built after the load, the way an existing database is migrated
+    ensure_search_index(engine)
+    return engine
+
+
+def time_queries(session, build, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        for term in TERMS:
+            start = time.perf_counter()
+            build(session, term).limit(50).all()
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def ilike(session, term):
+    return session.query(Employee).filter(ilike_filter(term)).order_by(Employee.employee_id)
+
+
+def fts(session, term):
+    query, _ = apply_search(session.query(Employee), term)
+    return query.order_by(Employee.employee_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'employees':>10} {'path':>6} {'p50 ms':>10} {'p95 ms':>10}")
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = build_db(os.path.join(tmp, "bench.db"), size)
+            session = sessionmaker(bind=engine)()
+
+            for name, build in (("ilike", ilike), ("fts5", fts)):
+                timings = sorted(time_queries(session, build, args.repeat))
+                p95 = timings[int(len(timings) * 0.95) - 1]
+                print(f"{size:>10} {name:>6} {statistics.median(timings):>10.2f} {p95:>10.2f}")
+
+            session.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
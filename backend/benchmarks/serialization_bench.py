@@ -0,0 +1,112 @@
+# backend/benchmarks/serialization_bench.py
+"""
+Rows/sec of list responses: per-row Pydantic models vs Core tuples to JSON.
+
+- orm + response_model: what FastAPI did before; ORM objects, one validated
+  model per row, dumped to JSON-able Python and encoded with json.dumps
+- orm + TypeAdapter: the same objects validated and dumped in one batch call
+- core + rows_response: tuples from a Core select, encoded by
+  app.core.serialization (orjson when installed)
+
+Each timing includes the SQL fetch, so ORM identity-map cost is counted.
+
+Run from backend/:
+    python -m benchmarks.serialization_bench --employees 100000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import serialization
+from app.core.database import Base
+from app.core.seed_data import seed_employees, seed_attendance
+from app.models.attendance import Attendance
+from app.models.employee import Employee
+from app.schemas.attendance import AttendanceResponse
+from app.schemas.employee import EmployeeResponse
+
+
+def orm_response_model(db, model, schema):
+    adapter = TypeAdapter(list[schema])
+    rows = db.query(model).all()
+    validated = adapter.validate_python(rows, from_attributes=True)
+    body = json.dumps(adapter.dump_python(validated, mode="json")).encode()
+    db.expunge_all()
+    return body
+
+
+def orm_type_adapter(db, model, schema):
+    adapter = TypeAdapter(list[schema])
+    rows = db.query(model).all()
+    body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    db.expunge_all()
+    return body
+
+
+def core_rows(db, model, schema):
+    columns = tuple(schema.model_fields)
+    rows = db.query(*[getattr(model, c) for c in columns]).all()
+    return serialization.rows_response(rows, columns).body
+
+
+PATHS = {
+    "orm + response_model": orm_response_model,
+    "orm + TypeAdapter": orm_type_adapter,
+    "core + rows_response": core_rows,
+}
+
+
+def measure(db, fn, model, schema, repeat: int) -> tuple[float, bytes]:
+    timings = []
+    body = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = fn(db, model, schema)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=1, help="attendance rows per employee")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    encoder = "orjson" if serialization.orjson is not None else "json"
+    print(f"encoder: {encoder}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+
+        seed_employees(db, total=args.employees)
+        seed_attendance(db, days=args.days)
+
+        for model, schema in ((Employee, EmployeeResponse), (Attendance, AttendanceResponse)):
+            count = db.query(model).count()
+            print(f"\n{model.__tablename__}: {count} rows")
+
+            bodies = {}
+            for name, fn in PATHS.items():
+                seconds, bodies[name] = measure(db, fn, model, schema, args.repeat)
+                print(f"  {name:24} {seconds * 1000:9.1f} ms  {count / seconds:>12,.0f} rows/s")
+
+            # Same document whichever path produced it
+            decoded = {json.dumps(json.loads(b), sort_keys=True) for b in bodies.values()}
+            print(f"  identical output: {len(decoded) == 1}")
+
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
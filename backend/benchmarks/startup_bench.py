@@ -0,0 +1,76 @@
+# backend/benchmarks/startup_bench.py
+"""
+Cold start: time from a fresh interpreter importing app.main to the first
+successful request, per STARTUP_MODE. Exits non-zero when the median of
+the measured mode exceeds --budget-ms.
+
+Run from backend/:
+    python -m app.cli bootstrap --seed      # DB the workers will boot against
+    python -m benchmarks.startup_bench --mode none
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Import to first response, per mode; about 750 ms on the reference machine
+DEFAULT_BUDGET_MS = 1500
+
+# Executed in a fresh interpreter so nothing is already imported
+PROBE = """
+import json, time
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    assert client.get("/dashboard/today").status_code == 200
+done = time.perf_counter()
+print(json.dumps({"import_ms": (imported - started) * 1000, "first_request_ms": (done - started) * 1000}))
+"""
+
+
+def measure(mode: str) -> dict:
+    env = {**os.environ, "STARTUP_MODE": mode}
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mode", nargs="+", default=["none", "migrate", "dev"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+        help="fail if any mode's median first request is slower (0 disables)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'mode':>8} {'import ms':>10} {'first request ms':>17}")
+    over_budget = []
+
+    for mode in args.mode:
+        runs = [measure(mode) for _ in range(args.runs)]
+        import_ms = statistics.median(r["import_ms"] for r in runs)
+        first_ms = statistics.median(r["first_request_ms"] for r in runs)
+        print(f"{mode:>8} {import_ms:>10.1f} {first_ms:>17.1f}")
+
+        if args.budget_ms and first_ms > args.budget_ms:
+            over_budget.append(mode)
+
+    if over_budget:
+        print(f"Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# backend/benchmarks/storage_bench.py
+"""
+On-disk size and scan time of attendance storage layouts.
+
+Three copies of the same multi-year SQLite dataset:
+- text:     status as "Present"/"Absent" strings, one table (the old schema)
+- coded:    status as SMALLINT codes, one table
+- archived: coded, rows older than --hot-days moved to attendance_archive
+
+Every file is VACUUMed before it is measured. Recent-range queries read the
+hot table and full-history queries the history view, as the API routes them.
+
+Run from backend/:
+    python -m benchmarks.storage_bench --employees 300 --years 5
+"""
+
+import argparse
+import os
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.bootstrap import migrate_status_codes
+from app.core.database import Base
+from app.core.partitions import archive_attendance, ensure_history_view
+from app.core.seed_data import seed_employees, seed_attendance
+
+# The attendance table as it was before status codes
+TEXT_SCHEMA = [
+    """
+    CREATE TABLE attendance_text (
+        id INTEGER NOT NULL PRIMARY KEY,
+        employee_id VARCHAR NOT NULL REFERENCES employees (employee_id) ON DELETE CASCADE,
+        date DATE NOT NULL,
+        status VARCHAR NOT NULL,
+        CONSTRAINT unique_text_employee_date UNIQUE (employee_id, date)
+    )
+    """,
+    "INSERT INTO attendance_text SELECT id, employee_id, date, "
+    "CASE status WHEN 1 THEN 'Present' ELSE 'Absent' END FROM attendance",
+    "DROP VIEW attendance_history",
+    "DROP TABLE attendance",
+    "ALTER TABLE attendance_text RENAME TO attendance",
+    "CREATE INDEX ix_attendance_id ON attendance (id)",
+    "CREATE INDEX ix_attendance_date_status ON attendance (date, status)",
+    "CREATE INDEX ix_attendance_employee_date_status ON attendance (employee_id, date, status)",
+]
+
+# name → (SQL with {src} / {present}, uses the full history)
+QUERIES = {
+    "summary, last 30 days": (
+        "SELECT count(*), sum(status = {present}) FROM {src} WHERE date >= :recent",
+        False,
+    ),
+    "department months, last 90 days": (
+        "SELECT strftime('%Y-%m', a.date), e.department, count(*), sum(a.status = {present}) "
+        "FROM {src} a JOIN employees e ON e.employee_id = a.employee_id "
+        "WHERE a.date >= :quarter GROUP BY 1, 2",
+        False,
+    ),
+    "employee history, all years": (
+        "SELECT date, status FROM {src} WHERE employee_id = :emp ORDER BY date DESC",
+        True,
+    ),
+    "summary, all years": (
+        "SELECT count(*), sum(status = {present}) FROM {src}",
+        True,
+    ),
+}
+
+
+def build(path: str, employees: int, days: int):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    migrate_status_codes(engine)
+    ensure_history_view(engine)
+
+    db = sessionmaker(bind=engine)()
+    seed_employees(db, total=employees)
+    rows = seed_attendance(db, days=days)
+    db.close()
+    engine.dispose()
+    return rows
+
+
+def to_text(path: str):
+    conn = sqlite3.connect(path)
+    for statement in TEXT_SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+    conn.close()
+
+
+def to_archived(path: str, hot_days: int):
+    engine = create_engine(f"sqlite:///{path}")
+    db = sessionmaker(bind=engine)()
+    moved = archive_attendance(db, date.today() - timedelta(days=hot_days))
+    db.close()
+    engine.dispose()
+    return moved
+
+
+def table_sizes(conn) -> dict[str, int]:
+    """Bytes per table including its indexes, when SQLite has dbstat."""
+    try:
+        rows = conn.execute(
+            "SELECT m.tbl_name, sum(s.pgsize) FROM dbstat s "
+            "JOIN sqlite_master m ON m.name = s.name GROUP BY m.tbl_name"
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return {}
+    return dict(rows)
+
+
+def time_query(conn, sql: str, params: dict, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def measure(path: str, layout: str, repeat: int) -> dict:
+    conn = sqlite3.connect(path)
+    conn.execute("VACUUM")
+    conn.execute("ANALYZE")
+
+    today = date.today()
+    params = {
+        "recent": (today - timedelta(days=30)).isoformat(),
+        "quarter": (today - timedelta(days=90)).isoformat(),
+        "emp": "EMP001",
+    }
+    present = "'Present'" if layout == "text" else "1"
+
+    timings = {}
+    for name, (sql, history) in QUERIES.items():
+        src = "attendance_history" if layout == "archived" and history else "attendance"
+        timings[name] = time_query(conn, sql.format(src=src, present=present), params, repeat)
+
+    sizes = table_sizes(conn)
+    conn.close()
+
+    return {
+        "file_bytes": os.path.getsize(path),
+        "hot_bytes": sizes.get("attendance"),
+        "timings": timings,
+    }
+
+
+def mib(n) -> str:
+    return "n/a" if n is None else f"{n / 1024 / 1024:.1f} MiB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=300)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--hot-days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    days = args.years * 365
+
+    with tempfile.TemporaryDirectory() as tmp:
+        coded = os.path.join(tmp, "coded.db")
+        rows = build(coded, args.employees, days)
+        print(f"{args.employees} employees × {days} days = {rows} attendance rows")
+
+        text = os.path.join(tmp, "text.db")
+        archived = os.path.join(tmp, "archived.db")
+        shutil.copy(coded, text)
+        shutil.copy(coded, archived)
+        to_text(text)
+        moved = to_archived(archived, args.hot_days)
+        print(f"archived layout: {moved} rows older than {args.hot_days} days in attendance_archive\n")
+
+        results = {
+            layout: measure(path, layout, args.repeat)
+            for layout, path in (("text", text), ("coded", coded), ("archived", archived))
+        }
+
+    print(f"{'':38}" + "".join(f"{layout:>14}" for layout in results))
+    print(f"{'file size':38}" + "".join(f"{mib(r['file_bytes']):>14}" for r in results.values()))
+    print(f"{'attendance table + indexes':38}" + "".join(f"{mib(r['hot_bytes']):>14}" for r in results.values()))
+    for name in QUERIES:
+        print(f"{name + ' (ms)':38}" + "".join(f"{r['timings'][name]:>14.2f}" for r in results.values()))
+
+
+if __name__ == "__main__":
+    main()
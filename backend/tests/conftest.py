@@ -0,0 +1,79 @@
+# backend/tests/conftest.py
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--database-url",
+        help="run against this database (e.g. an empty PostgreSQL one) "
+             "instead of a scratch SQLite file; the suite seeds and writes to it",
+    )
+
+
+def pytest_configure(config):
+    # Settings are read at import time: point everything at the test
+    # database and a scratch directory before the app is imported
+    scratch = tempfile.mkdtemp(prefix="hrms-tests-")
+    os.environ["DATABASE_URL"] = (
+        config.getoption("database_url") or f"sqlite:///{scratch}/hrms.db"
+    )
+    os.environ["STARTUP_MODE"] = "dev"
+    os.environ["CACHE_URL"] = "none"
+    os.environ["JOBS_DIR"] = os.path.join(scratch, "jobs")
+
+    config.addinivalue_line(
+        "markers", "sqlite_only: relies on SQLite (PRAGMAs, FTS5, query plans); skipped elsewhere"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    from app.core.database import engine
+
+    if engine.dialect.name == "sqlite":
+        return
+
+    skip = pytest.mark.skip(reason=f"SQLite only, running on {engine.dialect.name}")
+    for item in items:
+        if "sqlite_only" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """The app with demo data seeded once for the whole run."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@contextmanager
+def count_statements(bind=None):
+    """Collects every SQL statement sent through `bind` (default: the app's engine) inside the block."""
+    from sqlalchemy import event
+
+    from app.core.database import engine
+
+    bind = bind or engine
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def statements():
+    return count_statements
@@ -0,0 +1,117 @@
+# backend/tests/test_analytics.py
+
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.database import SessionLocal
+from app.models.attendance import Attendance
+from app.models.employee import Employee
+
+END = date.today() - timedelta(days=1)
+START = END - timedelta(days=20)
+RANGE = {"start_date": START.isoformat(), "end_date": END.isoformat()}
+
+
+@pytest.fixture
+def marks(client) -> tuple[dict, list]:
+    """Plain-Python view of the range: {employee_id: department}, [(employee_id, date, present)]."""
+    db = SessionLocal()
+    try:
+        departments = dict(db.query(Employee.employee_id, Employee.department))
+        rows = [
+            (emp_id, day, st == "Present")
+            for emp_id, day, st in db.query(Attendance.employee_id, Attendance.date, Attendance.status)
+            .filter(Attendance.date >= START, Attendance.date <= END)
+        ]
+    finally:
+        db.close()
+    return departments, rows
+
+
+def rate(present, total):
+    return pytest.approx(present * 100 / total if total else 0, abs=0.01)
+
+
+def test_departments_match_plain_python(client, marks):
+    departments, rows = marks
+    present, total = Counter(), Counter()
+    for emp_id, _, is_present in rows:
+        total[departments[emp_id]] += 1
+        present[departments[emp_id]] += is_present
+
+    response = client.get("/reports/analytics/departments", params=RANGE)
+
+    assert response.json() == [
+        {
+            "department": name,
+            "employees": headcount,
+            "present": present[name],
+            "absent": total[name] - present[name],
+            "total": total[name],
+            "attendance_rate": rate(present[name], total[name]),
+        }
+        for name, headcount in sorted(Counter(departments.values()).items())
+    ]
+
+
+def test_weekdays_match_plain_python(client, marks):
+    _, rows = marks
+    present, total = Counter(), Counter()
+    for _, day, is_present in rows:
+        total[day.weekday()] += 1
+        present[day.weekday()] += is_present
+
+    body = client.get("/reports/analytics/weekdays", params=RANGE).json()
+
+    assert [(d["present"], d["total"]) for d in body] == [(present[i], total[i]) for i in range(7)]
+    assert [d["attendance_rate"] for d in body] == [rate(present[i], total[i]) for i in range(7)]
+
+
+def test_rolling_rates_match_plain_python(client, marks):
+    _, rows = marks
+    per_day = defaultdict(lambda: [0, 0])
+    for _, day, is_present in rows:
+        per_day[day][0] += is_present
+        per_day[day][1] += 1
+
+    body = client.get("/reports/analytics/rolling", params={**RANGE, "window": 7}).json()
+
+    days = [START + timedelta(days=i) for i in range((END - START).days + 1)]
+    assert [d["date"] for d in body] == [day.isoformat() for day in days]
+    for i, (day, entry) in enumerate(zip(days, body)):
+        window = [per_day[d] for d in days[max(0, i - 6):i + 1]]
+        assert (entry["present"], entry["total"]) == tuple(per_day[day])
+        assert entry["rolling_7d_rate"] == rate(sum(p for p, _ in window), sum(t for _, t in window))
+
+
+def test_top_absentees_match_plain_python(client, marks):
+    departments, rows = marks
+    absent, total = Counter(), Counter()
+    for emp_id, _, is_present in rows:
+        total[emp_id] += 1
+        absent[emp_id] += not is_present
+
+    body = client.get("/reports/analytics/top-absentees", params={**RANGE, "limit": 5}).json()
+
+    expected = sorted(departments, key=lambda e: (-absent[e], e))[:5]
+    assert [d["employee_id"] for d in body] == expected
+    assert [d["absent_days"] for d in body] == [absent[e] for e in expected]
+    assert [d["total_days"] for d in body] == [total[e] for e in expected]
+
+
+@pytest.mark.parametrize("params", [
+    {"end_date": "0001-01-05"},
+    {"start_date": "2024-02-01", "end_date": "2024-01-01"},
+    {"start_date": "2000-01-01", "end_date": "2024-01-01"},
+])
+def test_analytics_rejects_bad_ranges(client, params):
+    assert client.get("/reports/analytics/rolling", params=params).status_code == 400
+
+
+def test_analytics_earliest_dates(client):
+    params = {"start_date": "0001-01-01", "end_date": "0001-01-05"}
+    response = client.get("/reports/analytics/rolling", params=params)
+    assert response.status_code == 200
+    assert [d["total"] for d in response.json()] == [0] * 5
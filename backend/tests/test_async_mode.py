@@ -0,0 +1,69 @@
+# backend/tests/test_async_mode.py
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+# DB_MODE is read at import time, so the app runs in its own interpreter
+PROBE = """
+from datetime import date
+from fastapi.testclient import TestClient
+from app.main import app
+
+today = date.today().isoformat()
+
+with TestClient(app) as client:
+    employees = client.get("/employees").json()
+    assert len(employees) == 50, employees
+
+    created = client.post("/employees", json={
+        "employee_id": "ASYNC001", "full_name": "Async Probe",
+        "email": "async.probe@company.com", "department": "IT",
+    })
+    assert created.status_code == 201, created.text
+
+    marked = client.post("/attendance", json={"employee_id": "ASYNC001", "date": today, "status": "Present"})
+    assert marked.status_code == 201, marked.text
+    again = client.post("/attendance", json={"employee_id": "ASYNC001", "date": today, "status": "Absent"})
+    assert again.status_code == 400, again.text
+
+    bulk = client.post("/attendance/bulk", json=[
+        {"employee_id": "ASYNC001", "date": today, "status": "Absent"},
+        {"employee_id": "EMP001", "date": today, "status": "Present"},
+        {"employee_id": "NOBODY", "date": today, "status": "Present"},
+    ]).json()
+    assert (bulk["created"], bulk["updated"], bulk["rejected"]) == (1, 1, 1), bulk
+
+    records = client.get("/attendance/ASYNC001").json()
+    assert [(r["date"], r["status"]) for r in records] == [(today, "Absent")], records
+
+    today_stats = client.get("/dashboard/today").json()
+    assert today_stats["present_today"] == 1 and today_stats["absent_today"] == 1, today_stats
+
+    summary = client.get("/reports/attendance/summary").json()
+    assert summary["total_records"] > 0, summary
+
+    assert client.get("/attendance/NOBODY").status_code == 404
+    assert client.delete("/employees/ASYNC001").status_code == 200
+    assert client.get("/attendance/ASYNC001").status_code == 404
+
+print("ok")
+"""
+
+
+def test_routes_served_through_async_sessions(tmp_path):
+    env = {
+        **os.environ,
+        "DB_MODE": "async",
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'async.db'}",
+        "STARTUP_MODE": "dev",
+        "CACHE_URL": "none",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=BACKEND, env=env, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
@@ -0,0 +1,161 @@
+# backend/tests/test_attendance.py
+
+import threading
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.database import SessionLocal
+from app.models.attendance import Attendance
+from app.models.attendance_daily import AttendanceDaily
+from app.routes.attendance import MAX_MATRIX_DAYS, bulk_mark_attendance
+from app.schemas.attendance import MAX_BULK_ATTENDANCE, CreateAttendance
+
+DAY = date(2020, 1, 6)
+
+
+def test_concurrent_bulk_marks_keep_aggregates_exact(client):
+    def mark(worker: int):
+        for round_ in range(10):
+            status = "Present" if (worker + round_) % 2 else "Absent"
+            records = [
+                CreateAttendance(employee_id=f"EMP{i:03d}", date=DAY, status=status)
+                for i in range(1, 21)
+            ]
+            db = SessionLocal()
+            try:
+                bulk_mark_attendance(records, db)
+            finally:
+                db.close()
+
+    threads = [threading.Thread(target=mark, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    db = SessionLocal()
+    try:
+        stored = tuple(
+            db.execute(select(func.count()).where(Attendance.date == DAY, *where)).scalar()
+            for where in ((), (Attendance.status == "Present",))
+        )
+        aggregated = db.execute(
+            select(func.sum(AttendanceDaily.total), func.sum(AttendanceDaily.present))
+            .where(AttendanceDaily.date == DAY)
+        ).one()
+    finally:
+        db.close()
+
+    assert stored[0] == 20
+    assert tuple(aggregated) == stored
+
+
+def test_bulk_mark_rejects_oversized_batches(client):
+    record = {"employee_id": "EMP001", "date": DAY.isoformat(), "status": "Present"}
+
+    response = client.post("/attendance/bulk", json=[record] * (MAX_BULK_ATTENDANCE + 1))
+    assert response.status_code == 422
+
+
+# ----------------------------
+# Team matrix
+# ----------------------------
+MATRIX_DEPARTMENT = "Matrix Team"
+MATRIX_START = date(2019, 6, 3)
+
+
+@pytest.fixture
+def matrix_team(client):
+    """MTX1 with a few marks, MTX2 with none, both in their own department."""
+    for emp_id in ("MTX2", "MTX1"):
+        client.post("/employees", json={
+            "employee_id": emp_id,
+            "full_name": f"Matrix {emp_id}",
+            "email": f"{emp_id.lower()}@company.com",
+            "department": MATRIX_DEPARTMENT,
+        })
+
+    marks = {0: "Present", 2: "Absent", 3: "Present", 6: "Absent"}
+    client.post("/attendance/bulk", json=[
+        {"employee_id": "MTX1", "date": (MATRIX_START + timedelta(days=d)).isoformat(), "status": st}
+        for d, st in marks.items()
+    ])
+
+    yield
+    client.post("/employees/offboard", json={"employee_ids": ["MTX1", "MTX2"]})
+
+
+def get_matrix(client, start: date, end: date, department: str = MATRIX_DEPARTMENT):
+    return client.get("/attendance/matrix", params={
+        "department": department,
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+    })
+
+
+def test_matrix_encodes_each_day(client, matrix_team):
+    response = get_matrix(client, MATRIX_START, MATRIX_START + timedelta(days=6))
+    assert response.status_code == 200
+
+    body = response.json()
+    assert (body["department"], body["start_date"], body["end_date"]) == (
+        MATRIX_DEPARTMENT, "2019-06-03", "2019-06-09",
+    )
+    # Only the department, ordered by employee_id
+    assert body["employees"] == [
+        {"employee_id": "MTX1", "full_name": "Matrix MTX1", "days": "P-AP--A"},
+        {"employee_id": "MTX2", "full_name": "Matrix MTX2", "days": "-------"},
+    ]
+
+    # Offsets are from start_date, and marks outside the range are left out
+    shifted = get_matrix(client, MATRIX_START + timedelta(days=2), MATRIX_START + timedelta(days=4)).json()
+    assert [e["days"] for e in shifted["employees"]] == ["AP-", "---"]
+
+
+def test_matrix_agrees_with_employee_history(client, matrix_team):
+    end = MATRIX_START + timedelta(days=6)
+    [row, _] = get_matrix(client, MATRIX_START, end).json()["employees"]
+
+    history = client.get("/attendance/MTX1").json()
+    expected = ["-"] * 7
+    for record in history:
+        day = date.fromisoformat(record["date"])
+        if MATRIX_START <= day <= end:
+            expected[(day - MATRIX_START).days] = record["status"][0]
+    assert row["days"] == "".join(expected)
+
+
+def test_matrix_with_no_marks_or_no_employees(client, matrix_team):
+    unmarked = get_matrix(client, date(2018, 1, 1), date(2018, 1, 31)).json()
+    assert [e["days"] for e in unmarked["employees"]] == ["-" * 31] * 2
+
+    assert get_matrix(client, MATRIX_START, MATRIX_START, department="Nobody").json()["employees"] == []
+
+
+def test_matrix_range_is_capped(client, matrix_team):
+    longest = get_matrix(client, MATRIX_START, MATRIX_START + timedelta(days=MAX_MATRIX_DAYS - 1))
+    assert longest.status_code == 200
+    assert {len(e["days"]) for e in longest.json()["employees"]} == {MAX_MATRIX_DAYS}
+
+    too_long = get_matrix(client, MATRIX_START, MATRIX_START + timedelta(days=MAX_MATRIX_DAYS))
+    assert too_long.status_code == 400
+    assert str(MAX_MATRIX_DAYS) in too_long.json()["detail"]
+
+    reversed_range = get_matrix(client, MATRIX_START, MATRIX_START - timedelta(days=1))
+    assert reversed_range.status_code == 400
+
+
+def test_matrix_is_not_routed_as_an_employee_id(client):
+    # Validated as the matrix route, not looked up as employee "matrix"
+    missing = client.get("/attendance/matrix")
+    assert missing.status_code == 422
+    assert {err["loc"][-1] for err in missing.json()["detail"]} == {"department", "start_date", "end_date"}
+
+    found = get_matrix(client, MATRIX_START, MATRIX_START, department="Engineering")
+    assert found.status_code == 200
+    assert isinstance(found.json(), dict)
+
+    # Other ids still reach /{employee_id}
+    assert client.get("/attendance/NOT_AN_EMPLOYEE").status_code == 404
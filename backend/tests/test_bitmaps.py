@@ -0,0 +1,49 @@
+# backend/tests/test_bitmaps.py
+
+from app.core.database import SessionLocal
+from app.core.event_log import log_attendance
+from app.models.attendance import Attendance
+
+
+def calendar_day(client, record: Attendance) -> str:
+    day = record.date
+    response = client.get(
+        f"/attendance/{record.employee_id}/calendar",
+        params={"year": day.year, "month": day.month},
+    )
+    assert response.status_code == 200
+    return response.json()["days"][day.day - 1]
+
+
+def test_calendar_sees_writes_made_outside_this_process(client):
+    db = SessionLocal()
+    try:
+        record = db.query(Attendance).order_by(Attendance.id).first()
+        before = calendar_day(client, record)
+
+        # As another worker or a CLI command would: no in-process hook runs
+        flipped = "Absent" if record.status == "Present" else "Present"
+        record.status = flipped
+        log_attendance(db, [(record.employee_id, record.date, flipped)], "mark")
+        db.commit()
+
+        assert before == ("P" if flipped == "Absent" else "A")
+        assert calendar_day(client, record) == flipped[0]
+    finally:
+        db.close()
+
+
+def test_calendar_unknown_employee(client):
+    response = client.get("/attendance/EMP_MISSING/calendar", params={"year": 2024, "month": 1})
+    assert response.status_code == 404
+
+
+def test_calendar_last_supported_month(client):
+    response = client.get("/attendance/EMP001/calendar", params={"year": 9999, "month": 12})
+    assert response.status_code == 200
+    assert response.json()["days"] == "-" * 31
+
+
+def test_calendar_february_of_a_leap_year(client):
+    response = client.get("/attendance/EMP001/calendar", params={"year": 2024, "month": 2})
+    assert len(response.json()["days"]) == 29
@@ -0,0 +1,27 @@
+# backend/tests/test_cache.py
+
+import pytest
+
+from app.core import cache as response_cache
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    monkeypatch.setattr(response_cache, "cache", response_cache.MemoryCache())
+
+
+def test_encoded_separators_do_not_share_a_key(client, memory_cache):
+    first, second = (e["full_name"].split()[0] for e in client.get("/employees").json()[:2])
+
+    # One parameter whose value merely looks like two
+    smuggled = client.get(f"/employees?search={first}%26search%3D{second}")
+    assert smuggled.headers["X-Cache"] == "MISS"
+
+    repeated = client.get("/employees", params=[("search", first), ("search", second)])
+    assert repeated.headers["X-Cache"] == "MISS"
+    assert repeated.json() != smuggled.json()
+
+
+def test_repeat_request_is_a_hit(client, memory_cache):
+    assert client.get("/employees?limit=5").headers["X-Cache"] == "MISS"
+    assert client.get("/employees?limit=5").headers["X-Cache"] == "HIT"
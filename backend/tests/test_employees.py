@@ -0,0 +1,47 @@
+# backend/tests/test_employees.py
+
+import pytest
+
+
+def all_ids(client) -> list[str]:
+    return [e["employee_id"] for e in client.get("/employees").json()]
+
+
+def test_keyset_pages_cover_every_employee_once(client):
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 7, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/employees", params=params).json()
+        seen += [e["employee_id"] for e in body["items"]]
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == sorted(all_ids(client))
+    assert pages == -(-len(seen) // 7)
+
+
+def test_last_page_has_no_cursor(client):
+    total = len(all_ids(client))
+    body = client.get("/employees", params={"limit": total}).json()
+
+    assert len(body["items"]) == total
+    assert body["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", ["!!!", "", "RU1QMDA", "RU1QMD@x", "_w=="])
+def test_bad_cursors_are_rejected(client, cursor):
+    response = client.get("/employees", params={"limit": 5, "cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_fields_projection(client):
+    body = client.get("/employees", params={"fields": "full_name,employee_id"}).json()
+    assert body and all(list(e) == ["full_name", "employee_id"] for e in body)
+
+    page = client.get("/employees", params={"fields": "department", "limit": 3}).json()
+    assert all(list(e) == ["department"] for e in page["items"])
+    assert page["next_cursor"] is not None
+
+    assert client.get("/employees", params={"fields": "salary"}).status_code == 400
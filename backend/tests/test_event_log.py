@@ -0,0 +1,45 @@
+# backend/tests/test_event_log.py
+
+from datetime import datetime, timedelta
+
+from app.core import event_log
+
+
+def test_snapshot_retention_thins_old_history(monkeypatch):
+    monkeypatch.setattr(event_log, "SNAPSHOT_KEEP_RECENT", 3)
+    monkeypatch.setattr(event_log, "SNAPSHOT_KEEP_DAILY", 2)
+    monkeypatch.setattr(event_log, "SNAPSHOT_KEEP_MONTHLY", 2)
+
+    # Hourly snapshots over 90 days, newest first
+    newest = datetime(2026, 3, 31, 23)
+    snapshots = [(i, newest - timedelta(hours=i)) for i in range(90 * 24)]
+
+    keep = event_log._snapshots_to_keep(snapshots)
+
+    assert keep == {
+        0, 1, 2,   # newest three
+        24,        # newest of 30 March (31 March is snapshot 0)
+        31 * 24,   # newest of February (March is snapshot 0)
+    }
+
+
+def test_as_of_defaults_to_now(client):
+    current = client.get("/attendance/EMP001").json()
+
+    response = client.get("/attendance/EMP001/as-of")
+    assert response.status_code == 200
+    assert response.json()["records"] == [
+        {"date": r["date"], "status": r["status"]} for r in current
+    ]
+
+
+def test_as_of_outside_the_utc_range(client):
+    for at in ("0001-01-01T00:00:00+05:00", "9999-12-31T23:00:00-05:00"):
+        response = client.get("/attendance/EMP001/as-of", params={"at": at})
+        assert response.status_code == 400
+
+
+def test_as_of_before_history_starts(client):
+    response = client.get("/attendance/EMP001/as-of", params={"at": "0001-01-01T00:00:00Z"})
+    assert response.status_code == 200
+    assert response.json()["records"] == []
@@ -0,0 +1,153 @@
+# backend/tests/test_imports.py
+
+import json
+
+import pytest
+
+HEADER = "employee_id,full_name,email,department"
+
+
+def csv_row(emp_id: str, email: str | None = None, department: str = "IT") -> str:
+    return f"{emp_id},Import {emp_id},{email or emp_id.lower() + '@company.com'},{department}"
+
+
+def import_csv(client, *rows: str, **params) -> dict:
+    body = "\n".join([HEADER, *rows]) + "\n"
+    response = client.post(
+        "/employees/import", content=body.encode(), params=params,
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def all_ids(client) -> set[str]:
+    return {e["employee_id"] for e in client.get("/employees").json()}
+
+
+@pytest.fixture
+def cleanup(client):
+    """Offboards every IMP* employee a test imported."""
+    yield
+    imported = sorted(i for i in all_ids(client) if i.startswith("IMP"))
+    if imported:
+        client.post("/employees/offboard", json={"employee_ids": imported})
+
+
+def test_valid_csv_import(client, cleanup):
+    report = import_csv(client, csv_row("IMP001"), csv_row("IMP002", department="HR"))
+
+    assert (report["total_rows"], report["imported"], report["rejected"]) == (2, 2, 0)
+    assert report["errors"] == []
+
+    employees = {e["employee_id"]: e for e in client.get("/employees").json()}
+    assert employees["IMP001"]["email"] == "imp001@company.com"
+    assert employees["IMP002"]["department"] == "HR"
+
+
+def test_valid_ndjson_import_with_bom_and_crlf(client, cleanup):
+    records = [
+        {"employee_id": "IMP101", "full_name": "Import One", "email": "imp101@company.com", "department": "IT"},
+        {"employee_id": "IMP102", "full_name": "Import Two", "email": "imp102@company.com", "department": "IT"},
+    ]
+    body = "\ufeff" + "\r\n".join(json.dumps(r) for r in records)
+
+    response = client.post(
+        "/employees/import", content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.json()["imported"] == 2
+    assert {"IMP101", "IMP102"} <= all_ids(client)
+
+
+def test_duplicate_ids_in_file_keep_the_first(client, cleanup, monkeypatch):
+    # Two rows per chunk, so the repeats land in a later chunk too
+    monkeypatch.setattr("app.routes.employees.IMPORT_CHUNK_SIZE", 2)
+
+    report = import_csv(
+        client,
+        csv_row("IMP201"),
+        csv_row("IMP201", email="other@company.com"),
+        csv_row("IMP202"),
+        csv_row("IMP203"),
+        csv_row("IMP201", email="third@company.com"),
+    )
+
+    assert (report["total_rows"], report["imported"], report["rejected"]) == (5, 3, 2)
+    assert [(e["row"], e["employee_id"], e["reason"]) for e in report["errors"]] == [
+        (2, "IMP201", "Duplicate employee_id in file"),
+        (5, "IMP201", "Duplicate employee_id in file"),
+    ]
+
+    employees = {e["employee_id"]: e for e in client.get("/employees").json()}
+    assert employees["IMP201"]["email"] == "imp201@company.com"
+
+
+def test_ids_already_in_the_database_are_rejected(client, cleanup):
+    before = {e["employee_id"]: e for e in client.get("/employees").json()}["EMP001"]
+
+    report = import_csv(client, csv_row("EMP001", email="new@company.com"), csv_row("IMP301"))
+
+    assert (report["imported"], report["rejected"]) == (1, 1)
+    assert report["errors"] == [{
+        "row": 1,
+        "employee_id": "EMP001",
+        "reason": "Employee with this employee_id already exists",
+    }]
+
+    # The existing employee is left alone
+    after = {e["employee_id"]: e for e in client.get("/employees").json()}["EMP001"]
+    assert after == before
+
+
+def test_malformed_rows_are_reported_not_fatal(client, cleanup):
+    body = "\n".join([
+        json.dumps({"employee_id": "IMP401", "full_name": "Ok", "email": "imp401@company.com", "department": "IT"}),
+        "{not json",
+        json.dumps(["IMP402", "List", "imp402@company.com", "IT"]),
+        json.dumps({"employee_id": "IMP403", "full_name": "Bad Email", "email": "nope", "department": "IT"}),
+        json.dumps({"employee_id": "IMP404", "email": "imp404@company.com", "department": "IT"}),
+        "",
+        json.dumps({"employee_id": "IMP405", "full_name": "Also Ok", "email": "imp405@company.com", "department": "IT"}),
+    ])
+
+    response = client.post("/employees/import", params={"format": "ndjson"}, content=body.encode())
+    assert response.status_code == 200
+    report = response.json()
+
+    # Blank lines are not rows
+    assert (report["total_rows"], report["imported"], report["rejected"]) == (6, 2, 4)
+
+    errors = {e["row"]: e for e in report["errors"]}
+    assert sorted(errors) == [2, 3, 4, 5]
+    assert errors[2] == {"row": 2, "employee_id": None, "reason": "Malformed record"}
+    assert errors[3]["reason"] == "Malformed record"
+    assert errors[4]["employee_id"] == "IMP403" and errors[4]["reason"].startswith("email:")
+    assert errors[5]["employee_id"] == "IMP404" and errors[5]["reason"].startswith("full_name:")
+
+    ids = all_ids(client)
+    assert {"IMP401", "IMP405"} <= ids
+    assert not {"IMP403", "IMP404"} & ids
+
+
+def test_csv_rows_missing_columns_are_rejected(client, cleanup):
+    report = import_csv(client, "IMP501,Short Row", csv_row("IMP502"))
+
+    assert (report["imported"], report["rejected"]) == (1, 1)
+    [error] = report["errors"]
+    assert (error["row"], error["employee_id"]) == (1, "IMP501")
+    assert "email" in error["reason"] and "department" in error["reason"]
+
+
+def test_error_report_is_ordered_by_row_and_bounded(client, cleanup, monkeypatch):
+    monkeypatch.setattr("app.routes.employees.IMPORT_CHUNK_SIZE", 3)
+    monkeypatch.setattr("app.core.imports.MAX_REPORTED_ERRORS", 4)
+
+    rows = [csv_row(f"IMP6{i:02d}", email="bad") for i in range(6)] + [csv_row("EMP002")]
+    report = import_csv(client, *rows)
+
+    # Every rejection is counted, only the first few are listed
+    assert (report["total_rows"], report["imported"], report["rejected"]) == (7, 0, 7)
+    assert [e["row"] for e in report["errors"]] == [1, 2, 3, 4]
+    assert report["rows_per_second"] >= 0 and report["elapsed_seconds"] >= 0
@@ -0,0 +1,34 @@
+# backend/tests/test_jobs.py
+
+import os
+import subprocess
+import sys
+
+from app.core import jobs
+
+JOB_ID = "0123456789abcdef01234567"
+
+
+def test_claim_is_exclusive_across_processes(tmp_path):
+    directory = str(tmp_path)
+    claim = jobs._claim_path(directory, JOB_ID)
+
+    # Held by another live process (this test's parent)
+    with open(claim, "w") as fh:
+        fh.write(str(os.getppid()))
+    assert not jobs._claim(directory, JOB_ID)
+
+    jobs._release(directory, JOB_ID)
+    assert os.path.exists(claim), "only the claimer releases"
+
+    # Held by a process that has exited
+    dead = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                          capture_output=True, text=True)
+    with open(claim, "w") as fh:
+        fh.write(dead.stdout.strip())
+    assert jobs._claim(directory, JOB_ID)
+    assert jobs._claim_pid(claim) == os.getpid()
+    assert not jobs._claim(directory, JOB_ID)
+
+    jobs._release(directory, JOB_ID)
+    assert sorted(os.listdir(directory)) == []
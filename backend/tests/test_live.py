@@ -0,0 +1,168 @@
+# backend/tests/test_live.py
+
+import asyncio
+import json
+
+import pytest
+
+from app.core import live
+from app.core.live import RESYNC, LiveHub
+from app.routes import dashboard
+
+DAY = "2018-05-07"
+NEXT_DAY = "2018-05-08"
+
+
+def parse(frame: str) -> tuple[str, dict]:
+    event, data = frame.strip().split("\n")
+    assert event.startswith("event: ") and data.startswith("data: ")
+    return event[len("event: "):], json.loads(data[len("data: "):])
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    """A hub of its own, started on the loop each test runs."""
+    hub = LiveHub()
+    monkeypatch.setattr(live, "live_hub", hub)
+    monkeypatch.setattr(dashboard, "live_hub", hub)
+    return hub
+
+
+def run_feed(hub: LiveHub, scenario):
+    """Opens /dashboard/live on a fresh loop and hands `scenario` a next-frame function."""
+    async def main():
+        await hub.start("memory")
+        response = await dashboard.dashboard_live()
+        assert response.media_type == "text/event-stream"
+        frames = response.body_iterator
+
+        async def next_frame() -> tuple[str, dict]:
+            return parse(await asyncio.wait_for(anext(frames), 5))
+
+        try:
+            await scenario(next_frame)
+        finally:
+            await frames.aclose()
+        assert hub.subscribers == 0
+
+    asyncio.run(main())
+
+
+def test_feed_starts_with_a_snapshot(client, hub):
+    async def scenario(next_frame):
+        event, data = await next_frame()
+        assert event == "snapshot"
+
+        today = await asyncio.to_thread(client.get, "/dashboard/today")
+        assert data == {"date": data["date"], **today.json()}
+
+    run_feed(hub, scenario)
+
+
+def test_marks_are_sent_as_deltas(client, hub):
+    def post(path, json):
+        return asyncio.to_thread(client.post, path, json=json)
+
+    async def scenario(next_frame):
+        assert (await next_frame())[0] == "snapshot"
+
+        response = await post("/attendance", {"employee_id": "EMP001", "date": DAY, "status": "Present"})
+        assert response.status_code == 201
+        assert await next_frame() == ("attendance", {"date": DAY, "present": 1, "absent": 0})
+
+        # One frame per day with the net change: EMP001 flips to Absent,
+        # EMP002 and EMP003 are new
+        response = await post("/attendance/bulk", [
+            {"employee_id": "EMP001", "date": DAY, "status": "Absent"},
+            {"employee_id": "EMP002", "date": DAY, "status": "Absent"},
+            {"employee_id": "EMP003", "date": DAY, "status": "Present"},
+            {"employee_id": "EMP001", "date": NEXT_DAY, "status": "Present"},
+        ])
+        assert response.json()["created"] == 3
+        assert await next_frame() == ("attendance", {"date": DAY, "present": 0, "absent": 2})
+        assert await next_frame() == ("attendance", {"date": NEXT_DAY, "present": 1, "absent": 0})
+
+        # A bulk mark that changes nothing sends nothing
+        response = await post("/attendance/bulk", [
+            {"employee_id": "EMP001", "date": NEXT_DAY, "status": "Present"},
+        ])
+        assert response.status_code == 200
+        assert hub.stats["published"] == 3
+
+    run_feed(hub, scenario)
+
+
+def test_employee_changes_are_sent(client, hub):
+    employee = {
+        "employee_id": "LIVE001",
+        "full_name": "Live Feed",
+        "email": "live001@company.com",
+        "department": "IT",
+    }
+
+    async def scenario(next_frame):
+        assert (await next_frame())[0] == "snapshot"
+
+        await asyncio.to_thread(client.post, "/employees", json=employee)
+        assert await next_frame() == ("employees", {"delta": 1})
+
+        await asyncio.to_thread(
+            client.post, "/attendance", json={"employee_id": "LIVE001", "date": DAY, "status": "Absent"}
+        )
+        assert await next_frame() == ("attendance", {"date": DAY, "present": 0, "absent": 1})
+
+        # Offboarding takes the employee's attendance back out
+        await asyncio.to_thread(client.delete, "/employees/LIVE001")
+        assert await next_frame() == ("employees", {"delta": -1})
+        assert await next_frame() == ("attendance", {"date": DAY, "present": 0, "absent": -1})
+
+    run_feed(hub, scenario)
+
+
+def test_slow_subscriber_gets_resync(client, hub, monkeypatch):
+    monkeypatch.setattr(live, "EVENTS_QUEUE_SIZE", 3)
+
+    async def scenario(next_frame):
+        assert (await next_frame())[0] == "snapshot"
+        fast = hub.subscribe()
+        received = []
+
+        # The feed is not read while five events arrive; `fast` keeps up
+        for i in range(5):
+            hub.publish("employees", {"delta": i + 1})
+            await asyncio.sleep(0)
+            received.append(parse(fast.get_nowait()))
+
+        assert received == [("employees", {"delta": i + 1}) for i in range(5)]
+
+        # The backlog is dropped for a resync, then delivery carries on
+        assert await next_frame() == ("resync", {})
+        assert await next_frame() == ("employees", {"delta": 5})
+        assert hub.stats == {"published": 5, "dropped": 1}
+
+        hub.unsubscribe(fast)
+
+    run_feed(hub, scenario)
+
+
+def test_resync_replaces_the_whole_backlog(monkeypatch):
+    monkeypatch.setattr(live, "EVENTS_QUEUE_SIZE", 2)
+
+    async def main():
+        hub = LiveHub()
+        await hub.start("memory")
+        queue = hub.subscribe()
+
+        for i in range(3):
+            hub.publish("employees", {"delta": i})
+        await asyncio.sleep(0)
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait() == RESYNC
+
+        # Nobody listening: nothing is published
+        hub.unsubscribe(queue)
+        hub.publish("employees", {"delta": 1})
+        assert hub.stats["published"] == 3
+
+    asyncio.run(main())
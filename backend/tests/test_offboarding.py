@@ -0,0 +1,171 @@
+# backend/tests/test_offboarding.py
+
+from datetime import date, datetime
+
+from sqlalchemy import func, insert, select
+
+from app.core import cache as response_cache, partitions
+from app.core.database import Base, SessionLocal, SQL_CHUNK_SIZE, build_engine
+from app.core.maintenance import compact_database
+from app.models.attendance import Attendance, AttendanceArchive
+from app.models.attendance_daily import AttendanceDaily
+from app.models.attendance_event import AttendanceEvent
+from app.models.employee import Employee
+
+DEPARTMENT = "Offboarding"
+HOT_DAY = date(2021, 3, 1)
+ARCHIVED_DAY = date(2001, 3, 1)
+ARCHIVED_BEFORE = date(2010, 1, 1)
+HEADCOUNT = SQL_CHUNK_SIZE + 20
+
+
+def emp(i: int) -> str:
+    return f"OFF{i:04d}"
+
+
+def counts(db) -> dict:
+    ids = [emp(i) for i in range(HEADCOUNT)]
+    return {
+        table.__tablename__: db.execute(
+            select(func.count()).select_from(table).where(table.employee_id.in_(ids))
+        ).scalar()
+        for table in (Employee, Attendance, AttendanceArchive)
+    } | {
+        "daily_total": db.execute(
+            select(func.coalesce(func.sum(AttendanceDaily.total), 0))
+            .where(AttendanceDaily.department == DEPARTMENT)
+        ).scalar(),
+    }
+
+
+def test_offboarding_across_chunks(client, monkeypatch):
+    monkeypatch.setattr(response_cache, "cache", response_cache.MemoryCache())
+
+    rows = [f"{emp(i)},Off Boarded {i},{emp(i).lower()}@company.com,{DEPARTMENT}" for i in range(HEADCOUNT)]
+    body = "\n".join(["employee_id,full_name,email,department", *rows])
+    imported = client.post("/employees/import", content=body.encode(), headers={"Content-Type": "text/csv"})
+    assert imported.json()["imported"] == HEADCOUNT
+
+    marks = [
+        {"employee_id": emp(i), "date": day.isoformat(), "status": "Present" if i % 3 else "Absent"}
+        for i in range(HEADCOUNT)
+        for day in (ARCHIVED_DAY, HOT_DAY)
+    ]
+    assert client.post("/attendance/bulk", json=marks).json()["created"] == 2 * HEADCOUNT
+
+    # Partitioned as in production: the archive is read (and offboarded) through the history view
+    monkeypatch.setattr(partitions, "ATTENDANCE_HOT_DAYS", (date.today() - ARCHIVED_BEFORE).days)
+
+    db = SessionLocal()
+    try:
+        partitions.archive_attendance(db, date(2002, 1, 1))
+        assert counts(db) == {
+            "employees": HEADCOUNT,
+            "attendance": HEADCOUNT,
+            "attendance_archive": HEADCOUNT,
+            "daily_total": 2 * HEADCOUNT,
+        }
+    finally:
+        db.close()
+
+    # Warm the cache
+    for path in ("/employees", "/reports/attendance/summary"):
+        client.get(path)
+        assert client.get(path).headers["X-Cache"] == "HIT"
+    records_before = client.get("/reports/attendance/summary").json()["total_records"]
+
+    # Unknown ids on both sides; the known ones span two chunks
+    requested = ["OFFNOPE1", *(emp(i) for i in range(HEADCOUNT)), "OFFNOPE2"]
+    report = client.post("/employees/offboard", json={"employee_ids": requested}).json()
+
+    assert report == {
+        "deleted": HEADCOUNT,
+        "attendance_deleted": 2 * HEADCOUNT,
+        "not_found": ["OFFNOPE1", "OFFNOPE2"],
+    }
+
+    db = SessionLocal()
+    try:
+        assert counts(db) == {
+            "employees": 0,
+            "attendance": 0,
+            "attendance_archive": 0,
+            "daily_total": 0,
+        }
+        removals = db.execute(
+            select(func.count()).where(
+                AttendanceEvent.source == "offboard",
+                AttendanceEvent.employee_id.like("OFF%"),
+            )
+        ).scalar()
+        assert removals == 2 * HEADCOUNT
+    finally:
+        db.close()
+
+    listed = client.get("/employees")
+    assert listed.headers["X-Cache"] == "MISS"
+    assert not any(e["employee_id"].startswith("OFF") for e in listed.json())
+
+    summary = client.get("/reports/attendance/summary")
+    assert summary.headers["X-Cache"] == "MISS"
+    assert summary.json()["total_records"] == records_before - 2 * HEADCOUNT
+
+
+def test_compact_reports_the_rows_it_deleted(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'compact.db'}")
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Employee), [
+            {"employee_id": "KEEP1", "full_name": "Kept", "email": "kept@company.com", "department": "IT"},
+        ])
+        conn.execute(insert(AttendanceEvent), [{
+            "recorded_at": datetime(2024, 1, 1), "employee_id": "KEEP1",
+            "date": date(2024, 1, 1), "status": "Present", "source": "mark",
+        }])
+        conn.execute(insert(AttendanceDaily), [
+            {"date": date(2024, 1, 1), "department": "IT", "total": 1, "present": 1, "absent": 0},
+            {"date": date(2024, 1, 2), "department": "IT", "total": 0, "present": 0, "absent": 0},
+        ])
+
+    # Rows left behind while foreign keys were off
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        conn.execute(insert(Attendance), [
+            {"employee_id": "KEEP1", "date": date(2024, 1, 1), "status": "Present"},
+            {"employee_id": "GONE1", "date": date(2024, 1, 1), "status": "Present"},
+            {"employee_id": "GONE1", "date": date(2024, 1, 2), "status": "Absent"},
+            {"employee_id": "GONE2", "date": date(2024, 1, 1), "status": "Absent"},
+        ])
+        conn.execute(insert(AttendanceArchive), [
+            {"id": 100, "employee_id": "GONE1", "date": date(2020, 1, 1), "status": "Present"},
+            {"id": 101, "employee_id": "KEEP1", "date": date(2020, 1, 1), "status": "Absent"},
+        ])
+        conn.commit()
+        conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+    report = compact_database(engine)
+
+    assert report["rows_deleted"] == {
+        "attendance": 3,
+        "attendance_archive": 1,
+        "attendance_daily": 1,
+    }
+    assert report["bytes_freed"] == report["bytes_before"] - report["bytes_after"]
+
+    with engine.connect() as conn:
+        assert conn.execute(select(Attendance.employee_id)).scalars().all() == ["KEEP1"]
+        assert conn.execute(select(AttendanceArchive.employee_id)).scalars().all() == ["KEEP1"]
+        assert conn.execute(select(func.count()).select_from(AttendanceDaily)).scalar() == 1
+
+        # The log already started, so the removals are recorded
+        removed = conn.execute(
+            select(AttendanceEvent.employee_id, AttendanceEvent.status)
+            .where(AttendanceEvent.source == "compact")
+        ).all()
+        assert sorted(removed) == [("GONE1", None)] * 3 + [("GONE2", None)]
+
+    # Nothing left the second time
+    again = compact_database(engine)
+    assert set(again["rows_deleted"].values()) == {0}
+    engine.dispose()
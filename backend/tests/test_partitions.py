@@ -0,0 +1,56 @@
+# backend/tests/test_partitions.py
+
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+# Marks today for every seeded employee through the API
+MARK_TODAY = """
+from datetime import date
+from fastapi.testclient import TestClient
+from app.main import app
+
+with TestClient(app) as client:
+    today = date.today().isoformat()
+    response = client.post("/attendance/bulk", json=[
+        {"employee_id": f"EMP{i:03d}", "date": today, "status": "Present"}
+        for i in range(1, 21)
+    ])
+    assert response.status_code == 200, response.text
+"""
+
+
+def run(path: Path, *args: str) -> subprocess.CompletedProcess:
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{path}",
+        "ATTENDANCE_HOT_DAYS": "10",
+        "STARTUP_MODE": "none",
+        "CACHE_URL": "none",
+    }
+    result = subprocess.run(
+        [sys.executable, *args], cwd=BACKEND, env=env, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def test_marks_after_archiving_get_new_ids(tmp_path):
+    path = tmp_path / "archive.db"
+    run(path, "-m", "app.cli", "seed", "--employees", "20", "--days", "20")
+    run(path, "-m", "app.cli", "archive-attendance")
+    run(path, "-c", MARK_TODAY)
+
+    conn = sqlite3.connect(path)
+    try:
+        ids = [row[0] for row in conn.execute("SELECT id FROM attendance_history")]
+        archived = conn.execute("SELECT count(*) FROM attendance_archive").fetchone()[0]
+    finally:
+        conn.close()
+
+    assert archived
+    assert len(ids) == len(set(ids))
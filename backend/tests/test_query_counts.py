@@ -0,0 +1,47 @@
+# backend/tests/test_query_counts.py
+
+from datetime import date, timedelta
+
+import pytest
+
+TODAY = date.today()
+MONTH = f"start_date={TODAY - timedelta(days=29)}&end_date={TODAY}"
+
+
+@pytest.fixture(scope="module")
+def employee_id(client):
+    return client.get("/employees").json()[0]["employee_id"]
+
+
+# Report endpoints: one SUM(CASE…) pass with the existence check folded in
+@pytest.mark.parametrize("url", [
+    "/reports/attendance/employee/{employee_id}",
+    "/reports/attendance/employee/EMP_MISSING",
+    "/reports/attendance/monthly/{employee_id}?" + MONTH,
+    "/reports/attendance/monthly/EMP_MISSING?" + MONTH,
+    "/reports/attendance/summary",
+    "/reports/attendance/summary?" + MONTH,
+])
+def test_report_endpoints_run_one_statement(client, statements, employee_id, url):
+    with statements() as sql:
+        response = client.get(url.format(employee_id=employee_id))
+
+    assert response.status_code in (200, 404)
+    assert len(sql) == 1, sql
+
+
+@pytest.mark.parametrize("url, bound", [
+    ("/employees", 1),
+    ("/employees?limit=10", 1),
+    ("/employees?fields=employee_id,full_name", 1),
+    ("/employees?search=a", 1),
+    ("/attendance/{employee_id}", 2),
+    ("/dashboard/today", 2),
+    ("/dashboard/last-30-days", 1),
+])
+def test_list_and_dashboard_statements_are_bounded(client, statements, employee_id, url, bound):
+    with statements() as sql:
+        response = client.get(url.format(employee_id=employee_id))
+
+    assert response.status_code == 200
+    assert len(sql) <= bound, sql
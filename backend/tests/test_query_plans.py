@@ -0,0 +1,176 @@
+# backend/tests/test_query_plans.py
+"""
+Runs every API route and maintenance operation against the test database,
+captures the SQL each one issues (reads and writes) and EXPLAIN QUERY PLANs
+it. Fails on any full table scan that is not on the allowlist.
+"""
+
+import re
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.aggregates import rebuild_daily_aggregates
+from app.core.bitmaps import bitmap_store
+from app.core.database import SessionLocal, engine
+from app.core.maintenance import delete_orphans
+from app.core.partitions import archive_attendance
+
+pytestmark = pytest.mark.sqlite_only
+
+# (route, table) pairs where reading every row is the point of the query
+ALLOWED_SCANS = {
+    ("GET /employees", "employees"),                    # full directory listing
+    ("GET /dashboard/today", "employees"),              # headcount
+    ("GET /exports/attendance", "attendance"),          # unbounded export
+    ("GET /reports/analytics/departments", "employees"),  # employee axis of the matrix
+    ("GET /reports/analytics/rolling", "employees"),
+    ("GET /reports/analytics/weekdays", "employees"),
+    ("GET /reports/analytics/top-absentees", "employees"),
+    ("GET /attendance/{id}/calendar", "attendance"),    # one-off bitmap store load
+    ("rebuild aggregates", "attendance"),               # recounts everything
+    ("rebuild aggregates", "attendance_daily"),
+    ("compact", "attendance"),                          # looks for orphans everywhere
+    ("compact", "attendance_archive"),
+    ("compact", "attendance_daily"),
+}
+
+# Statements worth a plan; plain INSERT … VALUES has none
+PLANNED = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+SCAN_RE = re.compile(r"\bSCAN (\w+)")
+
+IMPORT_CSV = (
+    "employee_id,full_name,email,department\n"
+    "PLAN002,Plan Import,plan.import@company.com,HR\n"
+    "PLAN003,Plan Offboard,plan.offboard@company.com,HR\n"
+)
+
+
+def is_full_scan(detail: str, statement: str) -> bool:
+    if "CONSTANT ROW" in detail:
+        # SELECT without FROM, e.g. one row of scalar subqueries
+        return False
+    if "VIRTUAL TABLE" in detail:
+        # FTS5 MATCH lookups report as SCAN of the virtual table
+        return False
+    if "USING" in detail and "INDEX" in detail and " LIMIT " in statement:
+        # Ordered index walk that stops after LIMIT rows (keyset pages)
+        return False
+    return True
+
+
+def routes(today: date) -> list[tuple[str, str, str, dict]]:
+    start = (today - timedelta(days=29)).isoformat()
+    end = today.isoformat()
+    month = f"start_date={start}&end_date={end}"
+
+    return [
+        ("GET /employees", "GET", "/employees", {}),
+        ("GET /employees?limit", "GET", "/employees?limit=20&fields=employee_id,full_name", {}),
+        ("GET /employees?search", "GET", "/employees?search=sharma", {}),
+        ("POST /employees", "POST", "/employees", {"json": {
+            "employee_id": "PLAN001", "full_name": "Plan Probe",
+            "email": "plan.probe@company.com", "department": "IT",
+        }}),
+        ("POST /employees/import", "POST", "/employees/import", {
+            "content": IMPORT_CSV, "headers": {"content-type": "text/csv"},
+        }),
+        ("POST /attendance", "POST", "/attendance", {"json": {
+            "employee_id": "PLAN001", "date": end, "status": "Present",
+        }}),
+        ("POST /attendance/bulk", "POST", "/attendance/bulk", {"json": [
+            {"employee_id": "PLAN001", "date": start, "status": "Absent"},
+            {"employee_id": "PLAN002", "date": end, "status": "Absent"},
+        ]}),
+        ("GET /attendance/{id}", "GET", f"/attendance/EMP001?{month}", {}),
+        ("GET /attendance/matrix", "GET", f"/attendance/matrix?department=HR&{month}", {}),
+        ("GET /attendance/{id}/calendar", "GET", f"/attendance/EMP001/calendar?year={today.year}&month={today.month}", {}),
+        ("GET /attendance/{id}/stats", "GET", f"/attendance/EMP001/stats?{month}", {}),
+        ("GET /dashboard/today", "GET", "/dashboard/today", {}),
+        ("GET /dashboard/last-30-days", "GET", "/dashboard/last-30-days", {}),
+        ("GET /reports/attendance/employee/{id}", "GET", f"/reports/attendance/employee/EMP001?{month}", {}),
+        ("GET /reports/attendance/monthly/{id}", "GET", f"/reports/attendance/monthly/EMP001?{month}", {}),
+        ("GET /reports/attendance/monthly", "GET", f"/reports/attendance/monthly?{month}", {}),
+        ("GET /reports/attendance/summary", "GET", f"/reports/attendance/summary?{month}", {}),
+        ("GET /reports/analytics/rolling", "GET", f"/reports/analytics/rolling?{month}", {}),
+        ("GET /reports/analytics/departments", "GET", f"/reports/analytics/departments?{month}", {}),
+        ("GET /reports/analytics/weekdays", "GET", f"/reports/analytics/weekdays?{month}", {}),
+        ("GET /reports/analytics/top-absentees", "GET", f"/reports/analytics/top-absentees?{month}", {}),
+        ("GET /exports/attendance", "GET", "/exports/attendance", {}),
+        ("GET /attendance/{id}/as-of", "GET", f"/attendance/EMP001/as-of?at={end}T23:59:59&start_date={start}", {}),
+        ("GET /attendance/{id}/events", "GET", f"/attendance/EMP001/events?start_date={start}", {}),
+        ("POST /employees/offboard", "POST", "/employees/offboard", {"json": {
+            "employee_ids": ["PLAN002", "PLAN003", "PLAN_MISSING"],
+        }}),
+        ("DELETE /employees/{id}", "DELETE", "/employees/PLAN001", {}),
+    ]
+
+
+# What the CLI runs: rebuild, archive (nothing is old enough) and compact
+OPERATIONS = [
+    ("rebuild aggregates", rebuild_daily_aggregates),
+    ("archive", lambda db: archive_attendance(db, date(2000, 1, 1))),
+    ("compact", delete_orphans),
+]
+
+
+def full_scans(label: str, captured: list[tuple[str, object]]) -> list[str]:
+    problems = []
+    for statement, parameters in captured:
+        with engine.connect() as conn:
+            plan = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+
+        for detail in (row[-1] for row in plan):
+            match = SCAN_RE.search(detail)
+            if (
+                match
+                and is_full_scan(detail, statement)
+                and (label, match.group(1)) not in ALLOWED_SCANS
+            ):
+                problems.append(f"{label}: {detail}\n    {' '.join(statement.split())[:200]}")
+    return problems
+
+
+@pytest.fixture
+def capture():
+    """Plannable statements sent through the engine, with their parameters."""
+    from sqlalchemy import event
+
+    captured: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(PLANNED):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_no_unexpected_full_scans(client, capture):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    bitmap_store.reset()
+
+    problems = []
+
+    for label, method, url, kwargs in routes(date.today()):
+        capture.clear()
+        response = client.request(method, url, **kwargs)
+        assert response.status_code < 400, f"{label}: {response.status_code} {response.text}"
+        assert capture, f"{label} sent no SQL"
+        problems += full_scans(label, list(capture))
+
+    for label, operation in OPERATIONS:
+        capture.clear()
+        db = SessionLocal()
+        try:
+            operation(db)
+        finally:
+            db.close()
+        problems += full_scans(label, list(capture))
+
+    assert not problems, "Full scans found:\n  " + "\n  ".join(problems)
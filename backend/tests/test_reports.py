@@ -0,0 +1,75 @@
+# backend/tests/test_reports.py
+
+import json
+from collections import Counter
+from datetime import date
+
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models.attendance_daily import AttendanceDaily
+from app.models.employee import Employee
+
+# Wide enough to cover the seed and anything other tests marked
+RANGE = {"start_date": "2000-01-01", "end_date": date.today().isoformat()}
+
+
+def monthly_lines(client, group_by: str) -> list[dict]:
+    response = client.get("/reports/attendance/monthly", params={**RANGE, "group_by": group_by})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def daily_totals() -> tuple[Counter, dict]:
+    """
+    (month, department, "total" | "present" | "absent") → count from
+    attendance_daily, and each employee's department.
+    """
+    db = SessionLocal()
+    try:
+        rows = db.execute(select(AttendanceDaily)).scalars().all()
+        departments = dict(db.execute(select(Employee.employee_id, Employee.department)).all())
+    finally:
+        db.close()
+
+    totals = Counter()
+    for row in rows:
+        month = row.date.strftime("%Y-%m")
+        totals[month, row.department, "total"] += row.total
+        totals[month, row.department, "present"] += row.present
+        totals[month, row.department, "absent"] += row.absent
+    return +totals, departments
+
+
+def report_totals(lines: list[dict], department_of) -> Counter:
+    totals = Counter()
+    for line in lines:
+        key = line["month"], department_of(line)
+        assert line["total_days"] == line["present_days"] + line["absent_days"]
+        totals[(*key, "total")] += line["total_days"]
+        totals[(*key, "present")] += line["present_days"]
+        totals[(*key, "absent")] += line["absent_days"]
+    return +totals
+
+
+def test_monthly_report_matches_daily_aggregates(client):
+    expected, departments = daily_totals()
+    assert expected
+
+    by_department = monthly_lines(client, "department")
+    assert report_totals(by_department, lambda line: line["department"]) == expected
+
+    # Per-employee lines carry their department and add up to the same totals
+    by_employee = monthly_lines(client, "employee")
+    assert all(departments[line["employee_id"]] == line["department"] for line in by_employee)
+    assert len({(line["month"], line["employee_id"]) for line in by_employee}) == len(by_employee)
+    assert report_totals(by_employee, lambda line: line["department"]) == expected
+
+
+def test_monthly_report_rejects_reversed_range(client):
+    response = client.get(
+        "/reports/attendance/monthly",
+        params={"start_date": "2024-02-01", "end_date": "2024-01-01"},
+    )
+    assert response.status_code == 400
@@ -0,0 +1,117 @@
+# backend/tests/test_search.py
+
+import re
+
+import pytest
+
+from app.core import search
+
+FIELDS = ("employee_id", "full_name", "email", "department")
+
+
+def search_ids(client, term: str) -> list[str]:
+    response = client.get("/employees", params={"search": term})
+    assert response.status_code == 200, response.text
+    return [e["employee_id"] for e in response.json()]
+
+
+def employees(client) -> list[dict]:
+    return client.get("/employees").json()
+
+
+def token_prefix_matches(client, *prefixes: str) -> set[str]:
+    """Employees with, for every prefix, some word starting with it."""
+    def words(emp):
+        return [w.lower() for f in FIELDS for w in re.findall(r"[^\W_]+", emp[f])]
+
+    return {
+        emp["employee_id"] for emp in employees(client)
+        if all(any(w.startswith(p) for w in words(emp)) for p in prefixes)
+    }
+
+
+@pytest.fixture
+def fallback(monkeypatch):
+    """Search as on a backend without FTS5."""
+    monkeypatch.setattr(search, "_fts_enabled", False)
+
+
+@pytest.mark.sqlite_only
+def test_prefix_match(client):
+    found = search_ids(client, "shar")
+
+    assert found
+    assert set(found) == token_prefix_matches(client, "shar")
+
+    # Every token must match, each as a prefix
+    assert set(search_ids(client, "priya shar")) == token_prefix_matches(client, "priya", "shar")
+
+    # Not a substring match: "harma" starts no word
+    assert search_ids(client, "harma") == []
+
+
+@pytest.mark.sqlite_only
+@pytest.mark.parametrize("term", ['sharma"', '"sharma', "sharma*", "shar'ma", "(sharma)", "sharma OR", "NOT sharma", "sharma -x^"])
+def test_query_syntax_is_escaped(client, term):
+    # Quotes, stars and FTS5 operators are plain text, never MATCH syntax
+    words = re.findall(r"[^\W_]+", term.lower())
+    assert set(search_ids(client, term)) == token_prefix_matches(client, *words)
+
+
+@pytest.mark.sqlite_only
+@pytest.mark.parametrize("term", ['"', "*", '""', "'", "-"])
+def test_terms_without_words_fall_back_to_substring(client, term):
+    # No token to match on, so the ILIKE path runs; none of these appear in the data
+    assert search_ids(client, term) == []
+
+
+@pytest.mark.sqlite_only
+def test_index_follows_adds_and_deletes(client):
+    employee = {
+        "employee_id": "SRCH001",
+        "full_name": "Zephyrine Quillfeather",
+        "email": "zq@company.com",
+        "department": "Research",
+    }
+    assert search_ids(client, "zephyr") == []
+
+    assert client.post("/employees", json=employee).status_code == 201
+    assert search_ids(client, "zephyr quill") == ["SRCH001"]
+    assert search_ids(client, "research") == ["SRCH001"]
+
+    assert client.delete("/employees/SRCH001").status_code == 200
+    assert search_ids(client, "zephyr") == []
+
+    # Bulk paths go through the same triggers
+    body = "employee_id,full_name,email,department\nSRCH002,Zephyrine Bulk,zb@company.com,IT\n"
+    client.post("/employees/import", content=body.encode(), headers={"Content-Type": "text/csv"})
+    assert search_ids(client, "zephyr") == ["SRCH002"]
+
+    client.post("/employees/offboard", json={"employee_ids": ["SRCH002"]})
+    assert search_ids(client, "zephyr") == []
+
+
+def test_fallback_is_a_substring_match(client, fallback):
+    term = "harma"
+    expected = {
+        emp["employee_id"] for emp in employees(client)
+        if any(term in emp[f].lower() for f in FIELDS)
+    }
+
+    assert expected
+    assert set(search_ids(client, term)) == expected
+    assert set(search_ids(client, term.upper())) == expected
+
+
+def test_fallback_matches_wildcards_literally(client, fallback):
+    assert search_ids(client, "%") == []
+    assert search_ids(client, "_") == []
+    assert search_ids(client, 'sharma"') == []
+
+
+def test_fallback_with_keyset_pages(client, fallback):
+    body = client.get("/employees", params={"search": "a", "limit": 5}).json()
+
+    assert len(body["items"]) == 5
+    assert [e["employee_id"] for e in body["items"]] == sorted(e["employee_id"] for e in body["items"])
+    assert body["next_cursor"] is not None
@@ -0,0 +1,27 @@
+# backend/tests/test_seed.py
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.core.seed_data import TOTAL_EMPLOYEES, seed_employees
+from app.models.employee import Employee
+
+
+def test_larger_seed_extends_the_dev_employees():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+
+    with Session(engine) as db:
+        assert seed_employees(db, total=TOTAL_EMPLOYEES) == TOTAL_EMPLOYEES
+        assert seed_employees(db, total=1000) == 1000 - TOTAL_EMPLOYEES
+
+        rows, ids, emails = db.execute(
+            select(
+                func.count(),
+                func.count(Employee.employee_id.distinct()),
+                func.count(Employee.email.distinct()),
+            )
+        ).one()
+        assert rows == ids == emails == 1000
+        assert db.get(Employee, 1).employee_id == "EMP001"
@@ -0,0 +1,19 @@
+# backend/tests/test_startup.py
+
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+# Heavy optional libraries, loaded by the first analytics or Parquet request
+LAZY = ["numpy", "pyarrow"]
+
+
+def test_app_import_leaves_heavy_libraries_unloaded():
+    probe = f"import sys, app.main; print([m for m in {LAZY!r} if m in sys.modules])"
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=BACKEND, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
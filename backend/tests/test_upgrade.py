@@ -0,0 +1,122 @@
+# backend/tests/test_upgrade.py
+
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+# Schema as the first release created it: text status, and employee
+# deletes that left attendance behind (foreign keys were never enforced)
+BASELINE_SCHEMA = """
+CREATE TABLE employees (
+    id INTEGER NOT NULL,
+    employee_id VARCHAR NOT NULL,
+    full_name VARCHAR NOT NULL,
+    email VARCHAR NOT NULL,
+    department VARCHAR NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_employees_employee_id ON employees (employee_id);
+CREATE INDEX ix_employees_id ON employees (id);
+CREATE TABLE attendance (
+    id INTEGER NOT NULL,
+    employee_id VARCHAR NOT NULL,
+    date DATE NOT NULL,
+    status VARCHAR NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT unique_employee_date UNIQUE (employee_id, date),
+    FOREIGN KEY(employee_id) REFERENCES employees (employee_id) ON DELETE CASCADE
+);
+CREATE INDEX ix_attendance_id ON attendance (id);
+CREATE INDEX ix_attendance_employee_id ON attendance (employee_id);
+"""
+
+EMPLOYEES = ["EMP001", "EMP002", "EMP003"]
+DELETED = ["EMP004", "EMP005"]
+DAYS = [f"2024-01-{d:02d}" for d in range(1, 11)]
+
+
+@pytest.fixture
+def baseline_db(tmp_path) -> Path:
+    path = tmp_path / "baseline.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.executemany(
+        "INSERT INTO employees (employee_id, full_name, email, department) VALUES (?, ?, ?, ?)",
+        [(e, f"Name {e}", f"{e.lower()}@company.com", "Engineering") for e in EMPLOYEES],
+    )
+    conn.executemany(
+        "INSERT INTO attendance (employee_id, date, status) VALUES (?, ?, ?)",
+        [
+            (e, day, "Present" if i % 3 else "Absent")
+            for e in EMPLOYEES + DELETED
+            for i, day in enumerate(DAYS)
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def cli(path: Path, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{path}"}
+    return subprocess.run(
+        [sys.executable, "-m", "app.cli", *args],
+        cwd=BACKEND, env=env, capture_output=True, text=True,
+    )
+
+
+def rows(path: Path, sql: str) -> list[tuple]:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def assert_upgraded(path: Path):
+    kept = len(EMPLOYEES) * len(DAYS)
+
+    assert rows(path, "SELECT count(*), min(typeof(status)) FROM attendance") == [(kept, "integer")]
+    assert rows(path, "SELECT name FROM sqlite_master WHERE name = 'attendance_legacy'") == []
+    assert rows(path, "SELECT count(*) FROM attendance WHERE employee_id IN ('EMP004', 'EMP005')") == [(0,)]
+    assert rows(path, "SELECT sum(total) FROM attendance_daily") == [(kept,)]
+    assert rows(path, "PRAGMA foreign_key_check") == []
+    assert "AUTOINCREMENT" in rows(path, "SELECT sql FROM sqlite_master WHERE name = 'attendance'")[0][0]
+
+    verify = cli(path, "verify-history")
+    assert verify.returncode == 0, verify.stderr
+
+
+def test_bootstrap_upgrades_baseline_with_orphans(baseline_db):
+    result = cli(baseline_db, "bootstrap")
+    assert result.returncode == 0, result.stderr
+    assert "Deleted 20 orphaned rows from attendance" in result.stderr
+
+    assert_upgraded(baseline_db)
+
+    # Every other command runs create_schema first; it must stay a no-op
+    compact = cli(baseline_db, "compact")
+    assert compact.returncode == 0, compact.stderr
+    assert_upgraded(baseline_db)
+
+
+def test_bootstrap_finishes_a_half_done_status_rebuild(baseline_db):
+    # What earlier versions left when the copy into the new table failed
+    conn = sqlite3.connect(baseline_db)
+    conn.execute("DROP INDEX ix_attendance_id")
+    conn.execute("DROP INDEX ix_attendance_employee_id")
+    conn.execute("ALTER TABLE attendance RENAME TO attendance_legacy")
+    conn.commit()
+    conn.close()
+
+    result = cli(baseline_db, "bootstrap")
+    assert result.returncode == 0, result.stderr
+    assert "Recovered 30 attendance rows from attendance_legacy" in result.stderr
+
+    assert_upgraded(baseline_db)